@@ -0,0 +1,3 @@
+"""
+Offline performance benchmarks of the elizur hot paths, see benchmarks/bench.py
+"""
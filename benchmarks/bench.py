@@ -0,0 +1,447 @@
+"""
+Offline benchmarks of the LifeTable, annuity certain, SOA parsing, expected
+present value and interest rate scenario hot paths.  Every benchmark is
+timed with timeit and the results can be stored as a JSON baseline and
+compared against later runs.
+
+Usage from the repository root:
+
+    python -m benchmarks.bench --save benchmarks/baseline.json
+    python -m benchmarks.bench --compare benchmarks/baseline.json
+    python -m benchmarks.bench --filter life_table.Ax --compare baseline.json
+"""
+
+import argparse
+import atexit
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import timeit
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+import elizur
+from elizur.life import (
+    chunked_expected_present_value,
+    cir,
+    effective_rates,
+    expected_present_value,
+    gross_premium,
+    hull_white,
+    lognormal,
+    net_premium_reserves,
+    vasicek,
+)
+from elizur.life.annuity import YieldCurve, annuity as annuity_certain
+from elizur.life.table import EXAMPLE_TABLE, LifeTable, simulate_lifetimes
+from elizur.life.util import read_soa_csv_mort_table, read_soa_csv_mort_tables
+
+FIXTURES = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "test",
+    "unit",
+    "life",
+    "util",
+)
+BATCH_SIZE = 10000
+INTEREST_RATES = (0.02, 0.03, 0.04, 0.05, 0.06, 0.07)
+
+BENCHMARKS: Dict[str, Callable[[], Callable[[], Any]]] = {}
+
+
+def benchmark(name: str) -> Callable:
+    """
+    Registers a benchmark.  The decorated function sets up the inputs and
+    returns the callable that is timed, so setup is excluded from the timing.
+
+    Args:
+        name: unique dotted name of the benchmark, used to filter and compare
+    """
+
+    def register(setup: Callable[[], Callable[[], Any]]) -> Callable:
+        if name in BENCHMARKS:
+            raise ValueError(f"Duplicate benchmark {name}!")
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def _batch(seed: int = 0) -> Dict[str, np.array]:
+    """
+    Returns:
+        Reproducible arrays of ages, interest rates and terms of BATCH_SIZE
+        policies
+    """
+    generator = np.random.default_rng(seed)
+    return {
+        "x": generator.integers(0, len(EXAMPLE_TABLE), BATCH_SIZE),
+        "i": generator.choice(INTEREST_RATES, BATCH_SIZE),
+        "n": generator.integers(1, 40, BATCH_SIZE),
+    }
+
+
+def _register_life_table_benchmarks() -> None:
+    commutation_functions = ("Dx", "Nx", "Sx", "Cx", "Mx", "Rx")
+    whole_life = ("Ax", "IAx", "ax", "ax_due") + commutation_functions
+    temporary = ("Axn", "IAxn", "axn", "axn_due")
+    for method in whole_life + temporary:
+        args = ("x", "i", "n") if method in temporary else ("x", "i")
+
+        @benchmark(f"life_table.{method}.scalar")
+        def scalar(method=method, args=args):
+            function = getattr(LifeTable(EXAMPLE_TABLE), method)
+            inputs = dict(x=35, i=0.05, n=20)
+            values = tuple(inputs[arg] for arg in args)
+            return lambda: function(*values)
+
+        @benchmark(f"life_table.{method}.batch")
+        def batch(method=method, args=args):
+            function = getattr(LifeTable(EXAMPLE_TABLE), method)
+            inputs = _batch()
+            values = tuple(inputs[arg] for arg in args)
+            return lambda: function(*values)
+
+    @benchmark("life_table.axn_due.curve.batch")
+    def curve_batch():
+        table = LifeTable(EXAMPLE_TABLE)
+        curve = YieldCurve(np.linspace(0.01, 0.05, 30))
+        inputs = _batch()
+        return lambda: table.axn_due(inputs["x"], curve, inputs["n"])
+
+    @benchmark("life_table.curve_columns.uncached")
+    def curve_columns():
+        table = LifeTable(EXAMPLE_TABLE, commutation_cache_size=0)
+        curve = YieldCurve(np.linspace(0.01, 0.05, 30))
+        return lambda: table.Ax(40, curve)
+
+    @benchmark("life_table.commutation_columns.uncached")
+    def commutation_columns():
+        table = LifeTable(EXAMPLE_TABLE, commutation_cache_size=0)
+        return lambda: table.commutation_columns(0.05)
+
+    @benchmark("life_table.simulate_lifetimes")
+    def simulation():
+        table = LifeTable(EXAMPLE_TABLE)
+        inputs = _batch()
+        return lambda: simulate_lifetimes(table, inputs["x"], size=(100, BATCH_SIZE))
+
+    @benchmark("reserve.net_premium_reserves.batch")
+    def reserves():
+        table = LifeTable(EXAMPLE_TABLE)
+        inputs = _batch()
+        return lambda: net_premium_reserves(
+            table, inputs["x"], inputs["i"], inputs["n"], "endowment"
+        )
+
+    @benchmark("premium.gross_premium.batch")
+    def premiums():
+        table = LifeTable(EXAMPLE_TABLE)
+        inputs = _batch()
+        return lambda: gross_premium(
+            table,
+            inputs["x"],
+            inputs["i"],
+            inputs["n"],
+            "endowment",
+            premium_years=10,
+            initial_expense=100.0,
+            maintenance_expense=10.0,
+            initial_commission=0.5,
+            renewal_commission=0.05,
+        )
+
+    @benchmark("life_table.construct")
+    def construct():
+        return lambda: LifeTable(EXAMPLE_TABLE)
+
+
+def _register_annuity_benchmarks() -> None:
+    functions = (
+        "annuity_pv",
+        "annuity_due_pv",
+        "annuity_fv",
+        "annuity_due_fv",
+        "increasing_annuity_pv",
+        "increasing_annuity_fv",
+        "increasing_annuity_due_pv",
+        "increasing_annuity_due_fv",
+        "decreasing_annuity_pv",
+        "decreasing_annuity_fv",
+        "decreasing_annuity_due_pv",
+        "decreasing_annuity_due_fv",
+    )
+    for name in functions:
+
+        @benchmark(f"annuity.{name}.scalar")
+        def scalar(name=name):
+            function = getattr(annuity_certain, name)
+            return lambda: function(20, 0.05)
+
+        @benchmark(f"annuity.{name}.batch")
+        def batch(name=name):
+            function = getattr(annuity_certain, name)
+            inputs = _batch()
+            return lambda: function(inputs["n"], inputs["i"])
+
+    @benchmark("annuity.geo_increasing_annuity_pv.scalar")
+    def geo_scalar():
+        return lambda: annuity_certain.geo_increasing_annuity_pv(20, 0.05, 0.02)
+
+    @benchmark("annuity.geo_increasing_annuity_pv.batch")
+    def geo_batch():
+        inputs = _batch()
+        # a third of the growth rates are zero and a third equal the rate
+        k = np.choose(
+            np.arange(BATCH_SIZE) % 3, (np.zeros(BATCH_SIZE), inputs["i"], 0.01)
+        )
+        return lambda: annuity_certain.geo_increasing_annuity_pv(
+            inputs["n"], inputs["i"], k
+        )
+
+
+def _register_soa_benchmarks() -> None:
+    @benchmark("soa.read_mort_table")
+    def read_table():
+        path = os.path.join(FIXTURES, "mortality_table_1.csv")
+        return lambda: read_soa_csv_mort_table(path)
+
+    @benchmark("soa.read_select_mort_tables")
+    def read_select_tables():
+        path = os.path.join(FIXTURES, "select_mortality_table.csv")
+        return lambda: read_soa_csv_mort_tables(path)
+
+    @benchmark("soa.read_mort_table.cached")
+    def read_cached_table():
+        directory = tempfile.mkdtemp()
+        atexit.register(shutil.rmtree, directory, ignore_errors=True)
+        path = shutil.copy(os.path.join(FIXTURES, "mortality_table_1.csv"), directory)
+        read_soa_csv_mort_table(path, cache=True)
+        return lambda: read_soa_csv_mort_table(path, cache=True)
+
+
+def _register_epv_benchmarks() -> None:
+    periods = 100
+    generator = np.random.default_rng(0)
+    shape = (BATCH_SIZE, periods)
+
+    @benchmark("epv.expected_present_value.single")
+    def single():
+        cash_flows = np.ones(periods)
+        probabilities = np.linspace(1, 0, periods)
+        rates = np.full(periods, 0.05)
+        return lambda: expected_present_value(cash_flows, probabilities, rates)
+
+    @benchmark("epv.expected_present_value.batch")
+    def batch():
+        cash_flows = generator.uniform(0, 1000, shape)
+        probabilities = np.cumprod(generator.uniform(0.95, 1, shape), axis=1)
+        rates = np.full(periods, 0.05)
+        return lambda: expected_present_value(cash_flows, probabilities, rates)
+
+    @benchmark("epv.chunked_expected_present_value.batch")
+    def chunked():
+        cash_flows = generator.uniform(0, 1000, shape)
+        probabilities = np.cumprod(generator.uniform(0.95, 1, shape), axis=1)
+        rates = np.full(periods, 0.05)
+        return lambda: chunked_expected_present_value(
+            cash_flows, probabilities, rates, chunk_size=1000
+        )
+
+
+def _register_scenario_benchmarks() -> None:
+    scenarios, periods = BATCH_SIZE, 600
+    generators = {
+        "vasicek": lambda: vasicek(0.03, 0.1, 0.04, 0.01, scenarios, periods, seed=1),
+        "cir": lambda: cir(0.03, 0.1, 0.04, 0.05, scenarios, periods, seed=1),
+        "hull_white": lambda: hull_white(0.03, 0.1, 0.01, scenarios, periods, seed=1),
+        "lognormal": lambda: lognormal(0.03, 0.0, 0.2, scenarios, periods, seed=1),
+    }
+    for name, generate in generators.items():
+
+        @benchmark(f"scenario.{name}")
+        def generation(generate=generate):
+            return generate
+
+    @benchmark("scenario.vasicek.epv")
+    def discounting():
+        cash_flows = np.ones(periods)
+        probabilities = np.linspace(1, 0, periods)
+
+        def generate_and_discount():
+            rates = generators["vasicek"]()
+            effective_rates(rates, out=rates)
+            return expected_present_value(cash_flows, probabilities, rates)
+
+        return generate_and_discount
+
+
+_register_life_table_benchmarks()
+_register_annuity_benchmarks()
+_register_soa_benchmarks()
+_register_epv_benchmarks()
+_register_scenario_benchmarks()
+
+
+def run(
+    names: List[str], repeat: int = 5, min_time: float = 0.2
+) -> Dict[str, Dict[str, float]]:
+    """
+    Args:
+        names: names of the benchmarks to run
+        repeat: number of timing repetitions of each benchmark
+        min_time: minimum number of seconds of each repetition, used to pick
+                  the number of calls per repetition
+
+    Returns:
+        The best and median seconds per call of each benchmark and the
+        number of calls per repetition
+    """
+    results = {}
+    for name in names:
+        timer = timeit.Timer(BENCHMARKS[name]())
+        number, elapsed = timer.autorange()
+        if elapsed < min_time:
+            number = max(int(number * min_time / max(elapsed, 1e-9)), 1)
+        timings = [
+            elapsed / number for elapsed in timer.repeat(repeat=repeat, number=number)
+        ]
+        results[name] = {
+            "best": min(timings),
+            "median": statistics.median(timings),
+            "number": number,
+        }
+    return results
+
+
+def environment() -> Dict[str, str]:
+    """
+    Returns:
+        The versions and machine the benchmarks ran on, stored with a
+        baseline since timings are only comparable on the same machine
+    """
+    return {
+        "elizur": elizur.VERSION,
+        "numpy": np.__version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "system": platform.system(),
+    }
+
+
+def save(path: str, results: Dict[str, Dict[str, float]]) -> None:
+    """
+    Writes the results and the environment to a JSON baseline, updating the
+    results of any benchmarks already in the baseline
+    """
+    baseline = load(path) if os.path.exists(path) else {"results": {}}
+    baseline["environment"] = environment()
+    baseline["results"].update(results)
+    with open(path, "w", encoding="utf-8") as baseline_file:
+        json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+
+
+def load(path: str) -> Dict:
+    with open(path, encoding="utf-8") as baseline_file:
+        return json.load(baseline_file)
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.2f} ns"
+
+
+def report(
+    results: Dict[str, Dict[str, float]],
+    baseline: Optional[Dict] = None,
+    max_slowdown: float = 0.1,
+) -> List[str]:
+    """
+    Prints the best time per call of each benchmark and, given a baseline,
+    the ratio of the current time to the baseline time.
+
+    Args:
+        results: the results of run
+        baseline: a baseline read with load
+        max_slowdown: ratio above 1 at which a benchmark is a regression
+
+    Returns:
+        The names of the benchmarks that regressed
+    """
+    baseline_results = (baseline or {}).get("results", {})
+    if baseline and baseline.get("environment") != environment():
+        print(
+            "Warning: the baseline was recorded in a different environment "
+            f"{baseline.get('environment')}",
+            file=sys.stderr,
+        )
+    width = max(len(name) for name in results)
+    print(f"{'benchmark':<{width}}  {'current':>11}  {'baseline':>11}  {'ratio':>6}")
+    regressions = []
+    for name, result in results.items():
+        line = f"{name:<{width}}  {_format_time(result['best'])}"
+        if name in baseline_results:
+            ratio = result["best"] / baseline_results[name]["best"]
+            status = ""
+            if ratio > 1 + max_slowdown:
+                status = "  slower"
+                regressions.append(name)
+            elif ratio < 1 - max_slowdown:
+                status = "  faster"
+            line += (
+                f"  {_format_time(baseline_results[name]['best'])}  {ratio:6.2f}"
+                f"{status}"
+            )
+        print(line)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--filter", default="", help="run benchmarks containing")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--save", metavar="PATH", help="store results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare to a baseline")
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=0.1,
+        help="exit with 1 when a benchmark is slower than the baseline by more",
+    )
+    args = parser.parse_args(argv)
+    names = [name for name in BENCHMARKS if args.filter in name]
+    if args.list:
+        print("\n".join(names))
+        return 0
+    if not names:
+        parser.error(f"No benchmarks match {args.filter}!")
+    baseline = None
+    if args.compare:
+        try:
+            baseline = load(args.compare)
+        except FileNotFoundError:
+            print(
+                f"No baseline at {args.compare}! Run 'make bench-save' or "
+                f"'python -m benchmarks.bench --save {args.compare}' first.",
+                file=sys.stderr,
+            )
+            return 2
+    results = run(names, repeat=args.repeat, min_time=args.min_time)
+    regressions = report(results, baseline, max_slowdown=args.max_slowdown)
+    if args.save:
+        save(args.save, results)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,31 @@
 # flake8: noqa: E401
 
-from elizur.life.epv import InvalidEPVInputs, expected_present_value
+from elizur.life.epv import (
+    InvalidEPVInputs,
+    expected_present_value,
+    expected_present_value_blocks,
+    chunked_expected_present_value,
+)
+from elizur.life.valuation import (
+    BENEFITS,
+    InvalidPortfolio,
+    ValuationResult,
+    value_portfolio,
+)
+from elizur.life.scenario import (
+    InvalidScenarioInputs,
+    vasicek,
+    cir,
+    hull_white,
+    lognormal,
+    effective_rates,
+)
+from elizur.life.product import (
+    WHOLE_LIFE,
+    TERM,
+    ENDOWMENT,
+    PRODUCTS,
+    InvalidProduct,
+)
+from elizur.life.premium import net_premium, gross_premium
+from elizur.life.reserve import net_premium_reserve, net_premium_reserves
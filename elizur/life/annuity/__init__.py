@@ -20,3 +20,4 @@ from elizur.life.annuity.annuity import (
     decreasing_annuity_due_fv,
     geo_increasing_annuity_pv,
 )
+from elizur.life.annuity.curve import YieldCurve, InvalidCurve
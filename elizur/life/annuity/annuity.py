@@ -1,4 +1,3 @@
-import numbers
 from typing import Iterable, Union
 
 import numpy as np
@@ -251,22 +250,18 @@ def geo_increasing_annuity_pv(
     Returns:
         Present value of a geometrically increasing annuity of
         n years with an interest rate of i and payment growth rate
-        of k.
-    """
-    result = []
-    n = list(n) if not isinstance(n, numbers.Number) else [n]
-    i = list(i) if not isinstance(i, numbers.Number) else [i]
-    k = list(k) if not isinstance(k, numbers.Number) else [k]
-    for index, growth_rate in enumerate(k):
-        if growth_rate == 0:
-            result.append(annuity_pv(n, i))
-        elif growth_rate == i[index]:
-            result.append(np.multiply(n, discount_factor(i)))
-        else:
-            result.append(
-                np.divide(
-                    1 - np.power(np.divide(np.add(1, k), np.add(1, i)), n),
-                    np.subtract(i, k),
-                )
-            )
-    return np.array(result) if len(result) > 1 else result[0]
+        of k.  Growth rates of zero and growth rates equal to the
+        interest rate are handled element-wise with masks.
+    """
+    n, i, k = np.broadcast_arrays(n, i, k)
+    result = np.array(np.multiply(n, discount_factor(i)), dtype=float)
+    level = np.equal(k, 0) & ~np.equal(k, i)
+    np.divide(1 - np.power(discount_factor(i), n), i, out=result, where=level)
+    growing = ~np.equal(k, 0) & ~np.equal(k, i)
+    np.divide(
+        1 - np.power(np.divide(np.add(1, k), np.add(1, i)), n),
+        np.subtract(i, k),
+        out=result,
+        where=growing,
+    )
+    return result[()]
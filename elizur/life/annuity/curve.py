@@ -0,0 +1,135 @@
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+
+class InvalidCurve(Exception):
+    """
+    Custom exception raised for invalid yield curves
+    """
+
+
+class YieldCurve:
+    """
+    An immutable term structure of annual effective interest rates.  The
+    discount factors of every whole year of the curve are computed once at
+    construction, and curves are hashable so the commutation columns of a
+    LifeTable can be cached per curve like they are per flat rate.
+
+    Terms beyond the last rate of the curve are discounted with the last
+    forward rate, and fractional terms assume a constant forward rate
+    within each year.
+
+    Args:
+        rates: annual effective rates in sequential order of term
+        kind: 'spot' when rates[t - 1] is the spot rate of a term of t years
+              or 'forward' when rates[t - 1] is the one year forward rate
+              from year t - 1 to year t
+
+    Example:
+        curve = YieldCurve((0.02, 0.025, 0.03, 0.032, 0.033))
+        life_table.axn_due(40, curve, 20)
+    """
+
+    __slots__ = (
+        "spot_rates",
+        "forward_rates",
+        "_discount_factors",
+        "_flat_rate",
+        "_hash",
+    )
+
+    def __init__(self, rates: Union[Iterable, np.array], kind: str = "spot"):
+        rates = np.array(rates, dtype=float, ndmin=1)
+        if rates.ndim != 1 or rates.size == 0 or not np.all(rates > -1):
+            raise InvalidCurve(
+                "A yield curve must be a non-empty sequence of rates above -1!"
+            )
+        terms = np.arange(1, rates.size + 1)
+        if kind == "spot":
+            spot_rates = rates
+            discount_factors = np.power(1 + rates, -terms)
+            forward_rates = np.append(
+                rates[:1], discount_factors[:-1] / discount_factors[1:] - 1
+            )
+        elif kind == "forward":
+            forward_rates = rates
+            discount_factors = np.cumprod(1 / (1 + rates))
+            spot_rates = np.power(discount_factors, -1 / terms) - 1
+        else:
+            raise InvalidCurve(f"Unknown rate kind {kind}! Use 'spot' or 'forward'.")
+        object.__setattr__(
+            self, "_discount_factors", np.insert(discount_factors, 0, 1.0)
+        )
+        object.__setattr__(self, "forward_rates", forward_rates)
+        object.__setattr__(self, "spot_rates", spot_rates)
+        for column in (self._discount_factors, self.forward_rates, self.spot_rates):
+            column.setflags(write=False)
+        # flat spot curves have forward rates equal up to rounding
+        flat = np.allclose(
+            self.forward_rates, self.forward_rates[0], rtol=1e-12, atol=0
+        )
+        object.__setattr__(
+            self, "_flat_rate", float(self.forward_rates[0]) if flat else None
+        )
+        object.__setattr__(self, "_hash", hash(self.forward_rates.tobytes()))
+
+    @classmethod
+    def flat(cls, i: float) -> "YieldCurve":
+        """
+        Args:
+            i: interest rate
+
+        Returns:
+            A curve with the same rate for every term
+        """
+        return cls((i,), kind="forward")
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"YieldCurve attribute '{name}' is read-only")
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, YieldCurve):
+            return NotImplemented
+        return np.array_equal(self.forward_rates, other.forward_rates)
+
+    def __repr__(self) -> str:
+        return f"YieldCurve({self.spot_rates.tolist()})"
+
+    def __getstate__(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            if isinstance(value, np.ndarray):
+                value.setflags(write=False)
+            object.__setattr__(self, name, value)
+
+    @property
+    def flat_rate(self) -> Optional[float]:
+        """
+        Returns:
+            The rate of every term when the curve is flat, otherwise None
+        """
+        return self._flat_rate
+
+    def discount_factor(
+        self, t: Union[float, Iterable, np.array]
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            t: term in years or an array of terms
+
+        Returns:
+            The present value of 1 paid at each term
+        """
+        t = np.asarray(t, dtype=float)
+        if np.any(t < 0):
+            raise InvalidCurve("Terms must not be negative!")
+        last = self.forward_rates.size
+        years = np.minimum(np.floor(t).astype(int), last)
+        forward_rates = self.forward_rates[np.minimum(years, last - 1)]
+        return (self._discount_factors[years] * (1 + forward_rates) ** (years - t))[()]
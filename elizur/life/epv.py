@@ -1,4 +1,4 @@
-from typing import Iterable, Union
+from typing import Iterable, Iterator, Optional, Tuple, Union
 
 import numpy as np
 
@@ -30,7 +30,8 @@ def expected_present_value(
                         period, e.g., (i0to1, i1to2, ..., in-1ton)
 
     Returns:
-        The expected present value
+        The expected present value, or an array of expected present values
+        with the broadcast shape of the inputs without the time axis
 
     Example:
         Given the probabilities: 1p0 = 0.98, 2p1=0.94, 3p2=0.91
@@ -41,9 +42,12 @@ def expected_present_value(
 
         The two methods of calculating the present value of an annuity are the same
 
-        Additionally a two-dimensional arrays of inputs can be provided to perform
-        multiple expected present values at once.  The work flows below produce the
-        same results:
+        Additionally arrays with any number of leading batch dimensions, e.g.
+        (scenarios x policies x time), can be provided to perform multiple
+        expected present values at once.  The last axis is always time and the
+        inputs are broadcast against each other, so a shared rate curve or a
+        shared probability vector can be combined with many rows of cash flows
+        without copying it.  The work flows below produce the same results:
 
         expected_present_value((1, 1, 1), (0.98, 0.94, 0.91), (0.07, 0.07, 0.07))
 
@@ -69,37 +73,102 @@ def expected_present_value(
             ])
         )
     """
-    cash_flows = np.array(cash_flows)
-    probabilities = np.array(probabilities)
-    interest_rates = np.array(interest_rates)
+    cash_flows = np.asarray(cash_flows)
+    probabilities = np.asarray(probabilities)
+    interest_rates = np.asarray(interest_rates)
 
-    if not cash_flows.size == probabilities.size == interest_rates.size:
+    try:
+        np.broadcast_shapes(cash_flows.shape, probabilities.shape, interest_rates.shape)
+    except ValueError as error:
         raise InvalidEPVInputs(
-            "The shape of the inputs do not match! The cash "
+            "The shape of the inputs do not broadcast! The cash "
             f"flow shape is {cash_flows.shape}, the probability "
             f"shape is {probabilities.shape}, "
             f"the interest rate shape is {interest_rates.shape}!"
-        )
-    if cash_flows.ndim > 2 or probabilities.ndim > 2 or interest_rates.ndim > 2:
-        raise InvalidEPVInputs(
-            "The dimensions of the inputs are too high! The cash "
-            f"flow number of dimensions is {cash_flows.ndim}, the probability "
-            f"number of dimensions is {probabilities.ndim}, "
-            f"the interest rate number of dimensions is {interest_rates.ndim}! "
-            "The number of dimensions for each input must be less than 3."
-        )
+        ) from error
+
+    cumulative_product = np.nancumprod(discount_factor(interest_rates), axis=-1)
+    return np.nansum(cash_flows * probabilities * cumulative_product, axis=-1)
+
+
+def expected_present_value_blocks(
+    blocks: Iterable[
+        Tuple[
+            Union[Iterable, np.ndarray],
+            Union[Iterable, np.ndarray],
+            Union[Iterable, np.ndarray],
+        ]
+    ],
+) -> Iterator[Union[float, np.ndarray]]:
+    """
+    Streams expected present values over blocks of rows so that only one
+    block is held in memory at a time, e.g. blocks read from a policy file
+    by a generator.
 
-    discount_factors = discount_factor(interest_rates)
-    if interest_rates.ndim == 1:
-        cumulative_product = np.nancumprod(discount_factors)
-        epv = np.nansum(
-            np.multiply(np.multiply(cash_flows, probabilities), cumulative_product)
+    Args:
+        blocks: iterable of (cash_flows, probabilities, interest_rates)
+                tuples accepted by expected_present_value
+
+    Returns:
+        A generator of the expected present values of each block
+
+    Example:
+        total = sum(
+            epvs.sum() for epvs in expected_present_value_blocks(read_blocks())
         )
-    else:
-        cumulative_product = np.apply_along_axis(np.nancumprod, 1, discount_factors)
-        epv = np.apply_along_axis(
-            np.nansum,
-            1,
-            np.multiply(np.multiply(cash_flows, probabilities), cumulative_product),
+    """
+    for cash_flows, probabilities, interest_rates in blocks:
+        yield expected_present_value(cash_flows, probabilities, interest_rates)
+
+
+def chunked_expected_present_value(
+    cash_flows: Union[Iterable, np.ndarray],
+    probabilities: Union[Iterable, np.ndarray],
+    interest_rates: Union[Iterable, np.ndarray],
+    chunk_size: int = 10000,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Calculates expected present values in chunks of rows along the first
+    axis, bounding the memory used by intermediate products.  This is useful
+    for np.memmap inputs that are larger than memory, since only one chunk
+    of each input is read at a time.  Inputs without the leading row axis,
+    e.g. a shared rate curve, are broadcast against every chunk.
+
+    Args:
+        cash_flows: payouts with a leading row axis and time as the last axis
+        probabilities: probabilities of the cash flows occuring
+        interest_rates: interest rates to use for discounting
+        chunk_size: number of rows valued at once
+        out: optional preallocated array, e.g. an np.memmap, with the shape
+             of the result to write the expected present values to
+
+    Returns:
+        The expected present value of each row
+    """
+    inputs = [np.asarray(arg) for arg in (cash_flows, probabilities, interest_rates)]
+    try:
+        shape = np.broadcast_shapes(*(arg.shape for arg in inputs))
+    except ValueError as error:
+        raise InvalidEPVInputs(
+            "The shape of the inputs do not broadcast! The input shapes are "
+            f"{', '.join(str(arg.shape) for arg in inputs)}!"
+        ) from error
+    if len(shape) < 2:
+        raise InvalidEPVInputs(
+            "Chunked expected present values require inputs with at least "
+            "two dimensions, rows and time!"
         )
-    return epv
+    if chunk_size <= 0:
+        raise InvalidEPVInputs("The chunk size must be greater than 0!")
+    if out is None:
+        out = np.empty(shape[:-1])
+    rows = shape[0]
+    for start in range(0, rows, chunk_size):
+        stop = min(start + chunk_size, rows)
+        chunk = [
+            arg[start:stop] if arg.ndim == len(shape) and arg.shape[0] > 1 else arg
+            for arg in inputs
+        ]
+        out[start:stop] = expected_present_value(*chunk)
+    return out
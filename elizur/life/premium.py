@@ -0,0 +1,115 @@
+from typing import Iterable, Union
+
+import numpy as np
+
+from elizur.life.annuity import YieldCurve
+from elizur.life.product import (
+    WHOLE_LIFE,
+    InvalidProduct,
+    prospective_values,
+    validate_product,
+)
+from elizur.life.table import LifeTable
+from elizur.life.util import validate_age
+
+
+@validate_age
+def net_premium(
+    table: LifeTable,
+    x: Union[int, Iterable, np.array],
+    i: Union[float, Iterable, np.array, YieldCurve],
+    n: Union[None, int, Iterable, np.array] = None,
+    product: str = WHOLE_LIFE,
+    amount: Union[float, Iterable, np.array] = 1.0,
+    premium_years: Union[None, int, Iterable, np.array] = None,
+) -> Union[float, np.array]:
+    # pylint: disable=too-many-arguments
+    """
+    Net level annual premium payable at the start of each premium paying
+    year, which by the equivalence principle is the actuarial present value
+    of the benefits over the actuarial present value of a premium of 1.
+
+    Args:
+        table: LifeTable of the insured lives
+        x: issue age
+        i: interest rate or yield curve
+        n: term of the coverage in years, ignored by whole life
+        product: one of PRODUCTS
+        amount: benefit amount
+        premium_years: number of premium paying years of limited pay
+                       products, defaults to the whole coverage
+
+    Returns:
+        The net premium of each policy
+
+    Example:
+        net_premium(life_table, (35, 45), 0.04, product="whole_life", premium_years=20)
+    """
+    validate_product(product, n, premium_years)
+    benefits, _, premiums, _ = prospective_values(
+        table, x, 0, i, n, product, premium_years
+    )
+    return np.multiply(amount, benefits / premiums)[()]
+
+
+@validate_age
+def gross_premium(
+    table: LifeTable,
+    x: Union[int, Iterable, np.array],
+    i: Union[float, Iterable, np.array, YieldCurve],
+    n: Union[None, int, Iterable, np.array] = None,
+    product: str = WHOLE_LIFE,
+    amount: Union[float, Iterable, np.array] = 1.0,
+    premium_years: Union[None, int, Iterable, np.array] = None,
+    initial_expense: Union[float, Iterable, np.array] = 0.0,
+    maintenance_expense: Union[float, Iterable, np.array] = 0.0,
+    initial_commission: Union[float, Iterable, np.array] = 0.0,
+    renewal_commission: Union[float, Iterable, np.array] = 0.0,
+) -> Union[float, np.array]:
+    # pylint: disable=too-many-arguments,too-many-locals
+    """
+    Gross level annual premium payable at the start of each premium paying
+    year.  By the equivalence principle the actuarial present value of the
+    gross premiums equals the actuarial present value of the benefits and
+    expenses,
+
+    G a_k = amount A + E0 + e a_n + c0 G + cr G (a_k - 1),
+
+    where a_k and a_n are the annuities due of the premium paying years and
+    of the coverage.
+
+    Args:
+        table: LifeTable of the insured lives
+        x: issue age
+        i: interest rate or yield curve
+        n: term of the coverage in years, ignored by whole life
+        product: one of PRODUCTS
+        amount: benefit amount
+        premium_years: number of premium paying years of limited pay
+                       products, defaults to the whole coverage
+        initial_expense: expense per policy at issue (E0)
+        maintenance_expense: expense per policy at the start of each year of
+                             coverage (e)
+        initial_commission: share of the first premium paid as expenses (c0)
+        renewal_commission: share of each later premium paid as expenses (cr)
+
+    Returns:
+        The gross premium of each policy
+    """
+    validate_product(product, n, premium_years)
+    if np.any(np.greater_equal(renewal_commission, 1)) or np.any(
+        np.greater_equal(initial_commission, 1)
+    ):
+        raise InvalidProduct("Commissions must be less than the premium!")
+    benefits, coverage, premiums, Dxs = prospective_values(
+        table, x, 0, i, n, product, premium_years
+    )
+    expenses = (
+        np.multiply(amount, benefits)
+        + np.multiply(initial_expense, Dxs)
+        + np.multiply(maintenance_expense, coverage)
+    )
+    loaded_premiums = np.multiply(np.subtract(1, renewal_commission), premiums) - (
+        np.subtract(initial_commission, renewal_commission) * Dxs
+    )
+    return (expenses / loaded_premiums)[()]
@@ -0,0 +1,99 @@
+from typing import Iterable, Tuple, Union
+
+import numpy as np
+
+from elizur.life.annuity import YieldCurve
+from elizur.life.table import LifeTable
+from elizur.life.util import InvalidInterval
+
+WHOLE_LIFE = "whole_life"
+TERM = "term"
+ENDOWMENT = "endowment"
+PRODUCTS = (WHOLE_LIFE, TERM, ENDOWMENT)
+
+
+class InvalidProduct(Exception):
+    """
+    Custom exception raised for unknown or incompletely specified products
+    """
+
+
+def validate_product(
+    product: str,
+    n: Union[None, int, Iterable, np.array],
+    premium_years: Union[None, int, Iterable, np.array] = None,
+) -> None:
+    """
+    Checks that the product is one of PRODUCTS with a positive term, when it
+    has one, and positive premium paying years.
+
+    Args:
+        product: one of PRODUCTS
+        n: term of the coverage in years, ignored by whole life
+        premium_years: number of premium paying years of limited pay
+                       products
+    """
+    if product not in PRODUCTS:
+        raise InvalidProduct(
+            f"Unknown product {product}! The product must be one of {PRODUCTS}."
+        )
+    if product != WHOLE_LIFE:
+        if n is None:
+            raise InvalidProduct(f"The {product} product requires a term n!")
+        if np.any(np.less_equal(n, 0)):
+            raise InvalidInterval("Interval must be greater than 0!")
+    if premium_years is not None and np.any(np.less_equal(premium_years, 0)):
+        raise InvalidInterval("Premium paying years must be greater than 0!")
+
+
+def prospective_values(
+    table: LifeTable,
+    x: Union[int, Iterable, np.array],
+    t: Union[int, Iterable, np.array],
+    i: Union[float, Iterable, np.array, YieldCurve],
+    n: Union[None, int, Iterable, np.array],
+    product: str,
+    premium_years: Union[None, int, Iterable, np.array] = None,
+) -> Tuple[np.array, np.array, np.array, np.array]:
+    # pylint: disable=too-many-arguments
+    """
+    Values the benefits, an annuity due of 1 per year for the rest of the
+    coverage, and a premium of 1 per year for the rest of the premium paying
+    years from duration t with the commutation columns of the table, so
+    every issue age and duration is a lookup into the same cached columns.
+    A yield curve is applied from issue, i.e. the columns of issue age x
+    discount the later durations with the forward rates of the curve.
+
+    Args:
+        table: LifeTable of the insured lives
+        x: issue age
+        t: duration in years since issue
+        i: interest rate or yield curve
+        n: term of the coverage in years, ignored by whole life
+        product: one of PRODUCTS
+        premium_years: number of premium paying years of limited pay
+                       products, defaults to the whole coverage
+
+    Returns:
+        The benefits, coverage annuity due, and premium annuity due
+        remaining at duration t, each multiplied by the Dx of the attained
+        age, and the Dx of the attained age
+    """
+    c, r = table.commutations(i, x)
+    end = np.minimum(
+        table.table_size if product == WHOLE_LIFE else np.add(x, n), table.table_size
+    )
+    premium_end = (
+        end if premium_years is None else np.minimum(np.add(x, premium_years), end)
+    )
+    start = np.minimum(np.add(x, t), end)
+    premium_start = np.minimum(start, premium_end)
+    benefits = c.Mxs[r, start] - c.Mxs[r, end]
+    if product == ENDOWMENT:
+        benefits = benefits + c.Dxs[r, end]
+    return (
+        benefits,
+        c.Nxs[r, start] - c.Nxs[r, end],
+        c.Nxs[r, premium_start] - c.Nxs[r, premium_end],
+        c.Dxs[r, start],
+    )
@@ -0,0 +1,120 @@
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+from elizur.life.annuity import YieldCurve
+from elizur.life.product import WHOLE_LIFE, prospective_values, validate_product
+from elizur.life.table import LifeTable
+from elizur.life.util import validate_age, validate_duration
+
+
+@validate_age
+@validate_duration
+def net_premium_reserve(
+    table: LifeTable,
+    x: Union[int, Iterable, np.array],
+    t: Union[int, Iterable, np.array],
+    i: Union[float, Iterable, np.array, YieldCurve],
+    n: Union[None, int, Iterable, np.array] = None,
+    product: str = WHOLE_LIFE,
+    amount: Union[float, Iterable, np.array] = 1.0,
+    premium_years: Union[None, int, Iterable, np.array] = None,
+) -> Union[float, np.array]:
+    # pylint: disable=too-many-arguments
+    """
+    Prospective net premium reserve at the end of policy year t of a policy
+    with level annual net premiums P payable for k premium paying years.  The
+    reserve is the actuarial present value of the remaining benefits less
+    the remaining net premiums,
+
+    tV = (Mx+t - Mx+n + Dx+n for endowments) / Dx+t - P (Nx+t - Nx+k) / Dx+t,
+
+    which is the solution of the Fackler recursion
+    (tV + P)(1 + i) = qx+t + px+t t+1V, with no premium after the premium
+    paying years, and the boundary value at the end of the coverage.
+    Reserves are 0 after the coverage ends, except for the maturity value of
+    1 of an endowment at duration n.
+
+    Args:
+        table: LifeTable of the insured life
+        x: issue age
+        t: duration in years since issue
+        i: interest rate or yield curve
+        n: term of the coverage in years, ignored by whole life
+        product: one of PRODUCTS
+        amount: benefit amount
+        premium_years: number of premium paying years of limited pay
+                       products, defaults to the whole coverage
+
+    Returns:
+        The reserve of each policy and duration
+    """
+    validate_product(product, n, premium_years)
+    benefits, _, annuities, _ = prospective_values(
+        table, x, 0, i, n, product, premium_years
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        premiums = benefits / annuities
+        benefits, _, annuities, Dxs = prospective_values(
+            table, x, t, i, n, product, premium_years
+        )
+        reserves = (benefits - premiums * annuities) / Dxs
+    in_force = Dxs > 0
+    if product != WHOLE_LIFE:
+        in_force = in_force & np.less_equal(t, n)
+    return np.multiply(amount, np.where(in_force, reserves, 0.0))[()]
+
+
+@validate_age
+def net_premium_reserves(
+    table: LifeTable,
+    x: Union[int, Iterable, np.array],
+    i: Union[float, Iterable, np.array, YieldCurve],
+    n: Union[None, int, Iterable, np.array] = None,
+    product: str = WHOLE_LIFE,
+    amount: Union[float, Iterable, np.array] = 1.0,
+    premium_years: Union[None, int, Iterable, np.array] = None,
+    durations: Optional[int] = None,
+) -> np.array:
+    # pylint: disable=too-many-arguments
+    """
+    Prospective net premium reserves of policies at every duration in one
+    pass, see net_premium_reserve.
+
+    Args:
+        table: LifeTable of the insured lives
+        x: issue age or an array of issue ages
+        i: interest rate, an array of interest rates, or a yield curve
+        n: term or an array of terms, ignored by whole life
+        product: one of PRODUCTS
+        amount: benefit amount or an array of benefit amounts
+        premium_years: number of premium paying years of limited pay
+                       products, defaults to the whole coverage
+        durations: number of durations after issue, defaults to the longest
+                   coverage of the policies
+
+    Returns:
+        An array of the broadcast shape of the inputs with a trailing axis
+        of the reserves at durations 0, 1, ..., durations
+
+    Example:
+        reserves = net_premium_reserves(life_table, (35, 45), 0.04, 20, "endowment")
+        reserves[:, 10]
+    """
+    validate_product(product, n, premium_years)
+    if durations is None:
+        durations = (
+            table.table_size - int(np.min(x))
+            if product == WHOLE_LIFE
+            else int(np.max(n))
+        )
+    x, amount = (np.expand_dims(value, -1) for value in (x, amount))
+    if not isinstance(i, YieldCurve):
+        i = np.expand_dims(i, -1)
+    n, premium_years = (
+        None if value is None else np.expand_dims(value, -1)
+        for value in (n, premium_years)
+    )
+    return net_premium_reserve(
+        table, x, np.arange(durations + 1), i, n, product, amount, premium_years
+    )
@@ -0,0 +1,264 @@
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+Seed = Union[None, int, np.random.SeedSequence, np.random.Generator]
+
+
+class InvalidScenarioInputs(Exception):
+    """
+    Custom exception raised for invalid interest rate scenario inputs.
+    """
+
+
+def _validate(
+    scenarios: int, periods: int, dt: float, sigma: float, a: Optional[float] = None
+) -> None:
+    # pylint: disable=too-many-arguments
+    """
+    Checks the inputs shared by the scenario generators.
+
+    Args:
+        scenarios: number of scenarios
+        periods: number of periods in each scenario
+        dt: length of a period in years
+        sigma: volatility of the process
+        a: speed of mean reversion of mean reverting processes
+    """
+    if scenarios < 1 or periods < 1:
+        raise InvalidScenarioInputs(
+            "The number of scenarios and periods must be at least 1!"
+        )
+    if dt <= 0:
+        raise InvalidScenarioInputs("The period length dt must be positive!")
+    if sigma < 0:
+        raise InvalidScenarioInputs("The volatility sigma must not be negative!")
+    if a is not None and a <= 0:
+        raise InvalidScenarioInputs("The mean reversion speed a must be positive!")
+
+
+def _ornstein_uhlenbeck(
+    x0: float,
+    a: float,
+    mean: float,
+    sigma: float,
+    scenarios: int,
+    periods: int,
+    dt: float,
+    generator: np.random.Generator,
+) -> np.ndarray:
+    # pylint: disable=too-many-arguments
+    """
+    Samples an Ornstein-Uhlenbeck process dx = a (mean - x) dt + sigma dW
+    with its exact Gaussian transition.  The standard normal draws are
+    generated in one call and overwritten in place with the process one
+    contiguous row of scenarios per period, then transposed once into C
+    contiguous scenarios.
+
+    Returns:
+        A C contiguous (scenarios x periods) array whose first column is x0
+    """
+    decay = np.exp(-a * dt)
+    volatility = sigma * np.sqrt((1 - decay**2) / (2 * a))
+    shift = mean * (1 - decay)
+    paths = generator.standard_normal((periods, scenarios))
+    paths[0] = x0
+    for period in range(1, periods):
+        row = paths[period]
+        row *= volatility
+        row += shift
+        row += decay * paths[period - 1]
+    return np.ascontiguousarray(paths.T)
+
+
+def vasicek(
+    r0: float,
+    a: float,
+    b: float,
+    sigma: float,
+    scenarios: int,
+    periods: int,
+    dt: float = 1 / 12,
+    seed: Seed = None,
+) -> np.ndarray:
+    # pylint: disable=too-many-arguments
+    """
+    Args:
+        r0: initial annualized short rate
+        a: speed of mean reversion
+        b: long term mean of the short rate
+        sigma: annualized volatility of the short rate
+        scenarios: number of scenarios
+        periods: number of periods in each scenario
+        dt: length of a period in years, defaults to a month
+        seed: seed, SeedSequence or numpy Generator of the random stream
+
+    Returns:
+        A (scenarios x periods) array of annualized, continuously compounded
+        short rates dr = a (b - r) dt + sigma dW sampled exactly, where
+        column k is the rate at the start of period k.  Rates can be negative.
+    """
+    _validate(scenarios, periods, dt, sigma, a)
+    return _ornstein_uhlenbeck(
+        r0, a, b, sigma, scenarios, periods, dt, np.random.default_rng(seed)
+    )
+
+
+def cir(
+    r0: float,
+    a: float,
+    b: float,
+    sigma: float,
+    scenarios: int,
+    periods: int,
+    dt: float = 1 / 12,
+    seed: Seed = None,
+) -> np.ndarray:
+    # pylint: disable=too-many-arguments
+    """
+    Args:
+        r0: initial annualized short rate
+        a: speed of mean reversion
+        b: long term mean of the short rate
+        sigma: annualized volatility of the short rate
+        scenarios: number of scenarios
+        periods: number of periods in each scenario
+        dt: length of a period in years, defaults to a month
+        seed: seed, SeedSequence or numpy Generator of the random stream
+
+    Returns:
+        A (scenarios x periods) array of annualized, continuously compounded
+        non-negative short rates dr = a (b - r) dt + sigma sqrt(r) dW, where
+        column k is the rate at the start of period k.  Each step is sampled
+        exactly from the scaled noncentral chi-square transition.
+    """
+    _validate(scenarios, periods, dt, sigma, a)
+    if r0 < 0 or b < 0:
+        raise InvalidScenarioInputs("CIR rates and means must not be negative!")
+    generator = np.random.default_rng(seed)
+    decay = np.exp(-a * dt)
+    paths = np.empty((periods, scenarios))
+    paths[0] = r0
+    if sigma == 0:
+        for period in range(1, periods):
+            paths[period] = b + (paths[period - 1] - b) * decay
+        return np.ascontiguousarray(paths.T)
+    scale = sigma**2 * (1 - decay) / (4 * a)
+    degrees_of_freedom = 4 * a * b / sigma**2
+    for period in range(1, periods):
+        noncentrality = paths[period - 1] * (decay / scale)
+        if degrees_of_freedom > 0:
+            sample = generator.noncentral_chisquare(degrees_of_freedom, noncentrality)
+        else:
+            # zero degrees of freedom is a Poisson mixture of chi-squares
+            sample = generator.chisquare(
+                np.maximum(2 * generator.poisson(noncentrality / 2), 1e-300)
+            )
+        np.multiply(sample, scale, out=paths[period])
+    return np.ascontiguousarray(paths.T)
+
+
+def hull_white(
+    forward_rates: Union[float, Iterable, np.ndarray],
+    a: float,
+    sigma: float,
+    scenarios: int,
+    periods: int,
+    dt: float = 1 / 12,
+    seed: Seed = None,
+) -> np.ndarray:
+    # pylint: disable=too-many-arguments
+    """
+    Args:
+        forward_rates: annualized instantaneous forward rate f(0, t) of the
+                       initial curve at the start of each period, or a
+                       single rate for a flat curve
+        a: speed of mean reversion
+        sigma: annualized volatility of the short rate
+        scenarios: number of scenarios
+        periods: number of periods in each scenario
+        dt: length of a period in years, defaults to a month
+        seed: seed, SeedSequence or numpy Generator of the random stream
+
+    Returns:
+        A (scenarios x periods) array of annualized, continuously compounded
+        short rates of the one factor Hull-White model
+        dr = (theta(t) - a r) dt + sigma dW fitted to the initial forward
+        curve, where column k is the rate at the start of period k.  The
+        rates are sampled exactly as r(t) = x(t) + alpha(t), where x is a
+        zero mean Ornstein-Uhlenbeck process and
+        alpha(t) = f(0, t) + sigma^2 / (2 a^2) (1 - exp(-a t))^2.
+    """
+    _validate(scenarios, periods, dt, sigma, a)
+    forward_rates = np.broadcast_to(np.asarray(forward_rates, dtype=float), periods)
+    times = np.arange(periods) * dt
+    alpha = forward_rates + sigma**2 / (2 * a**2) * (1 - np.exp(-a * times)) ** 2
+    paths = _ornstein_uhlenbeck(
+        0.0, a, 0.0, sigma, scenarios, periods, dt, np.random.default_rng(seed)
+    )
+    paths += alpha
+    return paths
+
+
+def lognormal(
+    r0: float,
+    mu: float,
+    sigma: float,
+    scenarios: int,
+    periods: int,
+    dt: float = 1 / 12,
+    seed: Seed = None,
+) -> np.ndarray:
+    # pylint: disable=too-many-arguments
+    """
+    Args:
+        r0: initial annualized short rate
+        mu: annualized drift of the short rate
+        sigma: annualized volatility of the logarithm of the short rate
+        scenarios: number of scenarios
+        periods: number of periods in each scenario
+        dt: length of a period in years, defaults to a month
+        seed: seed, SeedSequence or numpy Generator of the random stream
+
+    Returns:
+        A (scenarios x periods) array of annualized, continuously compounded
+        positive short rates dr = mu r dt + sigma r dW, where column k is the
+        rate at the start of period k
+    """
+    _validate(scenarios, periods, dt, sigma)
+    if r0 <= 0:
+        raise InvalidScenarioInputs("Lognormal rates must start positive!")
+    paths = np.random.default_rng(seed).standard_normal((scenarios, periods))
+    paths *= sigma * np.sqrt(dt)
+    paths += (mu - sigma**2 / 2) * dt
+    paths[:, 0] = np.log(r0)
+    np.cumsum(paths, axis=1, out=paths)
+    return np.exp(paths, out=paths)
+
+
+def effective_rates(
+    short_rates: Union[Iterable, np.ndarray],
+    dt: float = 1 / 12,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Converts annualized, continuously compounded short rates to the
+    effective interest rate of each period, exp(r dt) - 1, which are the
+    per period interest_rates of expected_present_value.
+
+    Args:
+        short_rates: (scenarios x periods) short rates of a scenario generator
+        dt: length of a period in years
+        out: array to write the effective rates to, e.g. the short rates
+             themselves to convert a large scenario set without a copy
+
+    Returns:
+        The effective interest rate of each period
+
+    Example:
+        rates = vasicek(0.03, 0.1, 0.04, 0.01, scenarios=10000, periods=600, seed=1)
+        effective_rates(rates, out=rates)
+        epvs = expected_present_value(cash_flows, probabilities, rates)
+    """
+    short_rates = np.asarray(short_rates, dtype=float)
+    return np.expm1(np.multiply(short_rates, dt, out=out), out=out)
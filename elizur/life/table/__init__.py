@@ -1,3 +1,20 @@
 # flake8: noqa: E401
 
-from elizur.life.table.table import LifeTable, EXAMPLE_TABLE
+from elizur.life.table.table import LifeTable, CommutationColumns, EXAMPLE_TABLE
+from elizur.life.table.library import TableLibrary, InvalidTable
+from elizur.life.table.store import TableStore, InvalidTableStore, write_table_store
+from elizur.life.table.select import SelectLifeTable
+from elizur.life.table.status import (
+    JointLifeStatus,
+    LastSurvivorStatus,
+    InvalidStatus,
+)
+from elizur.life.table.improvement import MortalityProjection, InvalidScale
+from elizur.life.table.decrement import MultipleDecrementTable, InvalidDecrement
+from elizur.life.table.simulation import (
+    SIMULATED_BENEFITS,
+    InvalidSimulation,
+    simulate_lifetimes,
+    simulate_lifetime_chunks,
+    simulated_present_values,
+)
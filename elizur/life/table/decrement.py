@@ -0,0 +1,366 @@
+from functools import lru_cache
+from typing import Iterable, Mapping, Tuple, Union
+
+import numpy as np
+
+from elizur.life.annuity import discount_factor
+from elizur.life.table.table import LifeTable, _reverse_cumsum
+from elizur.life.util import validate_age, validate_interval
+
+
+class InvalidDecrement(Exception):
+    """
+    Custom exception raised for invalid multiple decrement inputs
+    """
+
+
+class MultipleDecrementTable:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Given the rates of several causes of decrement, e.g. death, lapse,
+    disability, and retirement, this class calculates the total, dependent,
+    and associated single decrement rates of every cause at every age as
+    (causes x ages) matrices, the survivors and decrements of each cause,
+    and the actuarial present values of benefits paid on each cause.
+
+    Dependent and associated single decrement rates are converted assuming
+    a uniform distribution of each decrement in the multiple decrement
+    table, i.e. the associated single decrement survival probability of
+    cause j is the total survival probability raised to the power of the
+    dependent rate of j over the total rate.
+
+    The total decrement is exposed as a LifeTable, so annuities and benefits
+    payable on any decrement use the LifeTable actuarial present values.
+
+    Args:
+        decrements: the rates of each cause in sequential order of age keyed
+                    by the name of the cause, e.g. {'death': (...), 'lapse':
+                    (...)}
+        independent: True when the rates are associated single decrement
+                     rates, e.g. a mortality table and a lapse study, and
+                     False when they are dependent rates of the multiple
+                     decrement table
+        initial_pop: the size of the initial population (l0)
+        commutation_cache_size: the number of interest rates to keep
+                                commutation columns cached for
+
+    Example:
+        table = MultipleDecrementTable(
+            {"death": mortality_rates, "lapse": lapse_rates}, independent=True
+        )
+        table.Axn(35, 0.04, 20, cause="death")
+        table.total.axn_due(35, 0.04, 20)
+    """
+
+    def __init__(
+        self,
+        decrements: Mapping[str, Union[Iterable, np.array]],
+        independent: bool = False,
+        initial_pop: int = 100000,
+        commutation_cache_size: int = 16,
+    ):
+        if not decrements:
+            raise InvalidDecrement("At least one decrement is required!")
+        self.causes = tuple(decrements)
+        try:
+            rates = np.array([decrements[cause] for cause in self.causes], dtype=float)
+        except ValueError as error:
+            raise InvalidDecrement(
+                "Every decrement must have a rate for the same ages!"
+            ) from error
+        if rates.ndim != 2 or np.any(rates < 0) or np.any(rates > 1):
+            raise InvalidDecrement(
+                "Decrement rates must be columns of probabilities by age!"
+            )
+        if independent:
+            self.associated_qxs = rates
+            self.qxs = self._dependent_rates(rates)
+        else:
+            if np.any(rates.sum(axis=0) > 1 + 1e-12):
+                raise InvalidDecrement(
+                    "Dependent decrement rates must not sum to more than 1!"
+                )
+            self.qxs = rates
+            self.associated_qxs = self._associated_rates(rates)
+        self.total = LifeTable(
+            np.minimum(self.qxs.sum(axis=0), 1.0), initial_pop=initial_pop
+        )
+        self.table_size = self.total.table_size
+        self.lxs = self.total.lxs
+        self.dxs = self.lxs[: self.table_size] * self.qxs
+        self.cause_lxs = np.append(
+            _reverse_cumsum(self.dxs), np.zeros((len(self.causes), 1)), axis=1
+        )
+        terminal_qxs = self._terminal_rates(self.qxs)
+        self._padded_qxs = np.append(self.qxs, terminal_qxs, axis=1)
+        self._padded_associated_qxs = np.append(
+            self.associated_qxs, self._associated_rates(terminal_qxs), axis=1
+        )
+        self._commutation_columns = lru_cache(maxsize=commutation_cache_size)(
+            self._calculate_commutation_columns
+        )
+        for column in (self.qxs, self.associated_qxs, self.dxs, self.cause_lxs):
+            column.setflags(write=False)
+
+    @staticmethod
+    def _dependent_rates(associated_qxs: np.array) -> np.array:
+        """
+        Args:
+            associated_qxs: (causes x ages) associated single decrement rates
+
+        Returns:
+            The (causes x ages) dependent rates of the multiple decrement table
+        """
+        pxs = 1 - associated_qxs
+        total_pxs = np.prod(pxs, axis=0)
+        log_total = np.log(
+            total_pxs, out=np.full(total_pxs.shape, -np.inf), where=total_pxs > 0
+        )
+        log_pxs = np.log(pxs, out=np.full(pxs.shape, -np.inf), where=pxs > 0)
+        shares = np.divide(
+            log_pxs,
+            log_total,
+            out=np.zeros(pxs.shape),
+            where=np.isfinite(log_total) & (log_total < 0),
+        )
+        # causes with certain decrement share a certain total decrement equally
+        certain = associated_qxs >= 1
+        shares = np.where(
+            np.any(certain, axis=0),
+            certain / np.maximum(certain.sum(axis=0), 1),
+            shares,
+        )
+        return (1 - total_pxs) * shares
+
+    @staticmethod
+    def _terminal_rates(qxs: np.array) -> np.array:
+        """
+        Like LifeTable, the total decrement beyond the table is certain.  It
+        is shared by the causes in proportion to their dependent rates at the
+        last age of the table, or equally when there is no decrement at the
+        last age.
+
+        Args:
+            qxs: (causes x ages) dependent rates of the multiple decrement
+                 table
+
+        Returns:
+            The (causes x 1) dependent rates of the ages beyond the table
+        """
+        last_qxs = qxs[:, -1:]
+        total = last_qxs.sum()
+        if total > 0:
+            return last_qxs / total
+        return np.full(last_qxs.shape, 1 / len(qxs))
+
+    @staticmethod
+    def _associated_rates(qxs: np.array) -> np.array:
+        """
+        Args:
+            qxs: (causes x ages) dependent rates of the multiple decrement
+                 table
+
+        Returns:
+            The (causes x ages) associated single decrement rates
+        """
+        total_qxs = np.minimum(qxs.sum(axis=0), 1.0)
+        exponents = np.divide(
+            qxs, total_qxs, out=np.zeros(qxs.shape), where=total_qxs > 0
+        )
+        return 1 - np.power(1 - total_qxs, exponents)
+
+    def _cause(self, cause: Union[str, int]) -> int:
+        """
+        Args:
+            cause: name or index of a cause of decrement
+
+        Returns:
+            The index of the cause
+        """
+        if isinstance(cause, str):
+            if cause not in self.causes:
+                raise InvalidDecrement(
+                    f"Unknown cause {cause}! The cause must be one of {self.causes}."
+                )
+            return self.causes.index(cause)
+        if not 0 <= cause < len(self.causes):
+            raise InvalidDecrement(
+                f"Cause indexes must be between 0 and {len(self.causes) - 1}!"
+            )
+        return int(cause)
+
+    @validate_age
+    def qx(
+        self, x: Union[int, Iterable, np.array], cause: Union[str, int]
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: start age
+            cause: name or index of a cause of decrement
+
+        Returns:
+            The probability of decrement by the cause between ages x and
+            x + 1 in the presence of every other cause.  Beyond the table the
+            causes share a certain decrement.
+        """
+        return self._padded_qxs[self._cause(cause), self._age(x)][()]
+
+    @validate_age
+    def associated_qx(
+        self, x: Union[int, Iterable, np.array], cause: Union[str, int]
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: start age
+            cause: name or index of a cause of decrement
+
+        Returns:
+            The probability of decrement by the cause between ages x and
+            x + 1 if it were the only cause of decrement.  Beyond the table
+            it is 1 for every cause sharing the certain total decrement.
+        """
+        return self._padded_associated_qxs[self._cause(cause), self._age(x)][()]
+
+    def commutation_columns(self, i: float) -> Tuple[np.array, np.array, np.array]:
+        """
+        Args:
+            i: interest rate
+
+        Returns:
+            The (causes x ages) Cx, Mx, and Rx columns of every cause of
+            decrement, calculated once per interest rate
+        """
+        return self._commutation_columns(float(i))
+
+    def _calculate_commutation_columns(
+        self, i: float
+    ) -> Tuple[np.array, np.array, np.array]:
+        discount_factors = np.power(
+            discount_factor(i), np.arange(1, self.table_size + 1, dtype=float)
+        )
+        Cxs = np.append(
+            self.dxs * discount_factors, np.zeros((len(self.causes), 1)), axis=1
+        )
+        Mxs = _reverse_cumsum(Cxs)
+        Rxs = _reverse_cumsum(Mxs)
+        for column in (Cxs, Mxs, Rxs):
+            column.setflags(write=False)
+        return Cxs, Mxs, Rxs
+
+    def _cause_commutations(
+        self, i: Union[float, Iterable, np.array], cause: Union[str, int]
+    ) -> Tuple[np.array, np.array, np.array, Union[int, np.array]]:
+        """
+        Args:
+            i: interest rate or an array of interest rates
+            cause: name or index of a cause of decrement
+
+        Returns:
+            The Dx column of the total decrement and the Mx and Rx columns of
+            the cause stacked into (rates x ages) matrices and the row index
+            of each interest rate
+        """
+        index = self._cause(cause)
+        rates, rows = (
+            (np.array([i]), 0) if np.ndim(i) == 0 else np.unique(i, return_inverse=True)
+        )
+        columns = [
+            (
+                self.total.commutation_columns(rate).Dxs,
+                self.commutation_columns(rate)[1][index],
+                self.commutation_columns(rate)[2][index],
+            )
+            for rate in rates
+        ]
+        Dxs, Mxs, Rxs = (np.stack(column) for column in zip(*columns))
+        return Dxs, Mxs, Rxs, rows if np.ndim(i) == 0 else rows.reshape(np.shape(i))
+
+    def _age(self, x: Union[int, Iterable, np.array]) -> Union[int, np.array]:
+        return np.minimum(x, self.table_size)
+
+    @validate_age
+    def Ax(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array],
+        cause: Union[str, int],
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: start age
+            i: interest rate
+            cause: name or index of the cause the benefit is paid on
+        Returns:
+            Actuarial present value of level whole insurance paid on
+            decrement by the cause
+        """
+        Dxs, Mxs, _, r = self._cause_commutations(i, cause)
+        return Mxs[r, self._age(x)] / Dxs[r, self._age(x)]
+
+    @validate_age
+    @validate_interval
+    def Axn(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array],
+        n: Union[int, Iterable, np.array],
+        cause: Union[str, int],
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: start age
+            i: interest rate
+            n: number of periods in the temporary insurance
+            cause: name or index of the cause the benefit is paid on
+        Returns:
+            Actuarial present value of level temporary insurance paid on
+            decrement by the cause
+        """
+        Dxs, Mxs, _, r = self._cause_commutations(i, cause)
+        return (Mxs[r, self._age(x)] - Mxs[r, self._age(np.add(x, n))]) / Dxs[
+            r, self._age(x)
+        ]
+
+    @validate_age
+    def IAx(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array],
+        cause: Union[str, int],
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: start age
+            i: interest rate
+            cause: name or index of the cause the benefit is paid on
+        Returns:
+            Actuarial present value of increasing whole insurance paid on
+            decrement by the cause
+        """
+        Dxs, _, Rxs, r = self._cause_commutations(i, cause)
+        return Rxs[r, self._age(x)] / Dxs[r, self._age(x)]
+
+    @validate_age
+    @validate_interval
+    def IAxn(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array],
+        n: Union[int, Iterable, np.array],
+        cause: Union[str, int],
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: start age
+            i: interest rate
+            n: number of periods in the temporary insurance
+            cause: name or index of the cause the benefit is paid on
+        Returns:
+            Actuarial present value of increasing temporary insurance paid on
+            decrement by the cause
+        """
+        Dxs, Mxs, Rxs, r = self._cause_commutations(i, cause)
+        end = self._age(np.add(x, n))
+        return (Rxs[r, self._age(x)] - Rxs[r, end] - np.multiply(n, Mxs[r, end])) / Dxs[
+            r, self._age(x)
+        ]
@@ -0,0 +1,54 @@
+from typing import Iterable, Union
+
+import numpy as np
+
+from elizur.life.util import InvalidAssumption
+
+UDD = "udd"
+CONSTANT_FORCE = "constant_force"
+BALDUCCI = "balducci"
+FRACTIONAL_AGE_ASSUMPTIONS = (UDD, CONSTANT_FORCE, BALDUCCI)
+
+
+def fractional_lxs(
+    lxs: np.array, x: Union[float, Iterable, np.array], assumption: str = UDD
+) -> np.array:
+    """
+    Interpolates the population between integer ages under a fractional age
+    assumption.  With s the fractional part of the age x:
+
+    * uniform distribution of deaths (udd), lx+s = lx - s * dx
+    * constant force of mortality (constant_force), lx+s = lx * px^s
+    * Balducci (balducci), 1 / lx+s = (1 - s) / lx + s / lx+1
+
+    Args:
+        lxs: population at each integer age followed by a trailing zero for
+             ages beyond the table
+        x: age or an array of non-negative real ages
+        assumption: one of FRACTIONAL_AGE_ASSUMPTIONS
+
+    Returns:
+        The population at each age
+    """
+    if assumption not in FRACTIONAL_AGE_ASSUMPTIONS:
+        raise InvalidAssumption(
+            f"Unknown fractional age assumption {assumption}! The assumption "
+            f"must be one of {FRACTIONAL_AGE_ASSUMPTIONS}."
+        )
+    x = np.asarray(x, dtype=float)
+    last = lxs.size - 1
+    ages = np.minimum(np.floor(x).astype(int), last)
+    s = np.where(ages < last, x - ages, 0.0)
+    lower = lxs[ages]
+    upper = lxs[np.minimum(ages + 1, last)]
+    if assumption == UDD:
+        return lower - s * (lower - upper)
+    alive = lower > 0
+    if assumption == CONSTANT_FORCE:
+        pxs = np.divide(upper, lower, out=np.zeros(lower.shape), where=alive)
+        return lower * np.power(pxs, s)
+    inverse_lower = np.divide(1 - s, lower, out=np.full(s.shape, np.inf), where=alive)
+    inverse_upper = np.divide(
+        s, upper, out=np.where(s > 0, np.inf, 0.0), where=upper > 0
+    )
+    return 1 / (inverse_lower + inverse_upper)
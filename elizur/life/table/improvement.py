@@ -0,0 +1,196 @@
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Union
+
+import numpy as np
+
+from elizur.life.table.table import LifeTable
+from elizur.life.util import InvalidAge, validate_age
+
+
+class InvalidScale(Exception):
+    """
+    Custom exception raised for invalid mortality improvement scales
+    """
+
+
+class MortalityProjection:
+    """
+    Projects the failure probabilities of a base LifeTable to other calendar
+    years with a mortality improvement scale, where the failure probability
+    at age x in year y is qx,y = qx,y-1 * (1 - improvement at age x in year
+    y).  Years before the base year are projected backward with the same
+    relationship.
+
+    Generational failure probabilities are cumulative products of the
+    improvement factors along the calendar year axis, so every age and year
+    is projected in one vectorized pass.  The LifeTable of each birth year
+    cohort is built from the diagonal of the projection and cached.
+
+    Args:
+        base: LifeTable of the failure probabilities in the base year
+        scale: improvement rates as an array of ages, which apply to every
+               year, or a matrix of (ages x calendar years).  Ages beyond
+               the scale use the last age of the scale and years beyond the
+               scale use the nearest year of the scale.
+        base_year: calendar year of the base table
+        scale_start_year: calendar year of the first column of the scale,
+                          defaults to the year after the base year
+        cohort_cache_size: the number of birth year cohorts to keep cached
+
+    Example:
+        projection = MortalityProjection(LifeTable(EXAMPLE_TABLE), mp_scale, 2012)
+        projection.qxs(range(2012, 2031))
+        projection.cohort(1960).ax_due(65, 0.04)
+    """
+
+    def __init__(
+        self,
+        base: LifeTable,
+        scale: Union[Iterable, np.array],
+        base_year: int,
+        scale_start_year: Optional[int] = None,
+        cohort_cache_size: int = 32,
+    ):
+        # pylint: disable=too-many-arguments
+        scale = np.array(scale, dtype=float)
+        if scale.ndim == 1:
+            scale = scale[:, np.newaxis]
+        if scale.ndim != 2 or 0 in scale.shape:
+            raise InvalidScale(
+                "The improvement scale must be a non-empty array of ages or a "
+                "matrix of (ages x calendar years)!"
+            )
+        if np.any(scale >= 1):
+            raise InvalidScale("Improvement rates must be less than 1!")
+        self.base = base
+        self.base_year = int(base_year)
+        self.scale_start_year = (
+            self.base_year + 1 if scale_start_year is None else int(scale_start_year)
+        )
+        ages = np.minimum(np.arange(base.table_size), scale.shape[0] - 1)
+        self.scale = scale[ages]
+        self.scale.setflags(write=False)
+        self._cohort = lru_cache(maxsize=cohort_cache_size)(self._build_cohort)
+
+    @classmethod
+    def from_soa_table(
+        cls,
+        base: LifeTable,
+        scale_table: Dict,
+        base_year: int,
+        cohort_cache_size: int = 32,
+    ) -> "MortalityProjection":
+        """
+        Args:
+            base: LifeTable of the failure probabilities in the base year
+            scale_table: an improvement scale read with read_soa_csv_mort_table
+                         whose columns are calendar years, e.g. an MP scale
+            base_year: calendar year of the base table
+            cohort_cache_size: the number of birth year cohorts to keep cached
+
+        Returns:
+            A projection of the base table with the improvement scale.  Ages
+            below the first age of the scale use its first age.
+        """
+        metadata = scale_table["metadata"]
+        scale = np.array(scale_table["values"], dtype=float, ndmin=1)
+        min_age = metadata.get("min_age", 0)
+        if min_age > 0:
+            scale = np.concatenate((np.repeat(scale[:1], min_age, axis=0), scale))
+        columns = metadata.get("columns", [])
+        return cls(
+            base,
+            scale,
+            base_year,
+            scale_start_year=int(columns[0]) if columns and scale.ndim == 2 else None,
+            cohort_cache_size=cohort_cache_size,
+        )
+
+    def _improvement_factors(self, years: Union[int, Iterable, np.array]) -> np.array:
+        """
+        Args:
+            years: calendar year or an array of calendar years
+
+        Returns:
+            The cumulative improvement factor from the base year to each year
+            for every age, a matrix of (ages x years) when years is an array
+        """
+        years = np.asarray(years, dtype=int)
+        first = min(int(years.min(initial=self.base_year)), self.base_year)
+        last = max(int(years.max(initial=self.base_year)), self.base_year)
+        columns = np.clip(
+            np.arange(first + 1, last + 1) - self.scale_start_year,
+            0,
+            self.scale.shape[1] - 1,
+        )
+        cumulative = np.cumprod(
+            np.insert(1 - self.scale[:, columns], 0, 1.0, axis=1), axis=1
+        )
+        return cumulative[:, years - first] / cumulative[:, [self.base_year - first]]
+
+    def qxs(self, years: Union[int, Iterable, np.array]) -> np.array:
+        """
+        Args:
+            years: calendar year or an array of calendar years
+
+        Returns:
+            The projected failure probabilities of every age in each year,
+            a matrix of (ages x years) when years is an array
+        """
+        factors = self._improvement_factors(np.atleast_1d(years))
+        qxs = np.minimum(self.base.qxs[:, np.newaxis] * factors, 1.0)
+        return qxs if np.ndim(years) else qxs[:, 0]
+
+    @validate_age
+    def qx(
+        self,
+        x: Union[int, Iterable, np.array],
+        years: Union[int, Iterable, np.array],
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: integer age or an array of integer ages
+            years: calendar year or an array of calendar years
+
+        Returns:
+            The projected failure probability at age x in each year
+        """
+        x = np.asarray(x)
+        if not np.issubdtype(x.dtype, np.integer):
+            raise InvalidAge("Projected ages must be integers!")
+        x, years = np.broadcast_arrays(x, years)
+        unique_years, columns = np.unique(years, return_inverse=True)
+        qxs = np.vstack((self.qxs(unique_years), np.ones(unique_years.size)))
+        return qxs[np.minimum(x, self.base.table_size), columns.reshape(x.shape)][()]
+
+    def cohort_qxs(self, birth_year: int) -> np.array:
+        """
+        Args:
+            birth_year: calendar year of birth of the cohort
+
+        Returns:
+            The failure probability of each age of the cohort, i.e. the
+            diagonal of the projection starting in the birth year
+        """
+        return self.cohort(birth_year).qxs
+
+    def cohort(self, birth_year: int) -> LifeTable:
+        """
+        Args:
+            birth_year: calendar year of birth of the cohort
+
+        Returns:
+            The generational LifeTable of the cohort, built once per birth
+            year
+        """
+        return self._cohort(int(birth_year))
+
+    def _build_cohort(self, birth_year: int) -> LifeTable:
+        ages = np.arange(self.base.table_size)
+        factors = self._improvement_factors(birth_year + ages)
+        return LifeTable(
+            np.minimum(self.base.qxs * factors[ages, ages], 1.0),
+            name=f"{self.base.name} {birth_year} cohort".strip(),
+            description=self.base.description,
+            initial_pop=self.base.lxs[0],
+        )
@@ -0,0 +1,195 @@
+import glob
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from elizur.life.table.select import SelectLifeTable
+from elizur.life.table.table import LifeTable
+from elizur.life.util import read_soa_csv_mort_tables
+
+
+class InvalidTable(Exception):
+    """
+    Custom exception raised for tables a library cannot resolve or construct
+    """
+
+
+class TableLibrary:
+    """
+    A registry of the SOA csv tables in a directory.  The csvs are parsed
+    concurrently by a pool of threads when the library is created and the
+    tables are indexed by SOA table identity and by name.  A LifeTable, or a
+    SelectLifeTable for select and ultimate csvs, is only constructed the
+    first time its table is accessed and is then reused for every later
+    access.
+
+    Args:
+        directory: directory containing SOA csv tables
+        pattern: glob pattern of the csv file names within the directory
+        encoding: The text encoding of the csv data.  It defaults to 'Windows-1252'.
+        delimiter: The delimiter of the csv data.  It defaults to ','.
+        cache: When True the parsed tables are cached in sidecar binary
+               files, see read_soa_csv_mort_table
+        max_workers: number of threads parsing csvs, defaults to the
+                     ThreadPoolExecutor default
+
+    Example:
+        library = TableLibrary("tables")
+        library["1"].Ax(0, 0.07)
+        library["1941 CSO Basic Table, ANB"].Ax(0, 0.07)
+    """
+
+    def __init__(
+        self,
+        directory,
+        pattern: str = "*.csv",
+        encoding: str = "Windows-1252",
+        delimiter: str = ",",
+        cache: bool = False,
+        max_workers: Optional[int] = None,
+    ):
+        # pylint: disable=too-many-arguments
+        paths = sorted(glob.glob(os.path.join(os.fspath(directory), pattern)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            parsed = executor.map(
+                lambda path: read_soa_csv_mort_tables(
+                    path, encoding=encoding, delimiter=delimiter, cache=cache
+                ),
+                paths,
+            )
+            self._tables: Dict[str, Tuple[Dict, ...]] = {}
+            self._names: Dict[str, Optional[str]] = {}
+            for path, tables in zip(paths, parsed):
+                self._register(path, tables)
+        self._life_tables: Dict[str, Union[LifeTable, SelectLifeTable]] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, path: str, tables: List[Dict]) -> None:
+        """
+        Indexes the tables of a csv by the SOA table identity, or the file
+        name when the csv has no identity, and by the table name.  Names
+        shared by several csvs are ambiguous and can only be resolved by
+        identity.
+        """
+        if not tables:
+            return
+        metadata = tables[0]["metadata"]
+        identity = metadata.get(
+            "soa_table_identity", os.path.splitext(os.path.basename(path))[0]
+        )
+        if identity in self._tables:
+            raise InvalidTable(f"Duplicate table identity {identity} in {path}!")
+        self._tables[identity] = tuple(tables)
+        name = metadata.get("name")
+        if name is not None:
+            self._names[name] = None if name in self._names else identity
+
+    def identity(self, key: str) -> str:
+        """
+        Args:
+            key: SOA table identity or table name
+
+        Returns:
+            The SOA table identity of the key
+        """
+        if key in self._tables:
+            return key
+        if key in self._names:
+            identity = self._names[key]
+            if identity is None:
+                raise InvalidTable(
+                    f"Table name {key} is ambiguous! Use the table identity."
+                )
+            return identity
+        raise KeyError(key)
+
+    def tables(self, key: str) -> Tuple[Dict, ...]:
+        """
+        Args:
+            key: SOA table identity or table name
+
+        Returns:
+            The parsed tables of the csv, each a dictionary with a 'values'
+            and 'metadata' key
+        """
+        return self._tables[self.identity(key)]
+
+    def is_loaded(self, key: str) -> bool:
+        """
+        Args:
+            key: SOA table identity or table name
+
+        Returns:
+            True when the LifeTable of the key has been constructed
+        """
+        return self.identity(key) in self._life_tables
+
+    def __getitem__(self, key: str) -> Union[LifeTable, SelectLifeTable]:
+        identity = self.identity(key)
+        life_table = self._life_tables.get(identity)
+        if life_table is None:
+            with self._lock:
+                life_table = self._life_tables.get(identity)
+                if life_table is None:
+                    life_table = self._construct(self._tables[identity])
+                    self._life_tables[identity] = life_table
+        return life_table
+
+    @staticmethod
+    def _construct(tables: Tuple[Dict, ...]) -> Union[LifeTable, SelectLifeTable]:
+        """
+        Args:
+            tables: the parsed tables of a csv
+
+        Returns:
+            A LifeTable of the csv's single column table or a SelectLifeTable
+            of the csv's select and ultimate tables
+        """
+        dimensions = tuple(table["values"].ndim for table in tables)
+        metadata = tables[0]["metadata"]
+        if dimensions == (1,):
+            return LifeTable(
+                tables[0]["values"],
+                name=metadata.get("name", ""),
+                description=metadata.get("description", ""),
+            )
+        if dimensions == (2, 1):
+            select, ultimate = tables
+            # align the select issue ages with the first age of the ultimate table
+            offset = metadata.get("min_age", 0) - ultimate["metadata"].get("min_age", 0)
+            start = max(-offset, 0)
+            select_values = select["values"][start:]
+            if offset > 0:
+                select_values = np.vstack(
+                    (np.full((offset, select_values.shape[1]), np.nan), select_values)
+                )
+            return SelectLifeTable(
+                select_values,
+                ultimate["values"],
+                name=metadata.get("name", ""),
+                description=metadata.get("description", ""),
+            )
+        raise InvalidTable(
+            "Only csvs holding a single one dimensional table or a select and "
+            "an ultimate table can be constructed!"
+        )
+
+    def __contains__(self, key) -> bool:
+        return key in self._tables or self._names.get(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tables)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    @property
+    def names(self) -> List[str]:
+        """
+        Returns:
+            The unambiguous table names of the library
+        """
+        return [name for name, identity in self._names.items() if identity]
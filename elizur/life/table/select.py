@@ -0,0 +1,737 @@
+from functools import lru_cache
+from typing import Iterable, Tuple, Union
+
+import numpy as np
+
+from elizur.life.annuity import discount_factor
+from elizur.life.table.table import CommutationColumns, LifeTable, _reverse_cumsum
+from elizur.life.util import validate_age, validate_duration, validate_interval
+
+
+class SelectLifeTable:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Given a select period matrix of failure probabilities and an ultimate
+    column of failure probabilities this class calculates the common
+    actuarial functions of a life selected at age x and observed t years
+    later, i.e. at [x] + t.  Durations at or beyond the end of the select
+    period, issue ages beyond the select matrix, and empty (NaN) select
+    cells use the ultimate failure probabilities.
+
+    Only the select block is stored: the columns of [x] + t during the
+    select period are (issue ages x select period) matrices computed once
+    at construction, and from the end of the select period onward [x] + t
+    reads the columns of the ultimate LifeTable at age x + t.  The
+    population at [x] + t is scaled so that it equals the ultimate
+    population at age x + t from the end of the select period onward.
+
+    Every function accepts scalars or broadcastable arrays of issue ages
+    (x), interest rates (i), terms (n), and durations (t).
+
+    Args:
+        select: (issue ages x select durations) matrix of failure
+                probabilities, e.g. ((q[0], q[0]+1), (q[1], q[1]+1), ...)
+        ultimate: iterable of ultimate failure probabilities as floats in
+                  sequential order, e.g. (1q0, 2q1, ..., 100q99)
+        name: name of the table
+        description: description of the table
+        initial_pop: the size of the initial population (l0) of the
+                     ultimate table
+        commutation_cache_size: the number of interest rates to keep
+                                commutation columns cached for
+    """
+
+    __slots__ = (
+        "select_qxs",
+        "ultimate",
+        "select_period",
+        "qxs",
+        "pxs",
+        "lxs",
+        "dxs",
+        "name",
+        "description",
+        "_ultimate_qxs",
+        "_ultimate_lxs",
+        "_ultimate_scale",
+        "_commutation_columns",
+    )
+
+    def __init__(
+        self,
+        select: Union[Iterable, np.array],
+        ultimate: Union[Iterable, np.array],
+        name: str = "",
+        description: str = "",
+        initial_pop: int = 100000,
+        commutation_cache_size: int = 16,
+    ):
+        # pylint: disable=too-many-arguments
+        self.select_qxs = np.array(select, dtype=float, ndmin=2)
+        self.ultimate = LifeTable(ultimate, initial_pop=initial_pop)
+        self.select_period = self.select_qxs.shape[1]
+        size = self.ultimate.table_size
+        self._ultimate_qxs = np.append(self.ultimate.qxs, 1.0)
+        self._ultimate_lxs = np.append(self.ultimate.lxs[:size], 0.0)
+        self.qxs = self._set_qxs()
+        self.pxs = 1 - self.qxs
+        self.lxs = self._set_lxs()
+        self.dxs = -1 * np.diff(self.lxs, axis=1)
+        # 1 when the lives of an issue age join the ultimate population at
+        # the end of the select period, 0 when none survive the select period
+        self._ultimate_scale = (self.lxs[:, -1] > 0).astype(float)
+        self.name = name
+        self.description = description
+        self._commutation_columns = lru_cache(maxsize=commutation_cache_size)(
+            self._calculate_commutation_columns
+        )
+        for column in (
+            self.select_qxs,
+            self.qxs,
+            self.pxs,
+            self.lxs,
+            self.dxs,
+            self._ultimate_qxs,
+            self._ultimate_lxs,
+            self._ultimate_scale,
+        ):
+            column.setflags(write=False)
+
+    def __setattr__(self, name: str, value) -> None:
+        if name not in ("name", "description") and hasattr(self, name):
+            raise AttributeError(f"SelectLifeTable attribute '{name}' is read-only")
+        object.__setattr__(self, name, value)
+
+    def __reduce__(self):
+        return (
+            SelectLifeTable,
+            (
+                self.select_qxs,
+                self.ultimate.qxs,
+                self.name,
+                self.description,
+                self.ultimate.lxs[0],
+                self._commutation_columns.cache_parameters()["maxsize"],
+            ),
+        )
+
+    def _attained_ages(self, durations: int) -> np.array:
+        """
+        Args:
+            durations: number of durations from selection
+
+        Returns:
+            The (issue ages x durations) matrix of the ultimate column index
+            of the attained age at [x] + t
+        """
+        issue_ages = np.arange(self.select_qxs.shape[0])[:, np.newaxis]
+        return np.minimum(issue_ages + np.arange(durations), self.ultimate.table_size)
+
+    def _set_qxs(self) -> np.array:
+        """
+        Returns:
+            The (issue ages x select period) matrix of failure probabilities
+            at [x] + t with empty select cells filled from the ultimate table
+        """
+        ultimate_qxs = self._ultimate_qxs[self._attained_ages(self.select_period)]
+        return np.where(np.isnan(self.select_qxs), ultimate_qxs, self.select_qxs)
+
+    def _set_lxs(self) -> np.array:
+        """
+        Returns:
+            The (issue ages x select period + 1) matrix of the population at
+            [x] + t scaled to the ultimate population at the end of the
+            select period
+        """
+        issue_ages = np.arange(self.qxs.shape[0])
+        survival = np.cumprod(self.pxs, axis=1)
+        select_end = self._attained_ages(self.select_period + 1)[:, -1]
+        ultimate_lxs = self._ultimate_lxs[select_end]
+        select_survival = survival[:, -1]
+        scaled = (select_survival > 0) & (ultimate_lxs > 0)
+        radix = np.where(
+            scaled,
+            np.divide(
+                ultimate_lxs,
+                select_survival,
+                out=np.zeros(issue_ages.size),
+                where=scaled,
+            ),
+            self._ultimate_lxs[np.minimum(issue_ages, self.ultimate.table_size)],
+        )
+        lxs = radix[:, np.newaxis] * np.insert(survival, 0, 1.0, axis=1)
+        lxs[:, -1] = np.where(scaled, ultimate_lxs, 0.0)
+        return lxs
+
+    def _index(
+        self, x: Union[int, Iterable, np.array], t: Union[int, Iterable, np.array]
+    ) -> Tuple[np.array, np.array, np.array, np.array, np.array]:
+        """
+        Args:
+            x: issue age or an array of issue ages
+            t: duration or an array of durations
+        Returns:
+            Whether [x] + t is within the select period, the row and
+            column of [x] + t in the select block, the ultimate column index
+            of the attained age x + t, and the scale of the ultimate
+            population at x + t after the select period
+        """
+        issue_ages, period = self.qxs.shape
+        selected = np.less(x, issue_ages)
+        row = np.minimum(x, issue_ages - 1)
+        return (
+            selected & np.less(t, period),
+            row,
+            np.minimum(t, period - 1),
+            np.minimum(np.add(x, t), self.ultimate.table_size),
+            np.where(selected, self._ultimate_scale[row], 1.0),
+        )
+
+    @validate_age
+    @validate_duration
+    def qx(
+        self, x: Union[int, Iterable, np.array], t: Union[int, Iterable, np.array] = 0
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: issue age
+            t: duration since selection
+        Returns:
+            The probability of failure between [x] + t and [x] + t + 1
+        """
+        select, row, duration, age, _ = self._index(x, t)
+        return np.where(select, self.qxs[row, duration], self._ultimate_qxs[age])[()]
+
+    @validate_age
+    @validate_duration
+    def px(
+        self, x: Union[int, Iterable, np.array], t: Union[int, Iterable, np.array] = 0
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: issue age
+            t: duration since selection
+        Returns:
+            The probability of survival between [x] + t and [x] + t + 1
+        """
+        return 1 - self.qx(x, t)
+
+    def _population(
+        self, x: Union[int, Iterable, np.array], t: Union[int, Iterable, np.array]
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: issue age or an array of issue ages
+            t: duration or an array of durations
+        Returns:
+            The population size at [x] + t
+        """
+        select, row, duration, age, scale = self._index(x, t)
+        return np.where(
+            select, self.lxs[row, duration], scale * self._ultimate_lxs[age]
+        )[()]
+
+    @validate_age
+    @validate_duration
+    def lx(
+        self, x: Union[int, Iterable, np.array], t: Union[int, Iterable, np.array] = 0
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: issue age
+            t: duration since selection
+        Returns:
+            The population size at [x] + t
+        """
+        return self._population(x, t)
+
+    @validate_age
+    @validate_duration
+    def dx(
+        self, x: Union[int, Iterable, np.array], t: Union[int, Iterable, np.array] = 0
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: issue age
+            t: duration since selection
+        Returns:
+            The number of failures between [x] + t and [x] + t + 1
+        """
+        return self._population(x, t) - self._population(x, np.add(t, 1))
+
+    @validate_interval
+    @validate_age
+    @validate_duration
+    def npx(
+        self,
+        n: Union[int, Iterable, np.array],
+        x: Union[int, Iterable, np.array],
+        t: Union[int, Iterable, np.array] = 0,
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            n: width of survival interval in years
+            x: issue age
+            t: duration since selection
+        Returns:
+            The probability of survival between [x] + t and [x] + t + n
+        """
+        start = np.asarray(self._population(x, t))
+        end = self._population(x, np.add(t, n))
+        return np.divide(end, start, out=np.zeros(np.shape(start)), where=start > 0)[()]
+
+    @validate_interval
+    @validate_age
+    @validate_duration
+    def nqx(
+        self,
+        n: Union[int, Iterable, np.array],
+        x: Union[int, Iterable, np.array],
+        t: Union[int, Iterable, np.array] = 0,
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            n: width of failure interval in years
+            x: issue age
+            t: duration since selection
+        Returns:
+            The probability of failure between [x] + t and [x] + t + n
+        """
+        return 1 - self.npx(n, x, t)
+
+    def commutation_columns(self, i: float) -> CommutationColumns:
+        """
+        The columns are built once per interest rate with reverse cumulative
+        sums along the durations and kept in a bounded least recently used
+        cache.  Column t of the select block is [x] + t, and the last column
+        is the end of the select period, from which the ultimate table's
+        commutation columns at age x + t apply.
+
+        Args:
+            i: interest rate
+        Returns:
+            The Dx, Nx, Sx, Cx, Mx, and Rx columns as (issue ages x select
+            period + 1) matrices indexed by [x] + t
+        """
+        return self._commutation_columns(float(i))
+
+    def _calculate_commutation_columns(self, i: float) -> CommutationColumns:
+        """
+        The durations of the select period are summed onto the ultimate
+        commutation columns at the end of the select period.
+
+        Args:
+            i: interest rate
+        Returns:
+            The Dx, Nx, Sx, Cx, Mx, and Rx columns as (issue ages x select
+            period + 1) matrices indexed by [x] + t
+        """
+        ages = self._attained_ages(self.select_period + 1)
+        discount_factors = np.power(
+            discount_factor(i),
+            np.arange(self.lxs.shape[0])[:, np.newaxis]
+            + np.arange(self.lxs.shape[1], dtype=float),
+        )
+        ultimate = self.ultimate.commutation_columns(i)
+        end = ages[:, -1]
+        scale = self._ultimate_scale
+
+        def summed(column: np.array, tail: np.array) -> np.array:
+            return _reverse_cumsum(np.column_stack((column[:, :-1], scale * tail)))
+
+        Dxs = self.lxs * discount_factors
+        Cxs = np.column_stack(
+            (
+                self.dxs * discount_factors[:, 1:],
+                scale * ultimate.Cxs[end],
+            )
+        )
+        Nxs = summed(Dxs, ultimate.Nxs[end])
+        Mxs = summed(Cxs, ultimate.Mxs[end])
+        columns = CommutationColumns(
+            Dxs=Dxs,
+            Nxs=Nxs,
+            Sxs=summed(Nxs, ultimate.Sxs[end]),
+            Cxs=Cxs,
+            Mxs=Mxs,
+            Rxs=summed(Mxs, ultimate.Rxs[end]),
+        )
+        for column in columns:
+            column.setflags(write=False)
+        return columns
+
+    def _commutations(
+        self, i: Union[float, Iterable, np.array]
+    ) -> Tuple[CommutationColumns, CommutationColumns, Union[type(Ellipsis), np.array]]:
+        """
+        Args:
+            i: interest rate or an array of interest rates
+        Returns:
+            The select block and ultimate commutation columns, stacked into
+            (rates x ...) arrays for an array of interest rates, and the
+            index of each interest rate, or an Ellipsis for a single rate
+        """
+        if np.ndim(i) == 0:
+            return (
+                self.commutation_columns(i),
+                self.ultimate.commutation_columns(i),
+                Ellipsis,
+            )
+        rates, index = np.unique(i, return_inverse=True)
+        return (
+            CommutationColumns(
+                *(
+                    np.stack(column)
+                    for column in zip(*(self.commutation_columns(r) for r in rates))
+                )
+            ),
+            CommutationColumns(
+                *(
+                    np.stack(column)
+                    for column in zip(
+                        *(self.ultimate.commutation_columns(r) for r in rates)
+                    )
+                )
+            ),
+            index.reshape(np.shape(i)),
+        )
+
+    def _values(
+        self,
+        columns: Tuple[CommutationColumns, CommutationColumns, np.array],
+        column: str,
+        x: Union[int, Iterable, np.array],
+        t: Union[int, Iterable, np.array],
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            columns: the commutation columns and rate index of _commutations
+            column: name of the commutation column, e.g. 'Nxs'
+            x: issue age or an array of issue ages
+            t: duration or an array of durations
+        Returns:
+            The commutation column values at [x] + t
+        """
+        select_columns, ultimate_columns, r = columns
+        select, row, duration, age, scale = self._index(x, t)
+        return np.where(
+            select,
+            getattr(select_columns, column)[r, row, duration],
+            scale * getattr(ultimate_columns, column)[r, age],
+        )[()]
+
+    def _commutation(
+        self,
+        column: str,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array],
+        t: Union[int, Iterable, np.array],
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            column: name of the commutation column, e.g. 'Nxs'
+            x: issue age or an array of issue ages
+            i: interest rate or an array of interest rates
+            t: duration or an array of durations
+        Returns:
+            The commutation column values at [x] + t
+        """
+        return self._values(self._commutations(i), column, x, t)
+
+    @validate_age
+    @validate_duration
+    def Dx(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array],
+        t: Union[int, Iterable, np.array] = 0,
+    ) -> Union[float, np.array]:
+        """
+        Actuarial commutation function D[x]+t
+
+        Args:
+            x: issue age
+            i: interest rate
+            t: duration since selection
+        Returns:
+            Population at [x] + t discounted for x + t years
+        """
+        return self._commutation("Dxs", x, i, t)
+
+    @validate_age
+    @validate_duration
+    def Nx(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array],
+        t: Union[int, Iterable, np.array] = 0,
+    ) -> Union[float, np.array]:
+        """
+        Actuarial commutation function N[x]+t
+
+        Args:
+            x: issue age
+            i: interest rate
+            t: duration since selection
+        Returns:
+            Sum of Ds from [x] + t and onward
+        """
+        return self._commutation("Nxs", x, i, t)
+
+    @validate_age
+    @validate_duration
+    def Sx(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array],
+        t: Union[int, Iterable, np.array] = 0,
+    ) -> Union[float, np.array]:
+        """
+        Actuarial commutation function S[x]+t
+
+        Args:
+            x: issue age
+            i: interest rate
+            t: duration since selection
+        Returns:
+            Sum of Ns from [x] + t and onward
+        """
+        return self._commutation("Sxs", x, i, t)
+
+    @validate_age
+    @validate_duration
+    def Cx(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array],
+        t: Union[int, Iterable, np.array] = 0,
+    ) -> Union[float, np.array]:
+        """
+        Actuarial commutation function C[x]+t
+
+        Args:
+            x: issue age
+            i: interest rate
+            t: duration since selection
+        Returns:
+            Failures between [x] + t and [x] + t + 1 discounted for
+            x + t + 1 years
+        """
+        return self._commutation("Cxs", x, i, t)
+
+    @validate_age
+    @validate_duration
+    def Mx(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array],
+        t: Union[int, Iterable, np.array] = 0,
+    ) -> Union[float, np.array]:
+        """
+        Actuarial commutation function M[x]+t
+
+        Args:
+            x: issue age
+            i: interest rate
+            t: duration since selection
+        Returns:
+            Sum of Cs from [x] + t and onward
+        """
+        return self._commutation("Mxs", x, i, t)
+
+    @validate_age
+    @validate_duration
+    def Rx(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array],
+        t: Union[int, Iterable, np.array] = 0,
+    ) -> Union[float, np.array]:
+        """
+        Actuarial commutation function R[x]+t
+
+        Args:
+            x: issue age
+            i: interest rate
+            t: duration since selection
+        Returns:
+            Sum of Ms from [x] + t and onward
+        """
+        return self._commutation("Rxs", x, i, t)
+
+    @validate_age
+    @validate_duration
+    def Ax(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array],
+        t: Union[int, Iterable, np.array] = 0,
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: issue age
+            i: interest rate
+            t: duration since selection
+        Returns:
+            Actuarial present value of level whole insurance at [x] + t
+        """
+        c = self._commutations(i)
+        return self._values(c, "Mxs", x, t) / self._values(c, "Dxs", x, t)
+
+    @validate_age
+    @validate_interval
+    @validate_duration
+    def Axn(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array],
+        n: Union[int, Iterable, np.array],
+        t: Union[int, Iterable, np.array] = 0,
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: issue age
+            i: interest rate
+            n: number of periods in the temporary insurance
+            t: duration since selection
+        Returns:
+            Actuarial present value of level temporary insurance at [x] + t
+        """
+        c = self._commutations(i)
+        return (
+            self._values(c, "Mxs", x, t) - self._values(c, "Mxs", x, np.add(t, n))
+        ) / self._values(c, "Dxs", x, t)
+
+    @validate_age
+    @validate_duration
+    def IAx(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array],
+        t: Union[int, Iterable, np.array] = 0,
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: issue age
+            i: interest rate
+            t: duration since selection
+        Returns:
+            Actuarial present value of increasing whole insurance at [x] + t
+        """
+        c = self._commutations(i)
+        return self._values(c, "Rxs", x, t) / self._values(c, "Dxs", x, t)
+
+    @validate_age
+    @validate_interval
+    @validate_duration
+    def IAxn(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array],
+        n: Union[int, Iterable, np.array],
+        t: Union[int, Iterable, np.array] = 0,
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: issue age
+            i: interest rate
+            n: number of periods in the temporary insurance
+            t: duration since selection
+        Returns:
+            Actuarial present value of increasing temporary insurance at
+            [x] + t
+        """
+        c = self._commutations(i)
+        end = np.add(t, n)
+        return (
+            self._values(c, "Rxs", x, t)
+            - self._values(c, "Rxs", x, end)
+            - np.multiply(n, self._values(c, "Mxs", x, end))
+        ) / self._values(c, "Dxs", x, t)
+
+    @validate_age
+    @validate_duration
+    def ax(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array],
+        t: Union[int, Iterable, np.array] = 0,
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: issue age
+            i: interest rate
+            t: duration since selection
+        Returns:
+            Actuarial present value of a level perpetuity at [x] + t
+        """
+        c = self._commutations(i)
+        return self._values(c, "Nxs", x, np.add(t, 1)) / self._values(c, "Dxs", x, t)
+
+    @validate_age
+    @validate_interval
+    @validate_duration
+    def axn(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array],
+        n: Union[int, Iterable, np.array],
+        t: Union[int, Iterable, np.array] = 0,
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: issue age
+            i: interest rate
+            n: length of payments
+            t: duration since selection
+        Returns:
+            Actuarial present value of a temporary annuity at [x] + t
+        """
+        c = self._commutations(i)
+        return (
+            self._values(c, "Nxs", x, np.add(t, 1))
+            - self._values(c, "Nxs", x, np.add(t, n) + 1)
+        ) / self._values(c, "Dxs", x, t)
+
+    @validate_age
+    @validate_duration
+    def ax_due(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array],
+        t: Union[int, Iterable, np.array] = 0,
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: issue age
+            i: interest rate
+            t: duration since selection
+        Returns:
+            Actuarial present value of a level perpetuity due at [x] + t
+        """
+        c = self._commutations(i)
+        return self._values(c, "Nxs", x, t) / self._values(c, "Dxs", x, t)
+
+    @validate_age
+    @validate_interval
+    @validate_duration
+    def axn_due(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array],
+        n: Union[int, Iterable, np.array],
+        t: Union[int, Iterable, np.array] = 0,
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: issue age
+            i: interest rate
+            n: length of payments
+            t: duration since selection
+        Returns:
+            Actuarial present value of a temporary annuity due at [x] + t
+        """
+        c = self._commutations(i)
+        return (
+            self._values(c, "Nxs", x, t) - self._values(c, "Nxs", x, np.add(t, n))
+        ) / self._values(c, "Dxs", x, t)
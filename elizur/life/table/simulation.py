@@ -0,0 +1,259 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+from elizur.life.annuity import annuity_due_pv, annuity_pv, discount_factor
+from elizur.life.table.fractional import (
+    BALDUCCI,
+    CONSTANT_FORCE,
+    FRACTIONAL_AGE_ASSUMPTIONS,
+    UDD,
+)
+from elizur.life.table.table import BENEFITS, TERM_BENEFITS, LifeTable
+from elizur.life.util import InvalidAge, InvalidAssumption, validate_age
+
+SIMULATED_BENEFITS = BENEFITS
+
+
+class InvalidSimulation(Exception):
+    """
+    Custom exception raised for invalid lifetime simulation inputs
+    """
+
+
+def _seed_sequence(
+    seed: Union[None, int, np.random.SeedSequence],
+) -> np.random.SeedSequence:
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    return np.random.SeedSequence(seed)
+
+
+def _chunk_generator(
+    seed_sequence: np.random.SeedSequence, chunk: int
+) -> np.random.Generator:
+    """
+    Returns:
+        The Generator of an independent stream for each chunk.  The streams
+        are derived from the spawn key rather than spawned, so the same seed
+        sequence always produces the same streams.
+    """
+    return np.random.default_rng(
+        np.random.SeedSequence(
+            seed_sequence.entropy, spawn_key=(*seed_sequence.spawn_key, chunk)
+        )
+    )
+
+
+def _lives(
+    table: LifeTable,
+    x: Union[int, Iterable, np.array],
+    size: Union[None, int, Tuple[int, ...]],
+    assumption: Optional[str],
+) -> np.array:
+    """
+    Returns:
+        The start age of every simulated life, a read-only broadcast view of
+        the ages, e.g. one age repeated for every life
+    """
+    if assumption is not None and assumption not in FRACTIONAL_AGE_ASSUMPTIONS:
+        raise InvalidAssumption(
+            f"Unknown fractional age assumption {assumption}! The assumption "
+            f"must be one of {FRACTIONAL_AGE_ASSUMPTIONS}."
+        )
+    ages = np.asarray(x)
+    if not np.issubdtype(ages.dtype, np.integer):
+        raise InvalidAge("Simulated start ages must be integers!")
+    if np.any(ages > table.w):
+        raise InvalidAge(
+            f"Simulated start ages must be at most the limiting age {table.w}!"
+        )
+    return np.broadcast_to(ages, np.shape(ages) if size is None else size)
+
+
+def _simulate(
+    table: LifeTable,
+    ages: np.array,
+    generator: np.random.Generator,
+    assumption: Optional[str],
+) -> np.array:
+    """
+    Samples the future lifetimes of lives by inverse transform of their
+    distribution of deaths.  A uniform draw places each death within the
+    deaths after its start age, and the cumulative deaths column locates
+    the year of death with a binary search.
+
+    Returns:
+        The curtate future lifetimes of the lives, or the complete future
+        lifetimes under the fractional age assumption
+    """
+    lxs = table._padded_lxs  # pylint: disable=protected-access
+    cumulative_deaths = lxs[0] - lxs[1:]
+    deaths = lxs[0] - lxs[ages] + generator.random(ages.shape) * lxs[ages]
+    years = np.minimum(
+        np.searchsorted(cumulative_deaths, deaths, side="right"), table.table_size - 1
+    )
+    if assumption is None:
+        return years - ages
+    # the share of the deaths of the year of death before each death
+    share = np.clip(
+        (deaths - lxs[0] + lxs[years]) / (lxs[years] - lxs[years + 1]), 0, 1
+    )
+    pxs = lxs[years + 1] / lxs[years]
+    if assumption == UDD:
+        fractions = share
+    elif assumption == CONSTANT_FORCE:
+        with np.errstate(divide="ignore"):
+            fractions = np.log1p(-share * (1 - pxs)) / np.log(pxs)
+    elif assumption == BALDUCCI:
+        fractions = share * pxs / (1 - share * (1 - pxs))
+    return years - ages + np.minimum(fractions, 1.0)
+
+
+@validate_age
+def simulate_lifetime_chunks(
+    table: LifeTable,
+    x: Union[int, Iterable, np.array],
+    size: Union[None, int, Tuple[int, ...]] = None,
+    assumption: Optional[str] = None,
+    seed: Union[None, int, np.random.SeedSequence] = None,
+    chunk_size: int = 1000000,
+) -> Iterator[np.array]:
+    # pylint: disable=too-many-arguments
+    """
+    Simulates future lifetimes in chunks of lives so that only one chunk is
+    held in memory at a time.  Each chunk draws from its own independent
+    random stream derived from the seed.
+
+    Args:
+        table: LifeTable of the lives
+        x: start age or an array of start ages
+        size: number of lives, or shape of the lives the ages broadcast to,
+              defaults to one life per start age
+        assumption: None for curtate future lifetimes, or the fractional age
+                    assumption of complete future lifetimes, one of 'udd',
+                    'constant_force', or 'balducci'
+        seed: seed or SeedSequence of the random streams
+        chunk_size: number of lives in each chunk
+
+    Returns:
+        A generator of the flattened future lifetimes of each chunk of lives
+    """
+    ages = _lives(table, x, size, assumption)
+    seed_sequence = _seed_sequence(seed)
+
+    def chunks() -> Iterator[np.array]:
+        for chunk, start in enumerate(range(0, ages.size, chunk_size)):
+            stop = start + chunk_size
+            yield _simulate(
+                table,
+                ages.flat[start:stop],
+                _chunk_generator(seed_sequence, chunk),
+                assumption,
+            )
+
+    return chunks()
+
+
+@validate_age
+def simulate_lifetimes(
+    table: LifeTable,
+    x: Union[int, Iterable, np.array],
+    size: Union[None, int, Tuple[int, ...]] = None,
+    assumption: Optional[str] = None,
+    seed: Union[None, int, np.random.SeedSequence] = None,
+    chunk_size: int = 1000000,
+    max_workers: Optional[int] = None,
+) -> np.array:
+    # pylint: disable=too-many-arguments
+    """
+    Simulates the future lifetimes of many lives at once.  The lives are
+    split into chunks that each draw from an independent random stream, so
+    the result only depends on the seed and the chunk size, and chunks can
+    be simulated by a pool of threads.
+
+    Args:
+        table: LifeTable of the lives
+        x: start age or an array of start ages
+        size: number of lives, or shape of the lives the ages broadcast to,
+              defaults to one life per start age
+        assumption: None for curtate future lifetimes, or the fractional age
+                    assumption of complete future lifetimes, one of 'udd',
+                    'constant_force', or 'balducci'
+        seed: seed or SeedSequence of the random streams
+        chunk_size: number of lives in each chunk
+        max_workers: number of threads simulating chunks, defaults to
+                     simulating chunks in the calling thread
+
+    Returns:
+        The future lifetime of each life, integers for curtate lifetimes
+
+    Example:
+        lifetimes = simulate_lifetimes(life_table, 40, size=1000000, seed=42)
+        simulated_present_values(lifetimes, 0.05, "Ax").mean()
+    """
+    ages = _lives(table, x, size, assumption)
+    seed_sequence = _seed_sequence(seed)
+    lifetimes = np.empty(ages.shape, dtype=int if assumption is None else float)
+    flat = lifetimes.reshape(-1)
+
+    def simulate_chunk(chunk: int) -> None:
+        start = chunk * chunk_size
+        stop = min(start + chunk_size, ages.size)
+        flat[start:stop] = _simulate(
+            table,
+            ages.flat[start:stop],
+            _chunk_generator(seed_sequence, chunk),
+            assumption,
+        )
+
+    chunks = range(-(-ages.size // chunk_size))
+    if max_workers is None:
+        for chunk in chunks:
+            simulate_chunk(chunk)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(simulate_chunk, chunks))
+    return lifetimes
+
+
+def simulated_present_values(
+    lifetimes: Union[Iterable, np.array],
+    i: Union[float, Iterable, np.array],
+    benefit: str,
+    n: Union[None, int, Iterable, np.array] = None,
+) -> np.array:
+    """
+    Args:
+        lifetimes: simulated curtate future lifetimes
+        i: interest rate
+        benefit: one of SIMULATED_BENEFITS, the name of the LifeTable
+                 actuarial present value whose present value is simulated
+        n: number of periods of temporary benefits
+
+    Returns:
+        The present value of the benefit of each simulated life, whose mean
+        is the actuarial present value of the benefit
+    """
+    if benefit not in SIMULATED_BENEFITS:
+        raise InvalidSimulation(
+            f"Unknown benefit {benefit}! The benefit must be one of "
+            f"{SIMULATED_BENEFITS}."
+        )
+    lifetimes = np.asarray(lifetimes)
+    if benefit in TERM_BENEFITS:
+        if n is None:
+            raise InvalidSimulation(f"The benefit {benefit} requires a term n!")
+        covered = lifetimes < np.asarray(n)
+    else:
+        covered = True
+        n = lifetimes + 1
+    if benefit in ("ax", "axn"):
+        return annuity_pv(np.minimum(lifetimes, n), i)
+    if benefit in ("ax_due", "axn_due"):
+        return annuity_due_pv(np.minimum(lifetimes + 1, n), i)
+    present_values = np.power(discount_factor(i), lifetimes + 1) * covered
+    if benefit.startswith("IA"):
+        present_values = present_values * (lifetimes + 1)
+    return present_values
@@ -0,0 +1,594 @@
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from itertools import combinations
+from typing import Iterable, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from elizur.life.annuity import discount_factor
+from elizur.life.table.table import (
+    CommutationColumns,
+    LifeTable,
+    _build_commutation_columns,
+)
+from elizur.life.util import InvalidAge, validate_age, validate_interval
+
+Ages = Sequence[Union[int, Iterable, np.array]]
+
+
+class InvalidStatus(Exception):
+    """
+    Custom exception raised for invalid multiple life statuses
+    """
+
+
+class _Status(ABC):
+    """
+    Shared survival calculations of statuses of independent lives.
+
+    Args:
+        tables: one LifeTable per life of the status
+    """
+
+    def __init__(self, *tables: LifeTable):
+        if not tables:
+            raise InvalidStatus("A status needs at least one LifeTable!")
+        self.tables = tables
+        # pylint: disable=protected-access
+        self._lxs = [table._padded_lxs for table in tables]
+
+    def _ages(self, x: Ages) -> List[np.array]:
+        """
+        Args:
+            x: the ages of each life
+
+        Returns:
+            The broadcast integer ages of each life
+        """
+        if not hasattr(x, "__len__") or len(x) != len(self.tables):
+            raise InvalidStatus(
+                f"The status needs one age for each of its {len(self.tables)} lives!"
+            )
+        ages = [np.asarray(age) for age in x]
+        if not all(np.issubdtype(age.dtype, np.integer) for age in ages):
+            raise InvalidAge("Status ages must be integers!")
+        return np.broadcast_arrays(*ages)
+
+    def _life_survival(
+        self, t: Union[int, Iterable, np.array], ages: List[np.array]
+    ) -> List[np.array]:
+        """
+        Args:
+            t: duration or an array of durations
+            ages: the broadcastable ages of each life
+
+        Returns:
+            The probability each life survives t years
+        """
+        survival = []
+        for table, lxs, age in zip(self.tables, self._lxs, ages):
+            start = lxs[np.minimum(age, table.table_size)]
+            end = lxs[np.minimum(np.add(age, t), table.table_size)]
+            survival.append(
+                np.divide(
+                    end,
+                    start,
+                    out=np.zeros(np.broadcast(end, start).shape),
+                    where=start > 0,
+                )
+            )
+        return survival
+
+    @staticmethod
+    @abstractmethod
+    def _combine(survival: List[np.array]) -> np.array:
+        """
+        Args:
+            survival: the survival probability of each life
+
+        Returns:
+            The survival probability of the status
+        """
+
+    @validate_age
+    def tpxy(
+        self, t: Union[int, Iterable, np.array], x: Ages
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            t: duration or an array of durations
+            x: the ages of each life, each a scalar or an array
+
+        Returns:
+            The probability the status survives t years
+        """
+        return self._combine(self._life_survival(t, self._ages(x)))[()]
+
+    def tpxys(self, t: Union[int, Iterable, np.array]) -> np.array:
+        """
+        Args:
+            t: duration or an array of durations
+
+        Returns:
+            The probability the status survives t years for every
+            combination of ages, an array of (ages of the first life x ages
+            of the second life x ...) with a trailing axis of durations when
+            t is an array
+        """
+        lives = len(self.tables)
+        ages = []
+        for life, table in enumerate(self.tables):
+            shape = [1] * lives + [1] * np.ndim(t)
+            shape[life] = table.table_size
+            ages.append(np.arange(table.table_size).reshape(shape))
+        return self._combine(self._life_survival(t, ages))
+
+
+class JointLifeStatus(_Status):
+    """
+    The joint life status of independent lives, which survives while every
+    life survives.  The commutation columns of the status are indexed by the
+    age of the first life and built once for each interest rate and set of
+    age differences between the lives, so actuarial present values of every
+    age combination sharing those differences are fancy indexed from the
+    same columns.
+
+    Args:
+        tables: one LifeTable per life of the status
+        commutation_cache_size: the number of interest rate and age
+                                difference combinations to keep commutation
+                                columns cached for
+
+    Example:
+        status = JointLifeStatus(male_table, female_table)
+        status.Axy((65, 62), 0.05)
+        status.axy_due(([65, 70], [62, 66]), 0.05)
+    """
+
+    def __init__(self, *tables: LifeTable, commutation_cache_size: int = 16):
+        super().__init__(*tables)
+        self._commutation_columns = lru_cache(maxsize=commutation_cache_size)(
+            self._calculate_commutation_columns
+        )
+
+    @staticmethod
+    def _combine(survival: List[np.array]) -> np.array:
+        return np.prod(np.broadcast_arrays(*survival), axis=0)
+
+    def commutation_columns(
+        self, i: float, offsets: Tuple[int, ...] = ()
+    ) -> CommutationColumns:
+        """
+        Args:
+            i: interest rate
+            offsets: age of each life after the first minus the age of the
+                     first life, defaults to lives of equal age
+
+        Returns:
+            The Dx, Nx, Sx, Cx, Mx, and Rx columns of the status indexed by
+            the age of the first life
+        """
+        offsets = tuple(int(offset) for offset in offsets) or (0,) * (
+            len(self.tables) - 1
+        )
+        if len(offsets) != len(self.tables) - 1:
+            raise InvalidStatus(f"The status needs {len(self.tables) - 1} age offsets!")
+        return self._commutation_columns(float(i), offsets)
+
+    def _calculate_commutation_columns(
+        self, i: float, offsets: Tuple[int, ...]
+    ) -> CommutationColumns:
+        """
+        Args:
+            i: interest rate
+            offsets: age of each life after the first minus the age of the
+                     first life
+
+        Returns:
+            The Dx, Nx, Sx, Cx, Mx, and Rx columns of the status indexed by
+            the age of the first life
+        """
+        offsets = (0, *offsets)
+        size = max(
+            min(
+                table.table_size - offset for table, offset in zip(self.tables, offsets)
+            ),
+            0,
+        )
+        ages = np.arange(size + 1)
+        lxs = np.ones(size + 1)
+        for table, table_lxs, offset in zip(self.tables, self._lxs, offsets):
+            lxs = lxs * table_lxs[np.clip(ages + offset, 0, table.table_size)]
+        lxs[size] = 0.0
+        discount_factors = np.power(discount_factor(i), ages.astype(float))
+        return _build_commutation_columns(lxs, discount_factors)
+
+    def _commutations(
+        self, x: Ages, i: Union[float, Iterable, np.array]
+    ) -> Tuple[CommutationColumns, np.array, np.array, int]:
+        """
+        Args:
+            x: the ages of each life
+            i: interest rate or an array of interest rates
+
+        Returns:
+            The commutation columns of each distinct interest rate and set of
+            age offsets stacked into (keys x ages) matrices, the row index of
+            each input, the age of the first life, and the last column index
+        """
+        ages = self._ages(x)
+        rates, first = np.broadcast_arrays(np.asarray(i, dtype=float), ages[0])
+        ages = [np.broadcast_to(age, first.shape) for age in ages]
+        keys = np.stack(
+            [rates.ravel()] + [(age - first).ravel() for age in ages[1:]], axis=1
+        )
+        unique_keys, rows = np.unique(keys, axis=0, return_inverse=True)
+        columns = [
+            self.commutation_columns(key[0], key[1:].astype(int)) for key in unique_keys
+        ]
+        last = max(column.Dxs.size for column in columns) - 1
+        stacked = CommutationColumns(
+            *(
+                np.stack(
+                    [
+                        np.pad(column, (0, last + 1 - column.size))
+                        for column in column_set
+                    ]
+                )
+                for column_set in zip(*columns)
+            )
+        )
+        return stacked, rows.reshape(first.shape), first, last
+
+    def _values(
+        self,
+        commutations: Tuple[CommutationColumns, np.array, np.array, int],
+        column: str,
+        n: Union[int, Iterable, np.array] = 0,
+    ) -> np.array:
+        """
+        Args:
+            commutations: the stacked columns, row index, first age, and last
+                          column index of _commutations
+            column: name of the commutation column, e.g. 'Mxs'
+            n: years after the first age to read the column at
+
+        Returns:
+            The column values at the first age plus n
+        """
+        c, r, first, last = commutations
+        return getattr(c, column)[r, np.minimum(np.add(first, n), last)]
+
+    @validate_age
+    def Axy(
+        self, x: Ages, i: Union[float, Iterable, np.array]
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: the ages of each life
+            i: interest rate
+        Returns:
+            Actuarial present value of level whole insurance on the status
+        """
+        c = self._commutations(x, i)
+        return (self._values(c, "Mxs") / self._values(c, "Dxs"))[()]
+
+    @validate_age
+    @validate_interval
+    def Axyn(
+        self,
+        x: Ages,
+        i: Union[float, Iterable, np.array],
+        n: Union[int, Iterable, np.array],
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: the ages of each life
+            i: interest rate
+            n: number of periods in the temporary insurance
+        Returns:
+            Actuarial present value of level temporary insurance on the status
+        """
+        c = self._commutations(x, i)
+        return (
+            (self._values(c, "Mxs") - self._values(c, "Mxs", n))
+            / self._values(c, "Dxs")
+        )[()]
+
+    @validate_age
+    def IAxy(
+        self, x: Ages, i: Union[float, Iterable, np.array]
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: the ages of each life
+            i: interest rate
+        Returns:
+            Actuarial present value of increasing whole insurance on the
+            status
+        """
+        c = self._commutations(x, i)
+        return (self._values(c, "Rxs") / self._values(c, "Dxs"))[()]
+
+    @validate_age
+    @validate_interval
+    def IAxyn(
+        self,
+        x: Ages,
+        i: Union[float, Iterable, np.array],
+        n: Union[int, Iterable, np.array],
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: the ages of each life
+            i: interest rate
+            n: number of periods in the temporary insurance
+        Returns:
+            Actuarial present value of increasing temporary insurance on the
+            status
+        """
+        c = self._commutations(x, i)
+        return (
+            (
+                self._values(c, "Rxs")
+                - self._values(c, "Rxs", n)
+                - np.multiply(n, self._values(c, "Mxs", n))
+            )
+            / self._values(c, "Dxs")
+        )[()]
+
+    @validate_age
+    def axy(
+        self, x: Ages, i: Union[float, Iterable, np.array]
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: the ages of each life
+            i: interest rate
+        Returns:
+            Actuarial present value of a level perpetuity on the status
+        """
+        c = self._commutations(x, i)
+        return (self._values(c, "Nxs", 1) / self._values(c, "Dxs"))[()]
+
+    @validate_age
+    @validate_interval
+    def axyn(
+        self,
+        x: Ages,
+        i: Union[float, Iterable, np.array],
+        n: Union[int, Iterable, np.array],
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: the ages of each life
+            i: interest rate
+            n: length of payments
+        Returns:
+            Actuarial present value of a temporary annuity on the status
+        """
+        c = self._commutations(x, i)
+        return (
+            (self._values(c, "Nxs", 1) - self._values(c, "Nxs", np.add(n, 1)))
+            / self._values(c, "Dxs")
+        )[()]
+
+    @validate_age
+    def axy_due(
+        self, x: Ages, i: Union[float, Iterable, np.array]
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: the ages of each life
+            i: interest rate
+        Returns:
+            Actuarial present value of a level perpetuity due on the status
+        """
+        c = self._commutations(x, i)
+        return (self._values(c, "Nxs") / self._values(c, "Dxs"))[()]
+
+    @validate_age
+    @validate_interval
+    def axyn_due(
+        self,
+        x: Ages,
+        i: Union[float, Iterable, np.array],
+        n: Union[int, Iterable, np.array],
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: the ages of each life
+            i: interest rate
+            n: length of payments
+        Returns:
+            Actuarial present value of a temporary annuity due on the status
+        """
+        c = self._commutations(x, i)
+        return (
+            (self._values(c, "Nxs") - self._values(c, "Nxs", n))
+            / self._values(c, "Dxs")
+        )[()]
+
+
+class LastSurvivorStatus(_Status):
+    """
+    The last survivor status of independent lives, which survives while any
+    life survives.  Every actuarial present value is linear in the survival
+    probabilities of the status, so they are built by inclusion-exclusion
+    from the cached joint life statuses of each subset of the lives, e.g.
+    the last survivor whole insurance of two lives is Ax + Ay - Axy.
+
+    Args:
+        tables: one LifeTable per life of the status
+        commutation_cache_size: the number of interest rate and age
+                                difference combinations each joint life
+                                status keeps commutation columns cached for
+
+    Example:
+        status = LastSurvivorStatus(male_table, female_table)
+        status.axy_due((65, 62), 0.05)
+    """
+
+    def __init__(self, *tables: LifeTable, commutation_cache_size: int = 16):
+        super().__init__(*tables)
+        self._subsets = [
+            (
+                (-1) ** (len(lives) + 1),
+                lives,
+                JointLifeStatus(
+                    *(tables[life] for life in lives),
+                    commutation_cache_size=commutation_cache_size,
+                ),
+            )
+            for size in range(1, len(tables) + 1)
+            for lives in combinations(range(len(tables)), size)
+        ]
+
+    @staticmethod
+    def _combine(survival: List[np.array]) -> np.array:
+        return 1 - np.prod(1 - np.array(np.broadcast_arrays(*survival)), axis=0)
+
+    def _inclusion_exclusion(
+        self, name: str, x: Ages, *args: Union[float, int, Iterable, np.array]
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            name: name of the joint life status method, e.g. 'Axy'
+            x: the ages of each life
+            args: the remaining method arguments, e.g. the interest rate
+
+        Returns:
+            The signed sum of the method over the joint life status of every
+            subset of the lives
+        """
+        ages = self._ages(x)
+        return sum(
+            sign * getattr(status, name)(tuple(ages[life] for life in lives), *args)
+            for sign, lives, status in self._subsets
+        )
+
+    @validate_age
+    def Axy(
+        self, x: Ages, i: Union[float, Iterable, np.array]
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: the ages of each life
+            i: interest rate
+        Returns:
+            Actuarial present value of level whole insurance on the status
+        """
+        return self._inclusion_exclusion("Axy", x, i)
+
+    @validate_age
+    @validate_interval
+    def Axyn(
+        self,
+        x: Ages,
+        i: Union[float, Iterable, np.array],
+        n: Union[int, Iterable, np.array],
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: the ages of each life
+            i: interest rate
+            n: number of periods in the temporary insurance
+        Returns:
+            Actuarial present value of level temporary insurance on the status
+        """
+        return self._inclusion_exclusion("Axyn", x, i, n)
+
+    @validate_age
+    def IAxy(
+        self, x: Ages, i: Union[float, Iterable, np.array]
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: the ages of each life
+            i: interest rate
+        Returns:
+            Actuarial present value of increasing whole insurance on the
+            status
+        """
+        return self._inclusion_exclusion("IAxy", x, i)
+
+    @validate_age
+    @validate_interval
+    def IAxyn(
+        self,
+        x: Ages,
+        i: Union[float, Iterable, np.array],
+        n: Union[int, Iterable, np.array],
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: the ages of each life
+            i: interest rate
+            n: number of periods in the temporary insurance
+        Returns:
+            Actuarial present value of increasing temporary insurance on the
+            status
+        """
+        return self._inclusion_exclusion("IAxyn", x, i, n)
+
+    @validate_age
+    def axy(
+        self, x: Ages, i: Union[float, Iterable, np.array]
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: the ages of each life
+            i: interest rate
+        Returns:
+            Actuarial present value of a level perpetuity on the status
+        """
+        return self._inclusion_exclusion("axy", x, i)
+
+    @validate_age
+    @validate_interval
+    def axyn(
+        self,
+        x: Ages,
+        i: Union[float, Iterable, np.array],
+        n: Union[int, Iterable, np.array],
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: the ages of each life
+            i: interest rate
+            n: length of payments
+        Returns:
+            Actuarial present value of a temporary annuity on the status
+        """
+        return self._inclusion_exclusion("axyn", x, i, n)
+
+    @validate_age
+    def axy_due(
+        self, x: Ages, i: Union[float, Iterable, np.array]
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: the ages of each life
+            i: interest rate
+        Returns:
+            Actuarial present value of a level perpetuity due on the status
+        """
+        return self._inclusion_exclusion("axy_due", x, i)
+
+    @validate_age
+    @validate_interval
+    def axyn_due(
+        self,
+        x: Ages,
+        i: Union[float, Iterable, np.array],
+        n: Union[int, Iterable, np.array],
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: the ages of each life
+            i: interest rate
+            n: length of payments
+        Returns:
+            Actuarial present value of a temporary annuity due on the status
+        """
+        return self._inclusion_exclusion("axyn_due", x, i, n)
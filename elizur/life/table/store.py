@@ -0,0 +1,120 @@
+import json
+import os
+from typing import Dict, Iterator, Mapping
+
+import numpy as np
+
+from elizur.life.table.table import STORED_COLUMNS, LifeTable
+
+_INDEX_SUFFIX = ".json"
+_STORE_VERSION = 1
+
+
+class InvalidTableStore(Exception):
+    """
+    Custom exception raised for table stores that cannot be opened
+    """
+
+
+def _column_sizes(table_size: int) -> Dict[str, int]:
+    """
+    Args:
+        table_size: number of failure probabilities in the table
+
+    Returns:
+        The length of each stored column in the order of a table's block
+    """
+    padded = {"lxs", "txs", "_padded_lxs", "_padded_exs"}
+    return {
+        column: table_size + 1 if column in padded else table_size
+        for column in STORED_COLUMNS
+    }
+
+
+def write_table_store(path, tables: Mapping[str, LifeTable]) -> None:
+    """
+    Writes life tables to an on-disk store that TableStore memory maps.
+    Each table's columns are written as one contiguous float64 block of the
+    data file and a json index next to it (path + '.json') records the offset,
+    size, name, and description of each table.
+
+    Args:
+        path: file system path of the data file
+        tables: LifeTables keyed by the name used to open them from the store
+    """
+    index = {"version": _STORE_VERSION, "tables": {}}
+    offset = 0
+    with open(path, "wb") as data:
+        for key, life_table in tables.items():
+            for column, size in _column_sizes(life_table.table_size).items():
+                np.ascontiguousarray(
+                    getattr(life_table, column)[:size], dtype=float
+                ).tofile(data)
+            index["tables"][str(key)] = {
+                "offset": offset,
+                "table_size": life_table.table_size,
+                "name": life_table.name,
+                "description": life_table.description,
+            }
+            offset += sum(_column_sizes(life_table.table_size).values())
+    with open(os.fspath(path) + _INDEX_SUFFIX, "w", encoding="utf-8") as index_file:
+        json.dump(index, index_file)
+
+
+class TableStore(Mapping):
+    """
+    Read-only access to the life tables of an on-disk store written by
+    write_table_store.  The data file is memory mapped once and each
+    LifeTable is built on first access from read-only views of its block,
+    so no columns are copied into the process.  Processes that open the same
+    store share the operating system's page cache copy of the tables.
+
+    Args:
+        path: file system path of the data file
+        commutation_cache_size: the number of interest rates each table keeps
+                                commutation columns cached for
+
+    Example:
+        write_table_store("tables.bin", {"cso": LifeTable(EXAMPLE_TABLE)})
+        TableStore("tables.bin")["cso"].Ax(0, 0.07)
+    """
+
+    def __init__(self, path, commutation_cache_size: int = 16):
+        with open(os.fspath(path) + _INDEX_SUFFIX, encoding="utf-8") as index_file:
+            index = json.load(index_file)
+        if index.get("version") != _STORE_VERSION:
+            raise InvalidTableStore(
+                f"Unsupported table store version {index.get('version')}!"
+            )
+        self._index = index["tables"]
+        self._commutation_cache_size = commutation_cache_size
+        self._data = (
+            np.memmap(path, dtype=float, mode="r")
+            if os.path.getsize(path)
+            else np.empty(0)
+        )
+        self._life_tables: Dict[str, LifeTable] = {}
+
+    def __getitem__(self, key: str) -> LifeTable:
+        life_table = self._life_tables.get(key)
+        if life_table is None:
+            entry = self._index[key]
+            columns = {}
+            start = entry["offset"]
+            for column, size in _column_sizes(entry["table_size"]).items():
+                columns[column] = self._data[start:][:size]
+                start += size
+            life_table = LifeTable.from_columns(
+                columns,
+                name=entry["name"],
+                description=entry["description"],
+                commutation_cache_size=self._commutation_cache_size,
+            )
+            self._life_tables[key] = life_table
+        return life_table
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
@@ -1,9 +1,91 @@
-from typing import Union, Iterable, Tuple
+import numbers
+from functools import lru_cache
+from typing import Dict, NamedTuple, Union, Iterable, Tuple
 
 import numpy as np
 
-from elizur.life.annuity import discount_factor
-from elizur.life.util import validate_age, validate_interval, validate_t_interval
+from elizur.life.annuity import InvalidCurve, YieldCurve, discount_factor
+from elizur.life.table.fractional import UDD, fractional_lxs
+from elizur.life.util import (
+    validate_age,
+    validate_frequency,
+    validate_interval,
+    validate_t_interval,
+)
+
+
+class CommutationColumns(NamedTuple):
+    """
+    The actuarial commutation columns of a life table at a single
+    interest rate.  Each column is indexed by age and is padded with a
+    trailing zero so that ages beyond the table resolve to zero.
+    """
+
+    Dxs: np.ndarray
+    Nxs: np.ndarray
+    Sxs: np.ndarray
+    Cxs: np.ndarray
+    Mxs: np.ndarray
+    Rxs: np.ndarray
+
+
+# annual actuarial present values of LifeTable valued per policy by name
+BENEFITS = ("Ax", "Axn", "IAx", "IAxn", "ax", "axn", "ax_due", "axn_due")
+TERM_BENEFITS = frozenset(("Axn", "IAxn", "axn", "axn_due"))
+
+STORED_COLUMNS = (
+    "qxs",
+    "pxs",
+    "lxs",
+    "dxs",
+    "mxs",
+    "txs",
+    "_padded_lxs",
+    "_padded_exs",
+)
+
+
+def _reverse_cumsum(column: np.ndarray) -> np.ndarray:
+    """
+    Args:
+        column: array of columns along the last axis
+
+    Returns:
+        The sum of each element and every element after it along the last
+        axis
+    """
+    return np.cumsum(column[..., ::-1], axis=-1)[..., ::-1]
+
+
+def _build_commutation_columns(
+    lxs: np.ndarray, discount_factors: np.ndarray
+) -> CommutationColumns:
+    """
+    Args:
+        lxs: population columns along the last axis, padded with a
+             trailing zero
+        discount_factors: discount factor of each population entry, i.e.
+                          v to the power of the age
+
+    Returns:
+        The read-only Dx, Nx, Sx, Cx, Mx, and Rx columns along the last axis
+    """
+    Dxs = lxs * discount_factors
+    Cxs = np.zeros_like(Dxs)
+    Cxs[..., :-1] = (lxs[..., :-1] - lxs[..., 1:]) * discount_factors[..., 1:]
+    Nxs = _reverse_cumsum(Dxs)
+    Mxs = _reverse_cumsum(Cxs)
+    columns = CommutationColumns(
+        Dxs=Dxs,
+        Nxs=Nxs,
+        Sxs=_reverse_cumsum(Nxs),
+        Cxs=Cxs,
+        Mxs=Mxs,
+        Rxs=_reverse_cumsum(Mxs),
+    )
+    for column in columns:
+        column.setflags(write=False)
+    return columns
 
 
 class LifeTable:
@@ -15,27 +97,152 @@ class LifeTable:
     ex, mx, w, nqx, npx, nlx, ndx, nmx, tqxn, Dx, Sx, Nx, Cx, Mx, Rx, actuarial
     present value of annuities, and actuarial present value of insurances.
 
+    The commutation functions and actuarial present values accept either
+    scalars or broadcastable arrays of ages (x), interest rates (i), and
+    terms (n) and return an array when any input is an array.  A YieldCurve
+    can be passed in place of the interest rate, in which case the actuarial
+    present values discount each payment with the curve from the start age
+    and the commutation functions discount age x with a term of x years.
+
+    The columns of a table and derived quantities such as the limiting age
+    are computed once at construction and are read-only, so a table can be
+    shared between threads and used as a dictionary key.  Only the name and
+    description can be changed after construction.
+
     Args:
         table: iterable of failure probabilities as floats in
                sequential order, e.g. (1q0, 2q1, ..., 100q99)
         initial_pop: the size of the initial population (l0)
+        commutation_cache_size: the number of interest rates to keep
+                                commutation columns cached for
     """
 
+    __slots__ = (
+        "qxs",
+        "table_size",
+        "pxs",
+        "lxs",
+        "dxs",
+        "mxs",
+        "txs",
+        "exs",
+        "name",
+        "description",
+        "_padded_lxs",
+        "_padded_exs",
+        "_w",
+        "_hash",
+        "_commutation_columns",
+        "_mthly_columns",
+        "_curve_columns",
+    )
+
     def __init__(
         self,
         table: Union[Iterable, np.array],
         name: str = "",
         description: str = "",
         initial_pop: int = 100000,
+        commutation_cache_size: int = 16,
     ):
-        self.qxs = np.array(table)
+        self.qxs = np.array(table, dtype=float)
         self.table_size = self.qxs.size
         self.pxs = 1 - self.qxs
         self.lxs = self._set_lxs(initial_pop)
         self.dxs = -1 * np.diff(self.lxs)
         self.mxs = np.divide(self.dxs, self.lxs[:-1])
+        self._padded_lxs = np.append(self.lxs[: self.table_size], 0.0)
+        self._w = int(np.argmin(self._padded_lxs > 0)) - 1
+        self.txs = self._set_txs()
+        self._padded_exs = np.append(self._set_exs(), 0.0)
+        self.exs = self._padded_exs[: self.table_size]
         self.name = name
         self.description = description
+        self._freeze(commutation_cache_size)
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: Dict[str, np.ndarray],
+        name: str = "",
+        description: str = "",
+        commutation_cache_size: int = 16,
+    ) -> "LifeTable":
+        """
+        Builds a table from precomputed columns without copying them, e.g.
+        read-only views into a memory mapped TableStore.
+
+        Args:
+            columns: a mapping of each name in STORED_COLUMNS to its column
+            name: name of the table
+            description: description of the table
+            commutation_cache_size: the number of interest rates to keep
+                                    commutation columns cached for
+
+        Returns:
+            A LifeTable backed by the passed in columns
+        """
+        life_table = cls.__new__(cls)
+        for column in STORED_COLUMNS:
+            setattr(life_table, column, columns[column])
+        life_table.table_size = life_table.qxs.size
+        life_table._w = int(np.argmin(life_table._padded_lxs > 0)) - 1
+        life_table.exs = life_table._padded_exs[: life_table.table_size]
+        life_table.name = name
+        life_table.description = description
+        life_table._freeze(commutation_cache_size)
+        return life_table
+
+    def _freeze(self, commutation_cache_size: int) -> None:
+        """
+        Hashes the table, creates its commutation column cache, and marks
+        every column read-only.
+
+        Args:
+            commutation_cache_size: the number of interest rates to keep
+                                    commutation columns cached for
+        """
+        self._hash = hash((self.qxs.tobytes(), float(self.lxs[0])))
+        self._commutation_columns = lru_cache(maxsize=commutation_cache_size)(
+            self._calculate_commutation_columns
+        )
+        self._mthly_columns = lru_cache(maxsize=commutation_cache_size)(
+            self._calculate_mthly_columns
+        )
+        self._curve_columns = lru_cache(maxsize=commutation_cache_size)(
+            self._calculate_curve_columns
+        )
+        for column in (*STORED_COLUMNS, "exs"):
+            getattr(self, column).setflags(write=False)
+
+    def __setattr__(self, name: str, value) -> None:
+        if name not in ("name", "description") and hasattr(self, name):
+            raise AttributeError(f"LifeTable attribute '{name}' is read-only")
+        object.__setattr__(self, name, value)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, LifeTable):
+            return NotImplemented
+        return (
+            self._hash == other._hash
+            and self.lxs[0] == other.lxs[0]
+            and np.array_equal(self.qxs, other.qxs)
+        )
+
+    def __reduce__(self):
+        return (
+            LifeTable,
+            (
+                self.qxs,
+                self.name,
+                self.description,
+                self.lxs[0],
+                self._commutation_columns.cache_parameters()["maxsize"],
+            ),
+        )
 
     def _set_lxs(self, l0: int) -> Tuple[float]:
         """
@@ -44,13 +251,44 @@ class LifeTable:
         """
         return l0 * np.insert(np.cumprod(self.pxs), 0, 1)
 
+    def _set_txs(self) -> np.array:
+        """
+        Returns:
+            The number of person years lived from age x onward for all ages
+            followed by a trailing zero for ages beyond the table
+        """
+        return np.append(_reverse_cumsum(self.lxs[: self.table_size]), 0.0)
+
+    def _set_exs(self) -> np.array:
+        """
+        Returns:
+            The curtate life expectation for all ages
+        """
+        ages = np.arange(self.table_size)
+        lxs = self.lxs[: self.table_size]
+        years = self.txs[np.minimum(ages + 1, self.table_size)] - self.txs[self.w]
+        alive = ages < self.w
+        return np.divide(years, lxs, out=np.zeros(self.table_size), where=alive)
+
+    def _all_ages(self, n: Union[int, Iterable, np.array]) -> np.array:
+        """
+        Args:
+            n: interval or an array of intervals
+
+        Returns:
+            Every age of the table, as a column when n is an array so that
+            the ages broadcast against the intervals
+        """
+        ages = np.arange(self.table_size)
+        return ages if np.ndim(n) == 0 else ages[:, np.newaxis]
+
     @property
     def w(self) -> int:
         """
         Returns:
             The limiting age of the life table
         """
-        return self.get_lxs().index(0) - 1
+        return self._w
 
     @validate_age
     def qx(self, x: int) -> float:
@@ -118,85 +356,110 @@ class LifeTable:
         return self.mxs[x]
 
     @validate_age
-    def ex(self, x: int) -> float:
+    def ex(self, x: Union[int, Iterable, np.array]) -> Union[float, np.array]:
         """
         Args:
-            x: start age
+            x: start age or an array of start ages
 
         Returns:
             The curtate life expectation at age x
         """
-        if x >= self.table_size:
-            return 0.0
-        return sum([self.lx(t + x) / self.lx(x) for t in range(1, self.w - x)])
+        return self._padded_exs[np.minimum(x, self.table_size)]
 
     @validate_age
     @validate_interval
-    def nqx(self, n: int, x: int) -> float:
+    def nqx(
+        self,
+        n: Union[float, Iterable, np.array],
+        x: Union[float, Iterable, np.array],
+        assumption: str = UDD,
+    ) -> Union[float, np.array]:
         """
         Args:
-            n: width of failure interval in years
-            x: start age
+            n: width of failure interval in years, which may be fractional
+            x: start age, which may be fractional
+            assumption: the fractional age assumption between integer ages,
+                        one of 'udd', 'constant_force', or 'balducci'
 
         Returns:
             The probability of failure between ages x and x + n
         """
-        if x >= self.table_size:
-            return 1.0
-        return (self.lx(x) - self.lx(n + x)) / self.lx(x)
+        if isinstance(n, numbers.Integral) and isinstance(x, numbers.Integral):
+            if x >= self.table_size:
+                return 1.0
+            return (self.lx(x) - self.lx(n + x)) / self.lx(x)
+        return 1 - self.npx(n, x, assumption)
 
     @validate_interval
-    def nqxs(self, n: int) -> np.array:
+    def nqxs(self, n: Union[int, Iterable, np.array]) -> np.array:
         """
         Args:
-            n: width of failure interval in years
+            n: width of failure interval in years or an array of widths
 
         Returns:
             The probability of failure between ages x and x + n for all ages
+            where x + n is within the table.  When n is an array a matrix of
+            (ages x intervals) is returned for every age of the table.
         """
-        return np.array(
-            [
-                (self.lx(x) - self.lx(x + n)) / self.lx(x)
-                for x in range(self.table_size)
-                if x + n < self.table_size
-            ]
-        )
+        if np.ndim(n) == 0:
+            lxs = self.lxs[: self.table_size]
+            starts, ends = lxs[: max(self.table_size - n, 0)], lxs[n:]
+            return (starts - ends) / starts
+        lxs = self._padded_lxs
+        ages = self._all_ages(n)
+        return (lxs[ages] - lxs[self._age(ages + n)]) / lxs[ages]
 
     @validate_age
     @validate_interval
-    def npx(self, n: int, x: int) -> float:
+    def npx(
+        self,
+        n: Union[float, Iterable, np.array],
+        x: Union[float, Iterable, np.array],
+        assumption: str = UDD,
+    ) -> Union[float, np.array]:
         """
         Args:
-            n: width of survival interval in years
-            x: start age
+            n: width of survival interval in years, which may be fractional
+            x: start age, which may be fractional
+            assumption: the fractional age assumption between integer ages,
+                        one of 'udd', 'constant_force', or 'balducci'
 
         Returns:
             The probability of survival between ages x and x + n
         """
-        if x >= self.table_size:
-            return 0.0
-        return self.lx(n + x) / self.lx(x)
+        if isinstance(n, numbers.Integral) and isinstance(x, numbers.Integral):
+            if x >= self.table_size:
+                return 0.0
+            return self.lx(n + x) / self.lx(x)
+        start = fractional_lxs(self._padded_lxs, x, assumption)
+        end = fractional_lxs(self._padded_lxs, np.add(x, n), assumption)
+        return np.divide(
+            end, start, out=np.zeros(np.broadcast(end, start).shape), where=start > 0
+        )[()]
 
     @validate_interval
-    def npxs(self, n: int) -> np.array:
+    def npxs(self, n: Union[int, Iterable, np.array]) -> np.array:
         """
         Args:
-            n: width of survival interval in years
+            n: width of survival interval in years or an array of widths
 
         Returns:
             The probability of survival between ages x and x + n for all ages
+            where x + n is within the table.  When n is an array a matrix of
+            (ages x intervals) is returned for every age of the table.
         """
-        return np.array(
-            [
-                self.lx(x + n) / self.lx(x)
-                for x in range(self.table_size)
-                if x + n < self.table_size
-            ]
-        )
+        if np.ndim(n) == 0:
+            lxs = self.lxs[: self.table_size]
+            return lxs[n:] / lxs[: max(self.table_size - n, 0)]
+        lxs = self._padded_lxs
+        ages = self._all_ages(n)
+        return lxs[self._age(ages + n)] / lxs[ages]
 
     @validate_age
     @validate_interval
-    def nlx(self, n: int, x: int) -> float:
+    def nlx(
+        self, n: Union[int, Iterable, np.array], x: Union[int, Iterable, np.array]
+    ) -> Union[float, np.array]:
         """
         Args:
             n: width of failure interval in years
@@ -205,11 +468,30 @@ class LifeTable:
         Returns:
             The number of person years lived between ages x and x + n
         """
-        return sum([self.lx(x + i) for i in range(n)])
+        if np.ndim(n) == 0 and np.ndim(x) == 0:
+            return np.sum(self.lxs[: self.table_size][x:][:n])
+        return (
+            self.txs[np.minimum(x, self.table_size)]
+            - self.txs[np.minimum(np.add(x, n), self.table_size)]
+        )
+
+    @validate_interval
+    def nlxs(self, n: Union[int, Iterable, np.array]) -> np.array:
+        """
+        Args:
+            n: width of failure interval in years
+
+        Returns:
+            The number of person years lived between ages x and x + n
+            for all ages, a matrix of (ages x intervals) when n is an array
+        """
+        return self.nlx(n, self._all_ages(n))
 
     @validate_age
     @validate_interval
-    def ndx(self, n: int, x: int) -> float:
+    def ndx(
+        self, n: Union[int, Iterable, np.array], x: Union[int, Iterable, np.array]
+    ) -> Union[float, np.array]:
         """
         Args:
             n: width of failure interval in years
@@ -218,21 +500,56 @@ class LifeTable:
         Returns:
             The number of failures between ages x and x + n
         """
-        return sum([self.dx(x + i) for i in range(n)])
+        lxs = self._padded_lxs
+        return (
+            lxs[np.minimum(x, self.table_size)]
+            - lxs[np.minimum(np.add(x, n), self.table_size)]
+        )
+
+    @validate_interval
+    def ndxs(self, n: Union[int, Iterable, np.array]) -> np.array:
+        """
+        Args:
+            n: width of failure interval in years
+
+        Returns:
+            The number of failures between ages x and x + n for all ages,
+            a matrix of (ages x intervals) when n is an array
+        """
+        return self.ndx(n, self._all_ages(n))
 
     @validate_age
     @validate_interval
-    def nmx(self, n: int, x: int) -> float:
+    def nmx(
+        self, n: Union[int, Iterable, np.array], x: Union[int, Iterable, np.array]
+    ) -> Union[float, np.array]:
         """
         Args:
+            n: width of failure interval in years
             x: start age
 
         Returns:
             The central failure rate between ages x and x + n
         """
-        if x >= self.table_size:
+        if np.ndim(n) == 0 and np.ndim(x) == 0 and x >= self.table_size:
             return 1.0
-        return self.ndx(n, x) / self.nlx(n, x)
+        return np.where(
+            np.greater_equal(x, self.table_size),
+            1.0,
+            self.ndx(n, x) / self.nlx(n, x),
+        )[()]
+
+    @validate_interval
+    def nmxs(self, n: Union[int, Iterable, np.array]) -> np.array:
+        """
+        Args:
+            n: width of failure interval in years
+
+        Returns:
+            The central failure rate between ages x and x + n for all ages,
+            a matrix of (ages x intervals) when n is an array
+        """
+        return self.nmx(n, self._all_ages(n))
 
     @validate_age
     @validate_interval
@@ -259,26 +576,36 @@ class LifeTable:
             return 1.0
         return self.npx(n, x) * self.nqx(t, x + n)
 
-    def tqxns(self, t: int, n: int) -> np.array:
+    def tqxns(
+        self, t: Union[int, Iterable, np.array], n: Union[int, Iterable, np.array]
+    ) -> np.array:
         """
         Args:
-            t: width of the failure interval in years
-            n: width of the survival interval in years
+            t: width of the failure interval in years or an array of widths
+            n: width of the survival interval in years or an array of widths
 
         Returns:
             The probability of surviving from age x to x + n and
             then failing between age x + n and age x + n + t for all
-            ages
-        """
-        if n <= 0 or t <= 0:
-            return np.zeros(self.table_size)
-        return np.array(
-            [
-                self.npx(n, x) * self.nqx(t, x + n)
-                for x in range(self.table_size)
-                if x + n + t < self.table_size
-            ]
-        )
+            ages where x + n + t is within the table.  When t or n is an
+            array a matrix of (ages x intervals) is returned for every
+            age of the table.
+        """
+        if np.ndim(t) == 0 and np.ndim(n) == 0:
+            if n <= 0 or t <= 0:
+                return np.zeros(self.table_size)
+            lxs = self.lxs[: self.table_size]
+            size = max(self.table_size - n - t, 0)
+            survivors = lxs[n:][:size]
+            return (survivors / lxs[:size]) * (
+                (survivors - lxs[n:][t:][:size]) / survivors
+            )
+        t, n = np.broadcast_arrays(t, n)
+        lxs = self._padded_lxs
+        ages = self._all_ages(n)
+        deferred = self._age(ages + n)
+        tqxns = (lxs[deferred] - lxs[self._age(deferred + t)]) / lxs[ages]
+        return np.where((t > 0) & (n > 0), tqxns, 0.0)
 
     def get_qxs(self) -> Tuple[float]:
         """
@@ -315,8 +642,205 @@ class LifeTable:
         """
         return tuple(self.lxs)
 
+    def commutation_columns(self, i: Union[float, YieldCurve]) -> CommutationColumns:
+        """
+        The columns are built once per interest rate or yield curve with
+        reverse cumulative sums and kept in a bounded least recently used
+        cache.  The columns of a yield curve discount age x with the
+        discount factor of a term of x years.
+
+        Args:
+            i: interest rate or yield curve
+        Returns:
+            The Dx, Nx, Sx, Cx, Mx, and Rx columns for all ages
+        """
+        if isinstance(i, YieldCurve):
+            return self._commutation_columns(i if i.flat_rate is None else i.flat_rate)
+        return self._commutation_columns(float(i))
+
+    def _calculate_commutation_columns(
+        self, i: Union[float, YieldCurve]
+    ) -> CommutationColumns:
+        """
+        Args:
+            i: interest rate or yield curve
+        Returns:
+            The Dx, Nx, Sx, Cx, Mx, and Rx columns for all ages
+        """
+        terms = np.arange(self.table_size + 1, dtype=float)
+        if isinstance(i, YieldCurve):
+            discount_factors = i.discount_factor(terms)
+        else:
+            discount_factors = np.power(discount_factor(i), terms)
+        return _build_commutation_columns(self._padded_lxs, discount_factors)
+
+    def _calculate_curve_columns(self, curve: YieldCurve) -> CommutationColumns:
+        """
+        Row x of each column is the commutation column of a life aged x
+        today, i.e. attained age y is discounted with the discount factor of
+        a term of y - x years, so the actuarial present values at age x are
+        ratios of row x like the flat rate ratios of a single column.
+        Attained ages below the row age are unused.
+
+        Args:
+            curve: yield curve
+        Returns:
+            The Dx, Nx, Sx, Cx, Mx, and Rx columns as (ages x ages) matrices
+        """
+        ages = np.arange(self.table_size + 1)
+        terms = ages - ages[:, np.newaxis]
+        discount_factors = np.where(
+            terms >= 0, curve.discount_factor(np.maximum(terms, 0)), 0.0
+        )
+        return _build_commutation_columns(self._padded_lxs, discount_factors)
+
+    def _calculate_mthly_columns(
+        self, i: float, m: int, assumption: str
+    ) -> Tuple[np.array, np.array]:
+        """
+        The m-thly payments and insurance of each year of age are valued
+        once from the fractional populations of the year and weighted by Dx,
+        so the m-thly actuarial present values are ratios of columns like
+        their annual counterparts.
+
+        Args:
+            i: interest rate
+            m: number of payments per year
+            assumption: the fractional age assumption between integer ages
+        Returns:
+            The N(m)x and M(m)x columns for all ages
+        """
+        fractions = np.arange(m + 1) / m
+        lxs = fractional_lxs(
+            self._padded_lxs,
+            np.arange(self.table_size)[:, np.newaxis] + fractions,
+            assumption,
+        )
+        survival = np.divide(
+            lxs, lxs[:, :1], out=np.zeros(lxs.shape), where=lxs[:, :1] > 0
+        )
+        discount_factors = np.power(discount_factor(i), fractions)
+        payments = np.sum(discount_factors[:-1] * survival[:, :-1], axis=1) / m
+        benefits = np.sum(
+            discount_factors[1:] * (survival[:, :-1] - survival[:, 1:]), axis=1
+        )
+        Dxs = self.commutation_columns(i).Dxs[: self.table_size]
+        columns = (
+            _reverse_cumsum(np.append(Dxs * payments, 0.0)),
+            _reverse_cumsum(np.append(Dxs * benefits, 0.0)),
+        )
+        for column in columns:
+            column.setflags(write=False)
+        return columns
+
+    def _mthly_commutations(
+        self, i: Union[float, Iterable, np.array, YieldCurve], m: int, assumption: str
+    ) -> Tuple[Tuple[np.array, np.array, np.array], Union[int, np.array]]:
+        """
+        Args:
+            i: interest rate or an array of interest rates
+            m: number of payments per year
+            assumption: the fractional age assumption between integer ages
+        Returns:
+            The Dx, N(m)x, and M(m)x columns stacked into (rates x ages)
+            matrices and the row index of each interest rate
+        """
+        if isinstance(i, YieldCurve):
+            if i.flat_rate is None:
+                raise InvalidCurve(
+                    "m-thly actuarial present values only support flat curves!"
+                )
+            i = i.flat_rate
+        rates, rows = (
+            (np.array([i]), 0) if np.ndim(i) == 0 else np.unique(i, return_inverse=True)
+        )
+        columns = [
+            (
+                self.commutation_columns(rate).Dxs,
+                *self._mthly_columns(float(rate), int(m), assumption),
+            )
+            for rate in rates
+        ]
+        return (
+            tuple(np.stack(column) for column in zip(*columns)),
+            rows if np.ndim(i) == 0 else rows.reshape(np.shape(i)),
+        )
+
+    def commutations(
+        self,
+        i: Union[float, Iterable, np.array, YieldCurve],
+        x: Union[None, int, Iterable, np.array] = None,
+    ) -> Tuple[CommutationColumns, Union[int, np.array]]:
+        """
+        Args:
+            i: interest rate, an array of interest rates, or a yield curve
+            x: start ages of the actuarial present values, which select the
+               rows of the (ages x ages) columns of a yield curve, so values
+               at later ages are discounted to age x along the curve
+        Returns:
+            The commutation columns stacked into (rates x ages) matrices
+            and the row index of each interest rate, which together can be
+            fancy indexed by age, e.g. columns.Dxs[rows, ages].  A single
+            rate indexes its cached columns directly with an Ellipsis row.
+            Ages beyond the table index past the end of the columns, so
+            they must first be capped at table_size.
+
+        Example:
+            columns, rows = life_table.commutations(0.04)
+            columns.Mxs[rows, 40] / columns.Dxs[rows, 40]
+        """
+        if isinstance(i, YieldCurve) and i.flat_rate is None:
+            if x is None:
+                return self.commutation_columns(i), Ellipsis
+            return self._curve_columns(i), self._age(x)
+        if isinstance(i, YieldCurve):
+            i = i.flat_rate
+        if isinstance(i, numbers.Number) or np.ndim(i) == 0:
+            return self.commutation_columns(i), Ellipsis
+        rates, rows = np.unique(i, return_inverse=True)
+        columns = [self.commutation_columns(rate) for rate in rates]
+        return (
+            CommutationColumns(*(np.stack(column) for column in zip(*columns))),
+            rows.reshape(np.shape(i)),
+        )
+
+    def _commutation(
+        self,
+        column: str,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array, YieldCurve],
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            column: name of the commutation column, e.g. 'Nxs'
+            x: age or an array of ages
+            i: interest rate or an array of interest rates
+        Returns:
+            The commutation column values at ages x
+        """
+        if isinstance(i, numbers.Number):
+            return getattr(self.commutation_columns(i), column)[self._age(x)]
+        c, r = self.commutations(i)
+        return getattr(c, column)[r, self._age(x)][()]
+
+    def _age(self, x: Union[int, Iterable, np.array]) -> Union[int, np.array]:
+        """
+        Args:
+            x: age or an array of ages
+        Returns:
+            The commutation column index of ages x, ages beyond the table
+            share the trailing zero entry
+        """
+        if isinstance(x, numbers.Integral):
+            return min(x, self.table_size)
+        return np.minimum(x, self.table_size)
+
     @validate_age
-    def Dx(self, x: int, i: float) -> float:
+    def Dx(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array, YieldCurve],
+    ) -> Union[float, np.array]:
         """
         Actuarial commutation function Dx
 
@@ -326,10 +850,14 @@ class LifeTable:
         Returns:
             Population at age x discounted for x years
         """
-        return self.lx(x) * discount_factor(i) ** x
+        return self._commutation("Dxs", x, i)
 
     @validate_age
-    def Nx(self, x: int, i: float) -> float:
+    def Nx(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array, YieldCurve],
+    ) -> Union[float, np.array]:
         """
         Actuarial commutation function Nx
 
@@ -339,10 +867,14 @@ class LifeTable:
         Returns:
             Sum of Ds from age x and onward
         """
-        return sum([self.Dx(n, i) for n in range(x, self.w + 1)])
+        return self._commutation("Nxs", x, i)
 
     @validate_age
-    def Sx(self, x: int, i: float) -> float:
+    def Sx(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array, YieldCurve],
+    ) -> Union[float, np.array]:
         """
         Actuarial commutation function Sx
 
@@ -352,10 +884,14 @@ class LifeTable:
         Returns:
             Sum of Ns from age x and onward
         """
-        return sum([self.Nx(n, i) for n in range(x, self.w + 1)])
+        return self._commutation("Sxs", x, i)
 
     @validate_age
-    def Cx(self, x: int, i: float) -> float:
+    def Cx(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array, YieldCurve],
+    ) -> Union[float, np.array]:
         """
         Actuarial commutation function Cx
 
@@ -365,10 +901,14 @@ class LifeTable:
         Returns:
             Failures between x and x + 1 discounted for x years
         """
-        return (self.lx(x) - self.lx(x + 1)) * discount_factor(i) ** (x + 1)
+        return self._commutation("Cxs", x, i)
 
     @validate_age
-    def Mx(self, x: int, i: float) -> float:
+    def Mx(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array, YieldCurve],
+    ) -> Union[float, np.array]:
         """
         Actuarial commutation function Mx
 
@@ -378,10 +918,14 @@ class LifeTable:
         Returns:
             Sum of Cs from age x and onward
         """
-        return sum([self.Cx(t, i) for t in range(x, self.w + 1)])
+        return self._commutation("Mxs", x, i)
 
     @validate_age
-    def Rx(self, x: int, i: float) -> float:
+    def Rx(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array, YieldCurve],
+    ) -> Union[float, np.array]:
         """
         Actuarial commutation function Rx
 
@@ -391,10 +935,14 @@ class LifeTable:
         Returns:
             Sum of Ms from age x and onward
         """
-        return sum([self.Mx(t, i) for t in range(x, self.w + 1)])
+        return self._commutation("Rxs", x, i)
 
     @validate_age
-    def Ax(self, x: int, i: float) -> float:
+    def Ax(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array, YieldCurve],
+    ) -> Union[float, np.array]:
         """
         Args:
             x: start age
@@ -402,11 +950,17 @@ class LifeTable:
         Returns:
             Actuarial present value of level whole insurance
         """
-        return self.Mx(x, i) / self.Dx(x, i)
+        c, r = self.commutations(i, x)
+        return c.Mxs[r, self._age(x)] / c.Dxs[r, self._age(x)]
 
     @validate_age
     @validate_interval
-    def Axn(self, x: int, i: float, n: int) -> float:
+    def Axn(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array, YieldCurve],
+        n: Union[int, Iterable, np.array],
+    ) -> Union[float, np.array]:
         """
         Args:
             x: start age
@@ -415,10 +969,17 @@ class LifeTable:
         Returns:
             Actuarial present value of level temporary insurance
         """
-        return (self.Mx(x, i) - self.Mx(x + n, i)) / self.Dx(x, i)
+        c, r = self.commutations(i, x)
+        return (c.Mxs[r, self._age(x)] - c.Mxs[r, self._age(np.add(x, n))]) / c.Dxs[
+            r, self._age(x)
+        ]
 
     @validate_age
-    def IAx(self, x: int, i: float) -> float:
+    def IAx(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array, YieldCurve],
+    ) -> Union[float, np.array]:
         """
         Args:
             x: start age
@@ -426,11 +987,17 @@ class LifeTable:
         Returns:
             Actuarial present value of increasing whole insurance
         """
-        return self.Rx(x, i) / self.Dx(x, i)
+        c, r = self.commutations(i, x)
+        return c.Rxs[r, self._age(x)] / c.Dxs[r, self._age(x)]
 
     @validate_age
     @validate_interval
-    def IAxn(self, x: int, i: float, n: int) -> float:
+    def IAxn(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array, YieldCurve],
+        n: Union[int, Iterable, np.array],
+    ) -> Union[float, np.array]:
         """
         Args:
             x: start age
@@ -439,12 +1006,19 @@ class LifeTable:
         Returns:
             Actuarial present value of increasing temporary insurance
         """
-        return (self.Rx(x, i) - self.Rx(x + n, i) - n * self.Mx(x + n, i)) / self.Dx(
-            x, i
-        )
+        c, r = self.commutations(i, x)
+        return (
+            c.Rxs[r, self._age(x)]
+            - c.Rxs[r, self._age(np.add(x, n))]
+            - np.multiply(n, c.Mxs[r, self._age(np.add(x, n))])
+        ) / c.Dxs[r, self._age(x)]
 
     @validate_age
-    def ax(self, x: int, i: float) -> float:
+    def ax(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array, YieldCurve],
+    ) -> Union[float, np.array]:
         """
         Args:
             x: start age
@@ -452,11 +1026,17 @@ class LifeTable:
         Returns:
             Actuarial present value of a level perpetuity
         """
-        return self.Nx(x + 1, i) / self.Dx(x, i)
+        c, r = self.commutations(i, x)
+        return c.Nxs[r, self._age(np.add(x, 1))] / c.Dxs[r, self._age(x)]
 
     @validate_age
     @validate_interval
-    def axn(self, x: int, i: float, n: int) -> float:
+    def axn(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array, YieldCurve],
+        n: Union[int, Iterable, np.array],
+    ) -> Union[float, np.array]:
         """
         Args:
             x: start age
@@ -465,10 +1045,17 @@ class LifeTable:
         Returns:
             Actuarial present value of a temporary annuity
         """
-        return (self.Nx(x + 1, i) - self.Nx(x + n + 1, i)) / self.Dx(x, i)
+        c, r = self.commutations(i, x)
+        return (
+            c.Nxs[r, self._age(np.add(x, 1))] - c.Nxs[r, self._age(np.add(x, n) + 1)]
+        ) / c.Dxs[r, self._age(x)]
 
     @validate_age
-    def ax_due(self, x: int, i: float) -> float:
+    def ax_due(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array, YieldCurve],
+    ) -> Union[float, np.array]:
         """
         Args:
             x: start age
@@ -476,11 +1063,17 @@ class LifeTable:
         Returns:
             Actuarial present value of a level perpetuity due
         """
-        return self.Nx(x, i) / self.Dx(x, i)
+        c, r = self.commutations(i, x)
+        return c.Nxs[r, self._age(x)] / c.Dxs[r, self._age(x)]
 
     @validate_age
     @validate_interval
-    def axn_due(self, x: int, i: float, n: int) -> float:
+    def axn_due(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array, YieldCurve],
+        n: Union[int, Iterable, np.array],
+    ) -> Union[float, np.array]:
         """
         Args:
             x: start age
@@ -489,7 +1082,134 @@ class LifeTable:
         Returns:
             Actuarial present value of a temporary annuity due
         """
-        return (self.Nx(x, i) - self.Nx(x + n, i)) / self.Dx(x, i)
+        c, r = self.commutations(i, x)
+        return (c.Nxs[r, self._age(x)] - c.Nxs[r, self._age(np.add(x, n))]) / c.Dxs[
+            r, self._age(x)
+        ]
+
+    @validate_age
+    @validate_frequency
+    def ax_due_m(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array, YieldCurve],
+        m: int,
+        assumption: str = UDD,
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: start age
+            i: interest rate
+            m: number of payments per year
+            assumption: the fractional age assumption between integer ages,
+                        one of 'udd', 'constant_force', or 'balducci'
+        Returns:
+            Actuarial present value of a perpetuity due of 1 per year paid
+            in m installments
+        """
+        (Dxs, Nxs, _), r = self._mthly_commutations(i, m, assumption)
+        return Nxs[r, self._age(x)] / Dxs[r, self._age(x)]
+
+    @validate_age
+    @validate_frequency
+    def ax_m(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array, YieldCurve],
+        m: int,
+        assumption: str = UDD,
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: start age
+            i: interest rate
+            m: number of payments per year
+            assumption: the fractional age assumption between integer ages,
+                        one of 'udd', 'constant_force', or 'balducci'
+        Returns:
+            Actuarial present value of a perpetuity immediate of 1 per year
+            paid in m installments
+        """
+        return self.ax_due_m(x, i, m, assumption) - 1 / m
+
+    @validate_age
+    @validate_interval
+    @validate_frequency
+    def axn_due_m(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array, YieldCurve],
+        n: Union[int, Iterable, np.array],
+        m: int,
+        assumption: str = UDD,
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: start age
+            i: interest rate
+            n: length of payments in years
+            m: number of payments per year
+            assumption: the fractional age assumption between integer ages,
+                        one of 'udd', 'constant_force', or 'balducci'
+        Returns:
+            Actuarial present value of a temporary annuity due of 1 per year
+            paid in m installments
+        """
+        (Dxs, Nxs, _), r = self._mthly_commutations(i, m, assumption)
+        return (Nxs[r, self._age(x)] - Nxs[r, self._age(np.add(x, n))]) / Dxs[
+            r, self._age(x)
+        ]
+
+    @validate_age
+    @validate_frequency
+    def Ax_m(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array, YieldCurve],
+        m: int,
+        assumption: str = UDD,
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: start age
+            i: interest rate
+            m: number of periods per year
+            assumption: the fractional age assumption between integer ages,
+                        one of 'udd', 'constant_force', or 'balducci'
+        Returns:
+            Actuarial present value of level whole insurance paid at the end
+            of the 1/m year of failure
+        """
+        (Dxs, _, Mxs), r = self._mthly_commutations(i, m, assumption)
+        return Mxs[r, self._age(x)] / Dxs[r, self._age(x)]
+
+    @validate_age
+    @validate_interval
+    @validate_frequency
+    def Axn_m(
+        self,
+        x: Union[int, Iterable, np.array],
+        i: Union[float, Iterable, np.array, YieldCurve],
+        n: Union[int, Iterable, np.array],
+        m: int,
+        assumption: str = UDD,
+    ) -> Union[float, np.array]:
+        """
+        Args:
+            x: start age
+            i: interest rate
+            n: number of years in the temporary insurance
+            m: number of periods per year
+            assumption: the fractional age assumption between integer ages,
+                        one of 'udd', 'constant_force', or 'balducci'
+        Returns:
+            Actuarial present value of level temporary insurance paid at the
+            end of the 1/m year of failure
+        """
+        (Dxs, _, Mxs), r = self._mthly_commutations(i, m, assumption)
+        return (Mxs[r, self._age(x)] - Mxs[r, self._age(np.add(x, n))]) / Dxs[
+            r, self._age(x)
+        ]
 
 
 EXAMPLE_TABLE = (
@@ -1,10 +1,20 @@
 # flake8: noqa: E401
 
-from elizur.life.util.soa import read_soa_csv_mort_table
+from elizur.life.util.soa import (
+    InvalidSoaTable,
+    read_soa_csv_mort_table,
+    read_soa_csv_mort_tables,
+)
 from elizur.life.util.validators import (
     InvalidInterval,
     InvalidAge,
+    InvalidAssumption,
+    InvalidFrequency,
     validate_age,
     validate_interval,
     validate_t_interval,
+    validate_duration,
+    validate_frequency,
+    set_trusted_inputs,
+    trusted_inputs,
 )
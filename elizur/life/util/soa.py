@@ -1,24 +1,109 @@
 import csv
-from typing import Dict, List
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+_TABLE_NUMBER = "Table # "
+_METADATA_KEYS = {
+    "Table Name:": "name",
+    "Table Description:": "description",
+    "Provider Name:": "author",
+    "Table Reference:": "reference",
+    "Comments:": "comments",
+    "Content Type:": "content_type",
+    "Nation:": "study_nation",
+    "Row, Column (if applicable)->Increment:": "table_increment",
+    "Scaling Factor:": "scaling_factor",
+    "Table Identity:": "soa_table_identity",
+    "Table Identity": "soa_table_identity",
+    _TABLE_NUMBER: "table_number",
+}
+_INTEGER_METADATA_KEYS = {
+    "Row, Column (if applicable)->MinScaleValue:": ("min_age", "min_duration"),
+    "Row, Column (if applicable)->MaxScaleValue:": ("max_age", "max_duration"),
+}
+_TABLE_METADATA_KEYS = {"description": "table_description"}
+_TABLE_START = "Row\\Column"
+_CACHE_SUFFIX = ".npz"
+
+
+class InvalidSoaTable(Exception):
+    """
+    Custom exception raised for malformed SOA csv tables
+    """
 
 
 def read_soa_csv_mort_table(
-    file_path, encoding: str = "Windows-1252", delimiter: str = ","
+    file_path,
+    encoding: str = "Windows-1252",
+    delimiter: str = ",",
+    cache: bool = False,
 ) -> Dict:
     """
     Args:
         file_path: The full file system path to the csv
         encoding: The text encoding of the csv data.  It defaults to 'Windows-1252'.
         delimiter: The delimiter of the csv data.  It defaults to ','.
+        cache: When True the parsed table is written to a sidecar binary
+               file next to the csv (file_path + '.npz') and later reads load
+               the sidecar instead of parsing the csv while the csv's
+               modification time and size, or its SHA-256 hash, and the
+               encoding and delimiter are unchanged.  An unreadable sidecar
+               is replaced by parsing the csv again.
 
     Returns:
-        A dictionary with a 'values' and 'metadata' key.
+        A dictionary with a 'values' and 'metadata' key for the first table
+        of the csv.  The values are a NumPy array of floats, one dimensional
+        for single column tables and a matrix of (ages x columns), e.g.
+        (issue ages x durations) for select tables, otherwise.
     """
-    raw_csv = _open_soa_csv_mort_table(
-        file_path, encoding=encoding, delimiter=delimiter
-    )
-    processed_csv = _process_soa_csv_mort_table(raw_csv)
-    return processed_csv
+    if cache:
+        tables = read_soa_csv_mort_tables(
+            file_path, encoding=encoding, delimiter=delimiter, cache=True
+        )
+        return tables[0] if tables else _empty_table()
+    with open(file_path, encoding=encoding, newline="") as encoded_csv:
+        return _parse_soa_csv_mort_table(csv.reader(encoded_csv, delimiter=delimiter))
+
+
+def read_soa_csv_mort_tables(
+    file_path,
+    encoding: str = "Windows-1252",
+    delimiter: str = ",",
+    cache: bool = False,
+) -> List[Dict]:
+    """
+    Reads every table of a csv, e.g. the select and the ultimate tables of
+    a select and ultimate csv.
+
+    Args:
+        file_path: The full file system path to the csv
+        encoding: The text encoding of the csv data.  It defaults to 'Windows-1252'.
+        delimiter: The delimiter of the csv data.  It defaults to ','.
+        cache: When True the parsed tables are cached in a sidecar binary
+               file, see read_soa_csv_mort_table.
+
+    Returns:
+        A list of dictionaries with a 'values' and 'metadata' key, one for
+        each table in the csv.
+    """
+    if cache:
+        cached_tables = _read_soa_cache(file_path, encoding, delimiter)
+        if cached_tables is not None:
+            return cached_tables
+    with open(file_path, encoding=encoding, newline="") as encoded_csv:
+        tables = list(
+            _parse_soa_csv_mort_tables(csv.reader(encoded_csv, delimiter=delimiter))
+        )
+    if cache:
+        _write_soa_cache(file_path, tables, encoding, delimiter)
+    return tables
 
 
 def _open_soa_csv_mort_table(
@@ -27,7 +112,6 @@ def _open_soa_csv_mort_table(
     """
     Args:
         file_path: The full system path to the SOA csv table.
-        url: The full HTTP url to the SOA csv table.
         encoding: The text encoding of the csv data.  It defaults to 'Windows-1252'.
         delimiter: The delimiter of the csv data.  It defaults to ','.
 
@@ -36,9 +120,8 @@ def _open_soa_csv_mort_table(
         list has two elements representing the first and second
         columns.
     """
-    encoded_csv = open(file_path, encoding=encoding)
-    raw_csv = list(csv.reader(encoded_csv, delimiter=delimiter))
-    return raw_csv
+    with open(file_path, encoding=encoding, newline="") as encoded_csv:
+        return list(csv.reader(encoded_csv, delimiter=delimiter))
 
 
 def _process_soa_csv_mort_table(raw_csv: List[List[str]]) -> Dict:
@@ -51,39 +134,200 @@ def _process_soa_csv_mort_table(raw_csv: List[List[str]]) -> Dict:
     Returns:
         A dictionary with a 'values' and 'metadata' key.
     """
-    # pylint: disable=too-many-branches
-    table = {"metadata": {}, "values": ()}
-    for index, row in enumerate(raw_csv):
-        if row:
-            if row[0] == "Row, Column (if applicable)->MinScaleValue:":
-                table["metadata"]["min_age"] = int(row[1])
-            elif row[0] == "Row, Column (if applicable)->MaxScaleValue:":
-                table["metadata"]["max_age"] = int(row[1])
-            elif row[0] == "Row\\Column":
-                table["metadata"]["table_line_start"] = index + 1
-            elif row[0] == "Table Name:":
-                table["metadata"]["name"] = row[1]
-            elif row[0] == "Table Description:":
-                table["metadata"]["description"] = row[1]
-            elif row[0] == "Provider Name:":
-                table["metadata"]["author"] = row[1]
-            elif row[0] == "Table Reference:":
-                table["metadata"]["reference"] = row[1]
-            elif row[0] == "Comments:":
-                table["metadata"]["comments"] = row[1]
-            elif row[0] == "Content Type:":
-                table["metadata"]["content_type"] = row[1]
-            elif row[0] == "Nation:":
-                table["metadata"]["study_nation"] = row[1]
-            elif row[0] == "Row, Column (if applicable)->Increment:":
-                table["metadata"]["table_increment"] = row[1]
-            elif row[0] == "Scaling Factor:":
-                table["metadata"]["scaling_factor"] = row[1]
-            elif row[0] == "Table Identity":
-                table["metadata"]["soa_table_identity"] = row[1]
-    table_start = table["metadata"]["table_line_start"]
-    max_age = table["metadata"]["max_age"]
-    min_age = table["metadata"]["min_age"]
-    table_end = table_start + max_age - min_age + 1
-    table["values"] = tuple([float(row[1]) for row in raw_csv[table_start:table_end]])
-    return table
+    return _parse_soa_csv_mort_table(raw_csv)
+
+
+def _parse_soa_csv_mort_table(rows: Iterable[List[str]]) -> Dict:
+    """
+    Streams the header rows once, then converts the value block straight
+    into a NumPy array without reading the rows that follow it.
+
+    Args:
+        rows: An iterable of csv rows, e.g. a csv.reader
+
+    Returns:
+        A dictionary with a 'values' and 'metadata' key for the first table.
+    """
+    return next(_parse_soa_csv_mort_tables(rows), None) or _empty_table()
+
+
+def _empty_table() -> Dict:
+    """
+    Returns:
+        The result of reading a csv without a table
+    """
+    return {"metadata": {}, "values": np.array([])}
+
+
+def _parse_soa_csv_mort_tables(rows: Iterable[List[str]]) -> Iterator[Dict]:
+    """
+    Args:
+        rows: An iterable of csv rows, e.g. a csv.reader
+
+    Returns:
+        A generator of dictionaries with a 'values' and 'metadata' key, one
+        for each table.  Metadata of the csv that precedes the first table
+        section ('Table # ') is shared by every table and merged with the
+        metadata of each table's own section.  The description of a table
+        section is kept apart from the description of the csv as
+        'table_description'.
+    """
+    file_metadata = {}
+    table_metadata = None
+    index = 0
+    rows = iter(rows)
+    for row in rows:
+        index += 1
+        if not row:
+            continue
+        if row[0] == _TABLE_NUMBER:
+            table_metadata = {}
+        metadata = file_metadata if table_metadata is None else table_metadata
+        if row[0] in _METADATA_KEYS:
+            key = _METADATA_KEYS[row[0]]
+            if table_metadata is not None and key in _TABLE_METADATA_KEYS:
+                key = _TABLE_METADATA_KEYS[key]
+            metadata[key] = row[1]
+        elif row[0] in _INTEGER_METADATA_KEYS:
+            for key, value in zip(_INTEGER_METADATA_KEYS[row[0]], row[1:]):
+                if value:
+                    metadata[key] = int(value)
+        elif row[0] == _TABLE_START:
+            metadata = {
+                **file_metadata,
+                **(table_metadata or {}),
+                "table_line_start": index,
+                "columns": row[1:],
+            }
+            size = metadata["max_age"] - metadata["min_age"] + 1
+            yield {
+                "metadata": metadata,
+                "values": _parse_values(rows, size, len(row) - 1),
+            }
+            index += size
+            table_metadata = {}
+
+
+def _parse_values(rows: Iterator[List[str]], size: int, width: int) -> np.ndarray:
+    """
+    Converts the value block in one vectorized pass.  Empty cells, e.g. the
+    durations past the end of a select period, become NaN.
+
+    Args:
+        rows: csv rows positioned at the start of the value block
+        size: the number of rows in the value block
+        width: the number of value columns in the value block
+
+    Returns:
+        The values of the value block without the row labels, one
+        dimensional for a single column and (rows x columns) otherwise
+    """
+    block = [
+        row[1:][:width] + [""] * (width + 1 - len(row)) for row in islice(rows, size)
+    ]
+    if len(block) != size:
+        raise InvalidSoaTable(
+            f"Expected {size} rows of values but the table ends after {len(block)}!"
+        )
+    cells = np.array(block, dtype=str).reshape(-1, width)
+    blank = np.char.str_len(np.char.strip(cells)) == 0
+    values = np.full(cells.shape, np.nan)
+    values[~blank] = cells[~blank].astype(float)
+    return values[:, 0] if width == 1 else values
+
+
+def _cache_path(file_path) -> str:
+    return os.fspath(file_path) + _CACHE_SUFFIX
+
+
+def _file_sha256(file_path) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as source:
+        for block in iter(lambda: source.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_soa_cache(file_path, encoding: str, delimiter: str):
+    """
+    Args:
+        file_path: The full file system path to the csv
+        encoding: The text encoding the csv is read with
+        delimiter: The delimiter the csv is read with
+
+    Returns:
+        The cached tables or None when there is no valid cache for the csv,
+        e.g. a missing or corrupt sidecar or one written with another
+        encoding or delimiter.
+        A cache whose csv was touched but not changed is rewritten with the
+        new modification time, so later reads skip hashing the csv again.
+    """
+    try:
+        with np.load(_cache_path(file_path), allow_pickle=False) as cached:
+            dialect = str(cached["source_encoding"]), str(cached["source_delimiter"])
+            if dialect != (encoding, delimiter):
+                return None
+            stat = os.stat(file_path)
+            sha256 = None
+            if not (
+                int(cached["source_mtime_ns"]) == stat.st_mtime_ns
+                and int(cached["source_size"]) == stat.st_size
+            ):
+                sha256 = _file_sha256(file_path)
+                if str(cached["source_sha256"]) != sha256:
+                    return None
+            tables = [
+                {"metadata": metadata, "values": cached[f"values_{index}"]}
+                for index, metadata in enumerate(json.loads(str(cached["metadata"])))
+            ]
+    except (OSError, EOFError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+    if sha256 is not None:
+        _write_soa_cache(file_path, tables, encoding, delimiter, sha256)
+    return tables
+
+
+def _write_soa_cache(
+    file_path,
+    tables: List[Dict],
+    encoding: str,
+    delimiter: str,
+    sha256: Optional[str] = None,
+) -> None:
+    """
+    Writes the sidecar cache atomically so concurrent readers never see a
+    partially written file.  Failing to write the cache, e.g. in a read-only
+    directory, leaves no temporary file behind and is otherwise ignored.
+
+    Args:
+        file_path: The full file system path to the csv
+        tables: The parsed tables
+        encoding: The text encoding the csv was read with
+        delimiter: The delimiter the csv was read with
+        sha256: The SHA-256 hash of the csv when it is already known
+    """
+    temporary_path = None
+    try:
+        stat = os.stat(file_path)
+        cache_path = _cache_path(file_path)
+        descriptor, temporary_path = tempfile.mkstemp(
+            dir=os.path.dirname(cache_path) or ".", suffix=_CACHE_SUFFIX
+        )
+        with os.fdopen(descriptor, "wb") as cache_file:
+            np.savez(
+                cache_file,
+                **{
+                    f"values_{index}": table["values"]
+                    for index, table in enumerate(tables)
+                },
+                metadata=json.dumps([table["metadata"] for table in tables]),
+                source_mtime_ns=stat.st_mtime_ns,
+                source_size=stat.st_size,
+                source_sha256=sha256 or _file_sha256(file_path),
+                source_encoding=encoding,
+                source_delimiter=delimiter,
+            )
+        os.replace(temporary_path, cache_path)
+    except OSError:
+        if temporary_path is not None and os.path.exists(temporary_path):
+            os.remove(temporary_path)
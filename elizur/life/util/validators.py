@@ -1,6 +1,10 @@
-from typing import Callable
+import functools
+import inspect
+import numbers
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, NamedTuple, Type
 
-import makefun
+import numpy as np
 
 
 class InvalidInterval(Exception):
@@ -15,16 +19,150 @@ class InvalidAge(Exception):
     """
 
 
-def _get_args_dict(fn, args, kwargs):
-    args_names = fn.__code__.co_varnames[: fn.__code__.co_argcount]
-    return {**dict(zip(args_names, args)), **kwargs}
+class InvalidFrequency(Exception):
+    """
+    Custom exception raised for invalid input payment frequencies (m)
+    """
+
+
+class InvalidAssumption(Exception):
+    """
+    Custom exception raised for unknown fractional age assumptions
+    """
+
+
+_TRUSTED_INPUTS = False
+
+
+def set_trusted_inputs(trusted: bool) -> None:
+    """
+    Globally switches the validation decorators on or off.  Trusted inputs
+    skip every age and interval check, which is useful for production batch
+    runs where the inputs have already been validated.
+
+    Args:
+        trusted: True to skip validation, False to validate inputs
+    """
+    global _TRUSTED_INPUTS  # pylint: disable=global-statement
+    _TRUSTED_INPUTS = bool(trusted)
+
+
+@contextmanager
+def trusted_inputs() -> Iterator[None]:
+    """
+    Context manager that skips input validation within its block and
+    restores the previous validation mode on exit, e.g.
+
+    with trusted_inputs():
+        life_table.Ax(ages, 0.07)
+    """
+    previous = _TRUSTED_INPUTS
+    set_trusted_inputs(True)
+    try:
+        yield
+    finally:
+        set_trusted_inputs(previous)
+
+
+def _is_negative(value: Any) -> bool:
+    if isinstance(value, numbers.Number):
+        return value < 0
+    try:
+        return bool(np.any(np.less(value, 0)))
+    except ValueError:
+        # sequences of differently shaped arrays, e.g. the ages of each life
+        return any(_is_negative(element) for element in value)
+
+
+def _is_not_positive(value: Any) -> bool:
+    if isinstance(value, numbers.Number):
+        return value <= 0
+    try:
+        return bool(np.any(np.less_equal(value, 0)))
+    except ValueError:
+        # sequences of differently shaped arrays, e.g. the terms of each life
+        return any(_is_not_positive(element) for element in value)
+
+
+def _is_not_positive_integer(value: Any) -> bool:
+    return not isinstance(value, numbers.Integral) or value <= 0
+
+
+class _Validation(NamedTuple):
+    position: int
+    name: str
+    default: Any
+    is_invalid: Callable[[Any], bool]
+    exception: Type[Exception]
+    message: str
+
+
+def _validator(
+    name: str,
+    is_invalid: Callable[[Any], bool],
+    exception: Type[Exception],
+    message: str,
+) -> Callable[[Callable], Callable]:
+    """
+    Builds a validation decorator.  The position of the validated argument
+    is resolved once at decoration time and stacked validation decorators
+    are merged into a single wrapper, so each call performs one tuple lookup
+    per validated argument.  A missing required argument is left to the
+    call of the function, which raises the usual TypeError.
+
+    Args:
+        name: name of the validated argument
+        is_invalid: predicate returning True for scalar or array values
+                    that are invalid
+        exception: exception raised for invalid values
+        message: exception message
+
+    Returns:
+        A decorator for validating the argument
+    """
+
+    def decorator(func: Callable) -> Callable:
+        validations = getattr(func, "__validations__", ())
+        func = getattr(func, "__validated__", func)
+        parameter = inspect.signature(func).parameters[name]
+        position = list(inspect.signature(func).parameters).index(name)
+        validations = (
+            _Validation(
+                position,
+                name,
+                parameter.default,
+                is_invalid,
+                exception,
+                message,
+            ),
+            *validations,
+        )
+
+        @functools.wraps(func)
+        def validated_func(*args, **kwargs):
+            if not _TRUSTED_INPUTS:
+                for validation in validations:
+                    if validation.position < len(args):
+                        value = args[validation.position]
+                    else:
+                        value = kwargs.get(validation.name, validation.default)
+                        if value is inspect.Parameter.empty:
+                            continue
+                    if validation.is_invalid(value):
+                        raise validation.exception(validation.message)
+            return func(*args, **kwargs)
+
+        validated_func.__validations__ = validations
+        validated_func.__validated__ = func
+        return validated_func
+
+    return decorator
 
 
 def validate_age(func: Callable) -> Callable:
-    # pylint: disable=unused-argument
     """
     Decorator for validating methods using actuarial notation
-    age input
+    age input.  The age can be a scalar or an array of ages.
 
     Args:
         func: function with inputs to validate
@@ -32,27 +170,15 @@ def validate_age(func: Callable) -> Callable:
     Returns:
         The passed in function wrapped with input validation
     """
-
-    @makefun.wraps(func)
-    def validated_func(*args, **kwargs):
-        """
-        Args:
-            contains an argument named 'x' for age
-        """
-        args_dict = _get_args_dict(func, args, kwargs)
-        if args_dict["x"] < 0:
-            raise InvalidAge("Start age must be greater than or equal to 0!")
-        return func(*args, **kwargs)
-
-    validated_func.__doc__ = func.__doc__
-    return validated_func
+    return _validator(
+        "x", _is_negative, InvalidAge, "Start age must be greater than or equal to 0!"
+    )(func)
 
 
 def validate_interval(func: Callable) -> Callable:
-    # pylint: disable=unused-argument
     """
     Decorator for validating methods using actuarial notation
-    interval input
+    interval input.  The interval can be a scalar or an array of intervals.
 
     Args:
         func: function with inputs to validate
@@ -60,27 +186,35 @@ def validate_interval(func: Callable) -> Callable:
     Returns:
         The passed in function wrapped with input validation
     """
-
-    @makefun.wraps(func)
-    def validated_func(*args, **kwargs):
-        """
-        Args:
-            contains an argument named 'n' for interval
-        """
-        args_dict = _get_args_dict(func, args, kwargs)
-        if args_dict["n"] <= 0:
-            raise InvalidInterval("Interval must be greater than 0!")
-        return func(*args, **kwargs)
-
-    validated_func.__doc__ = func.__doc__
-    return validated_func
+    return _validator(
+        "n", _is_not_positive, InvalidInterval, "Interval must be greater than 0!"
+    )(func)
 
 
 def validate_t_interval(func: Callable) -> Callable:
-    # pylint: disable=unused-argument
     """
     Decorator for validating methods using actuarial notation
-    interval input
+    interval input.  The interval can be a scalar or an array of intervals.
+
+    Args:
+        func: function with inputs to validate
+
+    Returns:
+        The passed in function wrapped with input validation
+    """
+    return _validator(
+        "t",
+        _is_not_positive,
+        InvalidInterval,
+        "Failure interval must be greater than 0!",
+    )(func)
+
+
+def validate_duration(func: Callable) -> Callable:
+    """
+    Decorator for validating methods using select table duration input,
+    the years since selection (t) in [x] + t.  The duration can be a scalar
+    or an array of durations.
 
     Args:
         func: function with inputs to validate
@@ -88,17 +222,29 @@ def validate_t_interval(func: Callable) -> Callable:
     Returns:
         The passed in function wrapped with input validation
     """
+    return _validator(
+        "t",
+        _is_negative,
+        InvalidInterval,
+        "Duration must be greater than or equal to 0!",
+    )(func)
+
+
+def validate_frequency(func: Callable) -> Callable:
+    """
+    Decorator for validating methods using actuarial notation payment
+    frequency input (m), the number of payments per year.  The frequency
+    must be a positive integer.
 
-    @makefun.wraps(func)
-    def validated_func(*args, **kwargs):
-        """
-        Args:
-            contains an argument named 't' for failure interval
-        """
-        args_dict = _get_args_dict(func, args, kwargs)
-        if args_dict["t"] <= 0:
-            raise InvalidInterval("Failure interval must be greater than 0!")
-        return func(*args, **kwargs)
+    Args:
+        func: function with inputs to validate
 
-    validated_func.__doc__ = func.__doc__
-    return validated_func
+    Returns:
+        The passed in function wrapped with input validation
+    """
+    return _validator(
+        "m",
+        _is_not_positive_integer,
+        InvalidFrequency,
+        "Frequency must be an integer greater than 0!",
+    )(func)
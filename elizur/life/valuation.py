@@ -0,0 +1,272 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from elizur.life.table import LifeTable
+from elizur.life.table.table import BENEFITS, STORED_COLUMNS, TERM_BENEFITS
+
+_POLICY_COLUMNS = ("age", "term", "rate", "benefit", "table", "amount")
+
+_WORKER_STATE: Dict = {}
+
+
+class InvalidPortfolio(Exception):
+    """
+    Custom exception raised for invalid portfolio valuation inputs.
+    """
+
+
+class ValuationResult(NamedTuple):
+    """
+    The result of a portfolio valuation.
+
+    Args:
+        seriatim: the actuarial present value of each policy multiplied by
+                  its amount, in the order of the input policies
+        total: the sum of the seriatim values
+    """
+
+    seriatim: np.ndarray
+    total: float
+
+
+def value_portfolio(
+    tables: Union[LifeTable, Sequence[LifeTable]],
+    ages: Union[Iterable, np.ndarray],
+    terms: Union[Iterable, np.ndarray],
+    rates: Union[float, Iterable, np.ndarray],
+    benefits: Union[str, Iterable, np.ndarray],
+    table_ids: Union[int, Iterable, np.ndarray] = 0,
+    amounts: Union[float, Iterable, np.ndarray] = 1.0,
+    processes: Optional[int] = None,
+    chunk_size: int = 100000,
+) -> ValuationResult:
+    # pylint: disable=too-many-arguments,too-many-locals
+    """
+    Values a portfolio of policies with LifeTable actuarial present values,
+    partitioning the policies across a pool of processes.  The policies and
+    the columns of the tables are placed in shared memory once, each worker
+    builds its tables from read-only views of the shared columns without a
+    copy, and each task only carries the bounds of its chunk of policies.
+
+    Args:
+        tables: a LifeTable or a sequence of LifeTables
+        ages: start age of each policy
+        terms: term of each policy, ignored by whole life benefits
+        rates: interest rate of each policy
+        benefits: LifeTable method name of each policy's benefit, one of
+                  Ax, Axn, IAx, IAxn, ax, axn, ax_due, axn_due, or the index
+                  of the method name in BENEFITS
+        table_ids: index into tables of each policy's table
+        amounts: benefit amount of each policy
+        processes: number of worker processes, defaults to the number of
+                   CPUs, 1 values the portfolio in the calling process
+        chunk_size: number of policies valued by a worker task
+
+    Returns:
+        The seriatim and total values of the portfolio
+
+    Example:
+        value_portfolio(
+            LifeTable(EXAMPLE_TABLE),
+            ages=[30, 40, 50],
+            terms=[20, 20, 0],
+            rates=0.05,
+            benefits=["Axn", "axn_due", "Ax"],
+            amounts=[100000, 1200, 50000],
+        )
+    """
+    tables = [tables] if isinstance(tables, LifeTable) else list(tables)
+    policies = _policy_matrix(tables, ages, terms, rates, benefits, table_ids, amounts)
+    size = policies.shape[1]
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes < 1:
+        raise InvalidPortfolio("The number of processes must be at least 1!")
+    if chunk_size <= 0:
+        raise InvalidPortfolio("The chunk size must be greater than 0!")
+    bounds = [
+        (start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)
+    ]
+
+    if processes == 1 or len(bounds) <= 1:
+        seriatim = _value_policies(tables, policies)
+        return ValuationResult(seriatim, float(seriatim.sum()))
+
+    columns, layouts = _table_columns(tables)
+    policy_memory = _share(policies)
+    table_memory = _share(columns)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(processes, len(bounds)),
+            initializer=_initialize_worker,
+            initargs=(
+                policy_memory.name,
+                policies.shape,
+                table_memory.name,
+                columns.shape,
+                layouts,
+                [(table.name, table.description) for table in tables],
+            ),
+        ) as executor:
+            chunks = list(executor.map(_value_chunk, bounds))
+    finally:
+        for memory in (policy_memory, table_memory):
+            memory.close()
+            memory.unlink()
+    seriatim = np.concatenate(chunks)
+    return ValuationResult(seriatim, float(seriatim.sum()))
+
+
+def _policy_matrix(
+    tables: List[LifeTable],
+    ages: Union[Iterable, np.ndarray],
+    terms: Union[Iterable, np.ndarray],
+    rates: Union[float, Iterable, np.ndarray],
+    benefits: Union[str, Iterable, np.ndarray],
+    table_ids: Union[int, Iterable, np.ndarray],
+    amounts: Union[float, Iterable, np.ndarray],
+) -> np.ndarray:
+    # pylint: disable=too-many-arguments
+    """
+    Returns:
+        A validated (columns x policies) float matrix of the policy inputs
+        in the order of _POLICY_COLUMNS
+    """
+    benefits = np.asarray(benefits)
+    if benefits.dtype.kind in "USO":
+        names, inverse = np.unique(benefits, return_inverse=True)
+        unknown = set(names.tolist()) - set(BENEFITS)
+        if unknown:
+            raise InvalidPortfolio(
+                f"Unknown benefits {sorted(unknown)}! Benefits must be one of "
+                f"{BENEFITS}."
+            )
+        benefits = np.array([BENEFITS.index(name) for name in names])[inverse]
+    columns = np.broadcast_arrays(
+        *(np.asarray(column, dtype=float) for column in (ages, terms, rates)),
+        benefits.astype(float),
+        np.asarray(table_ids, dtype=float),
+        np.asarray(amounts, dtype=float),
+    )
+    policies = np.array(columns, dtype=float).reshape(len(_POLICY_COLUMNS), -1)
+    age, term, _, benefit, table, _ = policies
+    if np.any(age < 0):
+        raise InvalidPortfolio("Start ages must be greater than or equal to 0!")
+    if np.any(age % 1 != 0):
+        raise InvalidPortfolio("Start ages must be integers!")
+    if np.any((benefit < 0) | (benefit >= len(BENEFITS))):
+        raise InvalidPortfolio(
+            f"Benefit indexes must be between 0 and {len(BENEFITS)}!"
+        )
+    if np.any((table < 0) | (table >= len(tables))):
+        raise InvalidPortfolio(f"Table ids must be between 0 and {len(tables) - 1}!")
+    term_benefits = np.isin(benefit, [BENEFITS.index(name) for name in TERM_BENEFITS])
+    if np.any(term[term_benefits] <= 0):
+        raise InvalidPortfolio("Terms of temporary benefits must be greater than 0!")
+    if np.any(term[term_benefits] % 1 != 0):
+        raise InvalidPortfolio("Terms of temporary benefits must be integers!")
+    return policies
+
+
+def _value_policies(tables: List[LifeTable], policies: np.ndarray) -> np.ndarray:
+    """
+    Args:
+        tables: the LifeTables referenced by the policies
+        policies: (columns x policies) matrix of policy inputs
+
+    Returns:
+        The amount weighted actuarial present value of each policy
+    """
+    age, term, rate, benefit, table, amount = policies
+    age, term = age.astype(int), term.astype(int)
+    values = np.empty(policies.shape[1])
+    groups = table.astype(int) * len(BENEFITS) + benefit.astype(int)
+    for group in np.unique(groups):
+        members = groups == group
+        life_table = tables[group // len(BENEFITS)]
+        name = BENEFITS[group % len(BENEFITS)]
+        method = getattr(life_table, name)
+        if name in TERM_BENEFITS:
+            values[members] = method(age[members], rate[members], term[members])
+        else:
+            values[members] = method(age[members], rate[members])
+    return values * amount
+
+
+def _share(array: np.ndarray) -> SharedMemory:
+    """
+    Args:
+        array: array to copy into shared memory
+
+    Returns:
+        A shared memory block holding a copy of the array
+    """
+    memory = SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)[...] = array
+    return memory
+
+
+def _table_columns(
+    tables: List[LifeTable],
+) -> Tuple[np.ndarray, List[Dict[str, Tuple[int, int]]]]:
+    """
+    Args:
+        tables: the LifeTables to share
+
+    Returns:
+        The STORED_COLUMNS of every table concatenated into one array and
+        the start and stop index of each column of each table in it
+    """
+    columns = [getattr(table, column) for table in tables for column in STORED_COLUMNS]
+    stops = np.cumsum([column.size for column in columns]).tolist()
+    bounds = iter(zip([0] + stops[:-1], stops))
+    layouts = [{column: next(bounds) for column in STORED_COLUMNS} for _ in tables]
+    return np.concatenate(columns), layouts
+
+
+def _initialize_worker(
+    policy_name: str,
+    policy_shape: Tuple[int, ...],
+    table_name: str,
+    table_shape: Tuple[int, ...],
+    layouts: List[Dict[str, Tuple[int, int]]],
+    labels: List[Tuple[str, str]],
+) -> None:
+    # pylint: disable=too-many-arguments
+    """
+    Attaches a worker process to the shared policies and tables once and
+    builds its LifeTables from views of the shared columns, so the columns
+    are not copied into the worker.
+    """
+    policy_memory = SharedMemory(name=policy_name)
+    table_memory = SharedMemory(name=table_name)
+    columns = np.ndarray(table_shape, dtype=float, buffer=table_memory.buf)
+    _WORKER_STATE["memory"] = (policy_memory, table_memory)
+    _WORKER_STATE["policies"] = np.ndarray(
+        policy_shape, dtype=float, buffer=policy_memory.buf
+    )
+    _WORKER_STATE["tables"] = [
+        LifeTable.from_columns(
+            {column: columns[start:stop] for column, (start, stop) in layout.items()},
+            name=name,
+            description=description,
+        )
+        for layout, (name, description) in zip(layouts, labels)
+    ]
+
+
+def _value_chunk(bounds: Tuple[int, int]) -> np.ndarray:
+    """
+    Args:
+        bounds: start and stop index of the policies to value
+
+    Returns:
+        The amount weighted actuarial present value of each policy
+    """
+    start, stop = bounds
+    policies = _WORKER_STATE["policies"][:, start:stop]
+    return _value_policies(_WORKER_STATE["tables"], policies)
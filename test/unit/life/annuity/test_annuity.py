@@ -389,3 +389,24 @@ def test_geo_increasing_annuity_pv__payment_growth_rate_equals_interest_rate(
         expected,
         atol=1e-03,
     )
+
+
+def test_geo_increasing_annuity_pv__mixed_growth_rates():
+    actual = ann.geo_increasing_annuity_pv(
+        n=[10, 20, 30], i=[0.07, 0.06, 0.05], k=[0, 0.06, 0.08]
+    )
+    assert isinstance(actual, np.ndarray)
+    assert np.allclose(actual, [7.02358154, 18.86792453, 44.27572926])
+
+
+def test_geo_increasing_annuity_pv__broadcasts():
+    actual = ann.geo_increasing_annuity_pv(
+        n=np.array([[10], [20]]), i=[0.05, 0.06], k=[0, 0.03]
+    )
+    assert actual.shape == (2, 2)
+    assert np.isclose(actual[1, 0], ann.annuity_pv(20, 0.05))
+    assert np.isclose(actual[0, 1], ann.geo_increasing_annuity_pv(10, 0.06, 0.03))
+
+
+def test_geo_increasing_annuity_pv__zero_interest_and_growth():
+    assert np.allclose(ann.geo_increasing_annuity_pv(n=[10, 20], i=0, k=0), [10, 20])
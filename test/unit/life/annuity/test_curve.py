@@ -0,0 +1,64 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from elizur.life.annuity import InvalidCurve, YieldCurve
+
+
+SPOT_RATES = (0.02, 0.025, 0.03, 0.032, 0.033)
+
+
+def test_yield_curve__spot_and_forward_rates_agree():
+    curve = YieldCurve(SPOT_RATES)
+    terms = np.arange(1, 6)
+    np.testing.assert_allclose(
+        curve.discount_factor(terms), (1 + np.array(SPOT_RATES)) ** -terms
+    )
+    np.testing.assert_allclose(curve.spot_rates, SPOT_RATES)
+    forward = YieldCurve(curve.forward_rates, kind="forward")
+    np.testing.assert_allclose(forward.spot_rates, SPOT_RATES)
+    assert curve.forward_rates[1] == pytest.approx(1.025**2 / 1.02 - 1)
+
+
+def test_yield_curve__extrapolation_and_fractional_terms():
+    curve = YieldCurve(SPOT_RATES)
+    last_forward = curve.forward_rates[-1]
+    assert curve.discount_factor(0) == 1.0
+    assert curve.discount_factor(8) == pytest.approx(
+        1.033**-5 * (1 + last_forward) ** -3
+    )
+    assert curve.discount_factor(1.5) == pytest.approx(
+        1.02**-1 * (1 + curve.forward_rates[1]) ** -0.5
+    )
+    with pytest.raises(InvalidCurve):
+        curve.discount_factor(-1)
+
+
+def test_yield_curve__flat_rate():
+    assert YieldCurve.flat(0.05).flat_rate == 0.05
+    assert YieldCurve((0.04, 0.04, 0.04)).flat_rate == pytest.approx(0.04)
+    assert YieldCurve(SPOT_RATES).flat_rate is None
+    assert YieldCurve.flat(0.05).discount_factor(30) == pytest.approx(1.05**-30)
+
+
+def test_yield_curve__hashable_and_immutable():
+    curve = YieldCurve(SPOT_RATES)
+    assert curve == YieldCurve(SPOT_RATES)
+    assert hash(curve) == hash(YieldCurve(SPOT_RATES))
+    assert curve != YieldCurve.flat(0.05)
+    assert len({curve, YieldCurve(SPOT_RATES)}) == 1
+    copy = pickle.loads(pickle.dumps(curve))
+    assert copy == curve and hash(copy) == hash(curve)
+    with pytest.raises(AttributeError):
+        curve.spot_rates = np.zeros(5)
+    with pytest.raises(ValueError):
+        curve.spot_rates[0] = 0.0
+
+
+@pytest.mark.parametrize(
+    "rates, kind", [((), "spot"), ((0.02, -1.0), "spot"), ((0.02,), "par")]
+)
+def test_yield_curve__invalid_curves(rates, kind):
+    with pytest.raises(InvalidCurve):
+        YieldCurve(rates, kind=kind)
@@ -0,0 +1,142 @@
+import numpy as np
+import pytest
+
+from elizur.life.table import (
+    EXAMPLE_TABLE,
+    InvalidDecrement,
+    LifeTable,
+    MultipleDecrementTable,
+)
+from elizur.life.util import InvalidAge
+
+
+LAPSE_RATES = np.linspace(0.1, 0.02, len(EXAMPLE_TABLE) - 1).tolist() + [0.0]
+
+
+@pytest.fixture
+def table():
+    return MultipleDecrementTable(
+        {"death": EXAMPLE_TABLE, "lapse": LAPSE_RATES}, independent=True
+    )
+
+
+def expected_insurance(table, cause, x, i, n=None, increasing=False):
+    lxs = table.lxs
+    end = table.table_size if n is None else min(x + n, table.table_size)
+    return sum(
+        (k - x + 1 if increasing else 1)
+        * (1 + i) ** (x - k - 1)
+        * lxs[k]
+        * table.qxs[cause, k]
+        / lxs[x]
+        for k in range(x, end)
+    )
+
+
+def test_multiple_decrement_table__rates(table):
+    death, lapse = np.array(EXAMPLE_TABLE), np.array(LAPSE_RATES)
+    total = 1 - (1 - death) * (1 - lapse)
+    np.testing.assert_allclose(table.qxs.sum(axis=0), total)
+    np.testing.assert_allclose(table.total.qxs, total)
+    np.testing.assert_allclose(table.associated_qxs, [death, lapse])
+    # the dependent rates are less than the associated single decrement rates
+    assert np.all(table.qxs[:, :-1] < table.associated_qxs[:, :-1])
+    assert table.qx(10, "death") == pytest.approx(table.qxs[0, 10])
+    assert table.associated_qx(10, "lapse") == pytest.approx(LAPSE_RATES[10])
+    np.testing.assert_allclose(table.qx([0, 200], 1), [table.qxs[1, 0], 0.0])
+
+
+def test_multiple_decrement_table__rates_beyond_the_table(table):
+    ages = np.array([len(EXAMPLE_TABLE), len(EXAMPLE_TABLE) + 50])
+    np.testing.assert_allclose(table.qx(ages, "death") + table.qx(ages, "lapse"), 1.0)
+    assert table.total.qx(len(EXAMPLE_TABLE)) == 1.0
+    np.testing.assert_allclose(table.associated_qx(ages, "death"), 1.0)
+    truncated = MultipleDecrementTable(
+        {"death": [0.1, 0.2], "lapse": [0.3, 0.0], "disability": [0.0, 0.0]}
+    )
+    np.testing.assert_allclose(
+        [truncated.qx(2, cause) for cause in truncated.causes], [1.0, 0.0, 0.0]
+    )
+    np.testing.assert_allclose(
+        [truncated.associated_qx(5, cause) for cause in truncated.causes],
+        [1.0, 0.0, 0.0],
+    )
+    open_ended = MultipleDecrementTable({"death": [0.1, 0.0], "lapse": [0.2, 0.0]})
+    assert open_ended.qx(2, "death") == open_ended.qx(2, "lapse") == 0.5
+
+
+def test_multiple_decrement_table__round_trip(table):
+    dependent = MultipleDecrementTable(
+        dict(zip(table.causes, table.qxs)), initial_pop=table.lxs[0]
+    )
+    np.testing.assert_allclose(dependent.associated_qxs, table.associated_qxs)
+    np.testing.assert_allclose(dependent.lxs, table.lxs)
+
+
+def test_multiple_decrement_table__lxs_and_dxs(table):
+    np.testing.assert_allclose(table.dxs.sum(axis=0), table.total.dxs)
+    np.testing.assert_allclose(table.cause_lxs.sum(axis=0), table.lxs)
+    np.testing.assert_allclose(table.cause_lxs[:, 0], table.dxs.sum(axis=1))
+    assert table.cause_lxs.shape == (2, table.table_size + 1)
+
+
+def test_multiple_decrement_table__single_decrement_matches_life_table():
+    table = MultipleDecrementTable({"death": EXAMPLE_TABLE})
+    life_table = LifeTable(EXAMPLE_TABLE)
+    ages = np.arange(0, 100, 7)
+    np.testing.assert_allclose(table.Ax(ages, 0.05, "death"), life_table.Ax(ages, 0.05))
+    np.testing.assert_allclose(
+        table.IAxn(ages, 0.05, 10, "death"), life_table.IAxn(ages, 0.05, 10)
+    )
+
+
+def test_multiple_decrement_table__apvs(table):
+    for cause in (0, 1):
+        for x, i, n in ((0, 0.05, 10), (35, 0.03, 20), (90, 0.07, 30)):
+            assert table.Ax(x, i, cause) == pytest.approx(
+                expected_insurance(table, cause, x, i)
+            )
+            assert table.Axn(x, i, n, cause) == pytest.approx(
+                expected_insurance(table, cause, x, i, n)
+            )
+            assert table.IAx(x, i, cause) == pytest.approx(
+                expected_insurance(table, cause, x, i, increasing=True)
+            )
+            assert table.IAxn(x, i, n, cause) == pytest.approx(
+                expected_insurance(table, cause, x, i, n, increasing=True)
+            )
+
+
+def test_multiple_decrement_table__apvs_of_causes_sum_to_total(table):
+    ages, rates = np.meshgrid(np.arange(0, 90, 5), [0.02, 0.05, 0.09])
+    total = table.Axn(ages, rates, 10, "death") + table.Axn(ages, rates, 10, "lapse")
+    np.testing.assert_allclose(total, table.total.Axn(ages, rates, 10))
+    assert total.shape == ages.shape
+
+
+def test_multiple_decrement_table__invalid_inputs(table):
+    with pytest.raises(InvalidDecrement):
+        MultipleDecrementTable({})
+    with pytest.raises(InvalidDecrement):
+        MultipleDecrementTable({"death": [0.1, 0.2], "lapse": [0.1]})
+    with pytest.raises(InvalidDecrement):
+        MultipleDecrementTable({"death": [0.6, 1.0], "lapse": [0.6, 0.0]})
+    with pytest.raises(InvalidDecrement):
+        MultipleDecrementTable({"death": [1.2]}, independent=True)
+    with pytest.raises(InvalidDecrement):
+        table.Ax(30, 0.05, "disability")
+    with pytest.raises(InvalidDecrement):
+        table.Ax(30, 0.05, 2)
+    with pytest.raises(InvalidAge):
+        table.Ax(-1, 0.05, "death")
+
+
+def test_multiple_decrement_table__certain_decrements():
+    table = MultipleDecrementTable(
+        {"death": [0.1, 1.0], "retirement": [0.5, 1.0]}, independent=True
+    )
+    share = np.log(0.9) / np.log(0.45)
+    np.testing.assert_allclose(
+        table.qxs, [[0.55 * share, 0.5], [0.55 * (1 - share), 0.5]]
+    )
+    np.testing.assert_allclose(table.total.qxs, [0.55, 1.0])
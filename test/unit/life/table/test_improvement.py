@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from elizur.life.table import (
+    EXAMPLE_TABLE,
+    InvalidScale,
+    LifeTable,
+    MortalityProjection,
+)
+from elizur.life.util import InvalidAge
+
+
+@pytest.fixture
+def base():
+    return LifeTable(EXAMPLE_TABLE, name="Example")
+
+
+@pytest.fixture
+def scale(base):
+    scale = np.full((base.table_size, 5), 0.01)
+    scale[:, 4] = 0.02
+    return scale
+
+
+@pytest.fixture
+def projection(base, scale):
+    return MortalityProjection(base, scale, 2020)
+
+
+def expected_qx(base, scale, x, year, base_year=2020):
+    def factor(calendar_year):
+        return 1 - scale[x, min(max(calendar_year - base_year - 1, 0), 4)]
+
+    forward = np.prod([factor(k) for k in range(base_year + 1, year + 1)])
+    backward = np.prod([factor(k) for k in range(year + 1, base_year + 1)])
+    return min(base.qxs[x] * forward / backward, 1.0)
+
+
+def test_mortality_projection__qxs(projection, base, scale):
+    years = np.arange(2015, 2031)
+    qxs = projection.qxs(years)
+    assert qxs.shape == (base.table_size, years.size)
+    for x in (0, 50, 99):
+        for column, year in enumerate(years):
+            assert qxs[x, column] == pytest.approx(expected_qx(base, scale, x, year))
+
+
+def test_mortality_projection__base_year(projection, base):
+    assert np.array_equal(projection.qxs(2020), base.qxs)
+
+
+def test_mortality_projection__qx(projection, base, scale):
+    assert projection.qx(50, 2025) == pytest.approx(expected_qx(base, scale, 50, 2025))
+    values = projection.qx([50, 60, 500], [2025, 2018, 2020])
+    assert values[1] == pytest.approx(expected_qx(base, scale, 60, 2018))
+    assert values[2] == 1.0
+    with pytest.raises(InvalidAge):
+        projection.qx(-1, 2020)
+    with pytest.raises(InvalidAge):
+        projection.qx(50.5, 2020)
+    with pytest.raises(InvalidAge):
+        projection.qx(np.array([50.0, 60.0]), 2020)
+    assert projection.qx(np.int64(50), 2025) == projection.qx(50, 2025)
+
+
+def test_mortality_projection__cohort(projection, base, scale):
+    cohort = projection.cohort(1960)
+    assert isinstance(cohort, LifeTable)
+    assert cohort is projection.cohort(1960)
+    assert cohort.name == "Example 1960 cohort"
+    expected = [expected_qx(base, scale, x, 1960 + x) for x in range(base.table_size)]
+    assert np.allclose(projection.cohort_qxs(1960), expected)
+    assert cohort.ax_due(65, 0.04) > base.ax_due(65, 0.04)
+
+
+def test_mortality_projection__age_only_scale(base):
+    projection = MortalityProjection(base, [0.01] * 50, 2000)
+    assert projection.qx(70, 2010) == pytest.approx(base.qxs[70] * 0.99**10)
+
+
+def test_mortality_projection__from_soa_table(base):
+    scale_table = {
+        "metadata": {"min_age": 2, "columns": ["2021", "2022"]},
+        "values": np.array([[0.01, 0.02], [0.03, 0.04]]),
+    }
+    projection = MortalityProjection.from_soa_table(base, scale_table, 2020)
+    assert projection.scale_start_year == 2021
+    assert projection.qx(0, 2021) == pytest.approx(base.qxs[0] * 0.99)
+    assert projection.qx(3, 2022) == pytest.approx(base.qxs[3] * 0.97 * 0.96)
+
+
+def test_mortality_projection__invalid_scale(base):
+    with pytest.raises(InvalidScale):
+        MortalityProjection(base, [], 2020)
+    with pytest.raises(InvalidScale):
+        MortalityProjection(base, [1.5], 2020)
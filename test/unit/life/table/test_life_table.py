@@ -1,10 +1,18 @@
 # pylint: disable=redefined-outer-name
 
+import pickle
+
+import numpy as np
 import pytest
 
-from elizur.life.annuity import discount_factor
+from elizur.life.annuity import InvalidCurve, YieldCurve, discount_factor
 from elizur.life.table import LifeTable
-from elizur.life.util import InvalidAge, InvalidInterval
+from elizur.life.util import (
+    InvalidAge,
+    InvalidAssumption,
+    InvalidFrequency,
+    InvalidInterval,
+)
 
 
 TEST_TABLE = (
@@ -652,3 +660,384 @@ def test_life_table__tqxn_bounds(life_table):
     assert life_table.tqxn(5, 10, life_table.table_size - 9) == 0
     assert life_table.tqxn(5, 10, life_table.table_size - 15) == 1
     assert life_table.tqxn(8, 10, life_table.table_size - 15) == 1
+
+
+def test_life_table__commutation_columns(life_table):
+    columns = life_table.commutation_columns(0.07)
+    for x in (0, 10, 55, life_table.w):
+        assert round(columns.Dxs[x], 7) == round(life_table.Dx(x, 0.07), 7)
+        assert round(columns.Nxs[x], 7) == round(
+            sum(life_table.Dx(n, 0.07) for n in range(x, life_table.w + 1)), 7
+        )
+        assert round(columns.Mxs[x], 7) == round(
+            sum(life_table.Cx(n, 0.07) for n in range(x, life_table.w + 1)), 7
+        )
+        assert round(columns.Sxs[x], 5) == round(
+            sum(life_table.Nx(n, 0.07) for n in range(x, life_table.w + 1)), 5
+        )
+        assert round(columns.Rxs[x], 5) == round(
+            sum(life_table.Mx(n, 0.07) for n in range(x, life_table.w + 1)), 5
+        )
+
+
+def test_life_table__commutation_columns_are_cached(life_table):
+    assert life_table.commutation_columns(0.07) is life_table.commutation_columns(0.07)
+    assert life_table.commutation_columns(0.07) is not (
+        life_table.commutation_columns(0.06)
+    )
+
+
+def test_life_table__commutation_columns_cache_is_bounded():
+    life_table = LifeTable(TEST_TABLE, commutation_cache_size=2)
+    columns = life_table.commutation_columns(0.07)
+    life_table.commutation_columns(0.06)
+    life_table.commutation_columns(0.05)
+    assert columns is not life_table.commutation_columns(0.07)
+
+
+def test_life_table__scalar_rates_index_the_cached_columns(life_table):
+    columns = life_table.commutation_columns(0.07)
+    for rate in (0.07, np.float64(0.07), np.array(0.07)):
+        value = life_table.Dx(40, rate)
+        assert isinstance(value, float)
+        assert value == columns.Dxs[40]
+    assert life_table.Ax(40, 0.07) == columns.Mxs[40] / columns.Dxs[40]
+    assert life_table.Nx(200, 0.07) == 0.0
+
+
+def test_life_table__commutations_of_rates_and_curves(life_table):
+    columns, rows = life_table.commutations(np.array([[0.03], [0.05]]))
+    assert columns.Dxs[rows, 40].shape == (2, 1)
+    assert columns.Dxs[rows, 40][1, 0] == life_table.Dx(40, 0.05)
+    curve = YieldCurve((0.01, 0.02, 0.03, 0.04))
+    columns, rows = life_table.commutations(curve, np.array([30, 40]))
+    np.testing.assert_allclose(
+        columns.Mxs[rows, [30, 40]] / columns.Dxs[rows, [30, 40]],
+        life_table.Ax(np.array([30, 40]), curve),
+    )
+    np.testing.assert_allclose(
+        columns.Dxs[rows, 45] / columns.Dxs[rows, [30, 40]],
+        life_table.npx(np.array([15, 5]), np.array([30, 40]))
+        * curve.discount_factor(np.array([15, 5])),
+    )
+
+
+def test_life_table__commutation_columns_are_read_only(life_table):
+    with pytest.raises(ValueError):
+        life_table.commutation_columns(0.07).Dxs[0] = 0
+
+
+def test_life_table__commutation_bounds(life_table):
+    assert life_table.Dx(1000, 0.07) == 0
+    assert life_table.Nx(1000, 0.07) == 0
+    assert life_table.Mx(1000, 0.07) == 0
+    assert life_table.Rx(life_table.table_size, 0.07) == 0
+
+
+@pytest.mark.parametrize("method", ["Dx", "Nx", "Sx", "Cx", "Mx", "Rx"])
+def test_life_table__commutation_functions_broadcast(life_table, method):
+    ages = np.array([0, 10, 55, 100, 150])
+    rates = np.array([0.07, 0.06, 0.07, 0.05, 0.07])
+    actual = getattr(life_table, method)(ages, rates)
+    expected = [getattr(life_table, method)(x, i) for x, i in zip(ages, rates)]
+    assert np.allclose(actual, expected)
+
+
+@pytest.mark.parametrize("method", ["Ax", "IAx", "ax", "ax_due"])
+def test_life_table__whole_life_apvs_broadcast(life_table, method):
+    ages = np.array([[0, 10, 55], [20, 30, 99]])
+    rates = np.array([0.07, 0.06, 0.05])
+    actual = getattr(life_table, method)(ages, rates)
+    assert actual.shape == (2, 3)
+    for index, x in np.ndenumerate(ages):
+        expected = getattr(life_table, method)(int(x), rates[index[1]])
+        assert round(actual[index], 7) == round(expected, 7)
+
+
+@pytest.mark.parametrize("method", ["Axn", "IAxn", "axn", "axn_due"])
+def test_life_table__temporary_apvs_broadcast(life_table, method):
+    ages = [0, 10, 55, 90]
+    terms = [3, 20, 10, 30]
+    actual = getattr(life_table, method)(ages, 0.07, terms)
+    assert isinstance(actual, np.ndarray)
+    for index, (x, n) in enumerate(zip(ages, terms)):
+        expected = getattr(life_table, method)(x, 0.07, n)
+        assert round(actual[index], 7) == round(expected, 7)
+
+
+def test_life_table__apvs_broadcast_invalid_age(life_table):
+    with pytest.raises(InvalidAge):
+        life_table.Ax(np.array([10, -1]), 0.07)
+
+
+def test_life_table__apvs_broadcast_invalid_interval(life_table):
+    with pytest.raises(InvalidInterval):
+        life_table.Axn(np.array([10, 20]), 0.07, np.array([5, 0]))
+
+
+def test_life_table__exs(life_table):
+    exs = life_table.exs
+    assert exs.size == life_table.table_size
+    for index in range(exs.size):
+        assert round(exs[index], 7) == round(life_table.ex(index), 7)
+    assert round(life_table.ex(0), 7) == round(
+        sum(life_table.lx(t) for t in range(1, life_table.w)) / L0, 7
+    )
+
+
+def test_life_table__ex_array(life_table):
+    actual = life_table.ex(np.array([0, 50, life_table.w - 2, 1000]))
+    assert np.allclose(actual, [life_table.ex(0), life_table.ex(50), 0.758125, 0])
+
+
+def test_life_table__nlxs(life_table):
+    nlxs = life_table.nlxs(10)
+    assert nlxs.size == life_table.table_size
+    for index in range(nlxs.size):
+        assert round(nlxs[index], 5) == round(life_table.nlx(10, index), 5)
+
+
+def test_life_table__ndxs(life_table):
+    ndxs = life_table.ndxs(10)
+    for index in range(ndxs.size):
+        assert round(ndxs[index], 7) == round(life_table.ndx(10, index), 7)
+
+
+def test_life_table__nmxs(life_table):
+    nmxs = life_table.nmxs(10)
+    for index in range(nmxs.size):
+        assert round(nmxs[index], 7) == round(life_table.nmx(10, index), 7)
+
+
+def test_life_table__nlxs_matrix(life_table):
+    nlxs = life_table.nlxs(np.array([1, 5, 20]))
+    assert nlxs.shape == (life_table.table_size, 3)
+    assert round(nlxs[7, 1], 5) == round(life_table.nlx(5, 7), 5)
+    assert round(nlxs[99, 2], 5) == round(life_table.nlx(20, 99), 5)
+
+
+def test_life_table__nlx_ndx_arrays(life_table):
+    ages = np.array([1, 30, 99])
+    terms = np.array([2, 10, 5])
+    nlx = life_table.nlx(terms, ages)
+    ndx = life_table.ndx(terms, ages)
+    for index, (x, n) in enumerate(zip(ages, terms)):
+        assert round(nlx[index], 5) == round(life_table.nlx(int(n), int(x)), 5)
+        assert round(ndx[index], 7) == round(life_table.ndx(int(n), int(x)), 7)
+
+
+def test_life_table__w_without_terminal_failure():
+    life_table = LifeTable(TEST_TABLE[:-1])
+    assert life_table.w == len(TEST_TABLE) - 2
+    assert life_table.ex(life_table.w) == 0
+
+
+def test_life_table__nqxs_matrix(life_table):
+    intervals = np.array([1, 10, 30])
+    nqxs = life_table.nqxs(intervals)
+    assert nqxs.shape == (life_table.table_size, intervals.size)
+    for x in range(life_table.table_size):
+        for index, n in enumerate(intervals):
+            assert round(nqxs[x, index], 10) == round(life_table.nqx(int(n), x), 10)
+
+
+def test_life_table__npxs_matrix(life_table):
+    intervals = np.array([1, 10, 30])
+    npxs = life_table.npxs(intervals)
+    assert npxs.shape == (life_table.table_size, intervals.size)
+    for x in range(life_table.table_size):
+        for index, n in enumerate(intervals):
+            assert round(npxs[x, index], 10) == round(life_table.npx(int(n), x), 10)
+
+
+def test_life_table__tqxns_matrix(life_table):
+    tqxns = life_table.tqxns(np.array([5, 1]), np.array([10, 2]))
+    assert tqxns.shape == (life_table.table_size, 2)
+    for x in range(life_table.table_size - 15):
+        assert round(tqxns[x, 0], 10) == round(life_table.tqxn(5, 10, x), 10)
+        assert round(tqxns[x, 1], 10) == round(life_table.tqxn(1, 2, x), 10)
+
+
+def test_life_table__nqxs_npxs_interval_beyond_table(life_table):
+    assert life_table.nqxs(life_table.table_size + 5).size == 0
+    assert life_table.npxs(life_table.table_size + 5).size == 0
+
+
+def test_life_table__columns_are_read_only(life_table):
+    for column in (
+        life_table.qxs,
+        life_table.pxs,
+        life_table.lxs,
+        life_table.dxs,
+        life_table.mxs,
+        life_table.txs,
+        life_table.exs,
+    ):
+        with pytest.raises(ValueError):
+            column[0] = 0
+
+
+def test_life_table__attributes_are_read_only(life_table):
+    with pytest.raises(AttributeError):
+        life_table.qxs = np.zeros(3)
+    with pytest.raises(AttributeError):
+        life_table.custom_attribute = 1
+    life_table.name = "renamed"
+    assert life_table.name == "renamed"
+
+
+def test_life_table__hash_and_equality(life_table):
+    same_table = LifeTable(list(TEST_TABLE), name="another name")
+    assert same_table == life_table
+    assert hash(same_table) == hash(life_table)
+    assert LifeTable(TEST_TABLE, initial_pop=10) != life_table
+    assert LifeTable(TEST_TABLE[:-1]) != life_table
+    assert len({life_table, same_table}) == 1
+
+
+def test_life_table__pickle(life_table):
+    unpickled = pickle.loads(pickle.dumps(life_table))
+    assert unpickled == life_table
+    assert unpickled.Ax(30, 0.07) == life_table.Ax(30, 0.07)
+
+
+@pytest.mark.parametrize("assumption", ["udd", "constant_force", "balducci"])
+def test_life_table__npx_fractional_integer_ages_match(life_table, assumption):
+    assert life_table.npx(2.0, 40.0, assumption) == pytest.approx(life_table.npx(2, 40))
+
+
+def test_life_table__npx_fractional_assumptions(life_table):
+    x, s = 60, 0.3
+    qx = life_table.qx(x)
+    assert life_table.nqx(s, x) == pytest.approx(s * qx)
+    assert life_table.npx(s, x, "constant_force") == pytest.approx((1 - qx) ** s)
+    assert life_table.nqx(1 - s, x + s, "balducci") == pytest.approx((1 - s) * qx)
+
+
+def test_life_table__npx_fractional_arrays(life_table):
+    values = life_table.npx([0.5, 1.5, 2.25], [40.5, 40, 40.25], "constant_force")
+    assert values.shape == (3,)
+    assert values[1] == pytest.approx(
+        life_table.npx(1, 40) * life_table.npx(0.5, 41, "constant_force")
+    )
+    assert life_table.npx(0.5, 200.5) == 0.0
+    assert life_table.nqx(0.5, 200.5) == 1.0
+
+
+def test_life_table__npx_unknown_assumption(life_table):
+    with pytest.raises(InvalidAssumption):
+        life_table.npx(0.5, 40, "linear")
+
+
+@pytest.mark.parametrize("x", [0, 40, 80])
+def test_life_table__mthly_apvs_udd(life_table, x):
+    i, m = 0.05, 12
+    d = i / (1 + i)
+    im = m * ((1 + i) ** (1 / m) - 1)
+    dm = m * (1 - (1 + i) ** (-1 / m))
+    alpha, beta = i * d / (im * dm), (i - im) / (im * dm)
+    assert life_table.ax_due_m(x, i, m) == pytest.approx(
+        alpha * life_table.ax_due(x, i) - beta
+    )
+    assert life_table.ax_m(x, i, m) == pytest.approx(
+        alpha * life_table.ax_due(x, i) - beta - 1 / m
+    )
+    assert life_table.axn_due_m(x, i, 10, m) == pytest.approx(
+        alpha * life_table.axn_due(x, i, 10)
+        - beta * (1 - life_table.Dx(x + 10, i) / life_table.Dx(x, i))
+    )
+    assert life_table.Ax_m(x, i, m) == pytest.approx(i / im * life_table.Ax(x, i))
+    assert life_table.Axn_m(x, i, 10, m) == pytest.approx(
+        i / im * life_table.Axn(x, i, 10)
+    )
+
+
+@pytest.mark.parametrize("assumption", ["udd", "constant_force", "balducci"])
+def test_life_table__ax_due_m_sums_fractional_survival(life_table, assumption):
+    durations = np.arange((life_table.table_size - 40) * 4 + 1) / 4
+    survival = life_table.npx(
+        durations[1:], np.full(durations.size - 1, 40.0), assumption
+    )
+    expected = np.sum(1.05**-durations * np.insert(survival, 0, 1.0)) / 4
+    assert life_table.ax_due_m(40, 0.05, 4, assumption) == pytest.approx(expected)
+
+
+def test_life_table__mthly_apvs_annual_frequency(life_table):
+    assert life_table.ax_due_m(40, 0.05, 1) == pytest.approx(
+        life_table.ax_due(40, 0.05)
+    )
+    assert life_table.Ax_m(40, 0.05, 1) == pytest.approx(life_table.Ax(40, 0.05))
+
+
+def test_life_table__mthly_apvs_broadcast(life_table):
+    values = life_table.ax_due_m([40, 50], [0.05, 0.04], 12)
+    assert values[0] == life_table.ax_due_m(40, 0.05, 12)
+    assert values[1] == life_table.ax_due_m(50, 0.04, 12)
+    with pytest.raises(InvalidFrequency):
+        life_table.ax_due_m(40, 0.05, 0)
+    with pytest.raises(InvalidFrequency):
+        life_table.Ax_m(40, 0.05, 2.5)
+    assert life_table.ax_due_m(40, 0.05, np.int64(12)) == values[0]
+
+
+CURVE = YieldCurve(np.linspace(0.01, 0.05, 30))
+
+
+def curve_apv(life_table, x, n, benefit):
+    lxs = life_table._padded_lxs
+    discount = CURVE.discount_factor(np.arange(n + 2))
+    terms = range(min(n, life_table.table_size - x))
+    if benefit == "axn_due":
+        return sum(discount[k] * lxs[x + k] / lxs[x] for k in terms)
+    deaths = [(lxs[x + k] - lxs[x + k + 1]) / lxs[x] for k in terms]
+    weights = [k + 1 for k in terms] if benefit == "IAxn" else [1] * len(deaths)
+    return sum(w * discount[k + 1] * d for k, (w, d) in enumerate(zip(weights, deaths)))
+
+
+@pytest.mark.parametrize("x, n", [(0, 10), (40, 20), (90, 30)])
+def test_life_table__yield_curve_apvs(life_table, x, n):
+    assert life_table.axn_due(x, CURVE, n) == pytest.approx(
+        curve_apv(life_table, x, n, "axn_due")
+    )
+    assert life_table.Axn(x, CURVE, n) == pytest.approx(
+        curve_apv(life_table, x, n, "Axn")
+    )
+    assert life_table.IAxn(x, CURVE, n) == pytest.approx(
+        curve_apv(life_table, x, n, "IAxn")
+    )
+    assert life_table.Ax(x, CURVE) == pytest.approx(
+        curve_apv(life_table, x, life_table.table_size, "Axn")
+    )
+    assert life_table.ax(x, CURVE) == pytest.approx(life_table.ax_due(x, CURVE) - 1)
+    assert life_table.axn(x, CURVE, n) == pytest.approx(
+        life_table.axn_due(x, CURVE, n + 1) - 1
+    )
+
+
+def test_life_table__yield_curve_apvs_broadcast(life_table):
+    ages = np.array([[20], [40], [60]])
+    terms = np.array([5, 10, 20])
+    values = life_table.axn_due(ages, CURVE, terms)
+    assert values.shape == (3, 3)
+    assert values[1, 2] == life_table.axn_due(40, CURVE, 20)
+    assert life_table.IAx(ages, CURVE).shape == (3, 1)
+
+
+def test_life_table__yield_curve_commutation_functions(life_table):
+    ages = np.arange(life_table.table_size)
+    np.testing.assert_allclose(
+        life_table.Dx(ages, CURVE),
+        CURVE.discount_factor(ages) * life_table.lxs[: life_table.table_size],
+    )
+    columns = life_table.commutation_columns(CURVE)
+    assert columns is life_table.commutation_columns(CURVE)
+    assert life_table.Nx(30, CURVE) == pytest.approx(columns.Nxs[30])
+
+
+def test_life_table__flat_yield_curve_matches_rate(life_table):
+    flat = YieldCurve.flat(0.05)
+    assert life_table.commutation_columns(flat) is life_table.commutation_columns(0.05)
+    assert life_table.Axn(30, flat, 20) == life_table.Axn(30, 0.05, 20)
+    assert life_table.ax_due_m(30, flat, 12) == life_table.ax_due_m(30, 0.05, 12)
+    with pytest.raises(InvalidCurve):
+        life_table.ax_due_m(30, CURVE, 12)
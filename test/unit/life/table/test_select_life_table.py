@@ -0,0 +1,148 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from elizur.life.table import EXAMPLE_TABLE, LifeTable, SelectLifeTable
+from elizur.life.util import InvalidAge, InvalidInterval
+
+ULTIMATE = np.array(EXAMPLE_TABLE)
+SELECT = np.column_stack([ULTIMATE[:80] * factor for factor in (0.5, 0.7, 0.9)])
+
+
+@pytest.fixture
+def select_table():
+    return SelectLifeTable(SELECT, ULTIMATE)
+
+
+def test_select_life_table__columns_are_matrices(select_table):
+    assert select_table.qxs.shape == (80, 3)
+    assert select_table.lxs.shape == (80, 4)
+    assert select_table.dxs.shape == (80, 3)
+    assert select_table.select_period == 3
+
+
+def test_select_life_table__qx(select_table):
+    assert select_table.qx(30) == SELECT[30, 0]
+    assert select_table.qx(30, 2) == SELECT[30, 2]
+    assert select_table.qx(30, 3) == ULTIMATE[33]
+    assert select_table.qx(90) == ULTIMATE[90]
+    assert select_table.qx(200) == 1.0
+    assert select_table.px(200) == 0.0
+    assert np.array_equal(
+        select_table.qx([30, 30, 30], [0, 1, 3]),
+        [SELECT[30, 0], SELECT[30, 1], ULTIMATE[33]],
+    )
+
+
+def test_select_life_table__lx_joins_ultimate_after_select_period(select_table):
+    ultimate = LifeTable(ULTIMATE)
+    assert select_table.lx(30, 3) == pytest.approx(ultimate.lx(33))
+    assert select_table.lx(30, 10) == pytest.approx(ultimate.lx(40))
+    assert select_table.lx(30) < ultimate.lx(30)
+
+
+def test_select_life_table__empty_cells_use_ultimate():
+    select = np.full((3, 2), np.nan)
+    select[0, 0] = 0.5
+    select_table = SelectLifeTable(select, ULTIMATE)
+    assert select_table.qx(0) == 0.5
+    assert select_table.qx(0, 1) == ULTIMATE[1]
+    assert select_table.qx(1) == ULTIMATE[1]
+
+
+def test_select_life_table__without_selection_matches_ultimate():
+    select_table = SelectLifeTable(np.full((5, 2), np.nan), ULTIMATE)
+    ultimate = LifeTable(ULTIMATE)
+    assert select_table.Ax(40, 0.05) == pytest.approx(ultimate.Ax(40, 0.05))
+    assert select_table.Ax(40, 0.05, 5) == pytest.approx(ultimate.Ax(45, 0.05))
+    assert select_table.Dx(40, 0.05) == pytest.approx(ultimate.Dx(40, 0.05))
+    assert select_table.Nx(40, 0.05, 2) == pytest.approx(ultimate.Nx(42, 0.05))
+
+
+@pytest.mark.parametrize("x", [0, 30, 79, 80])
+def test_select_life_table__apvs_match_issue_age_life_tables(select_table, x):
+    issue_age_table = LifeTable(select_table.qx(x, np.arange(ULTIMATE.size)))
+    for name in ("Ax", "IAx", "ax", "ax_due"):
+        assert getattr(select_table, name)(x, 0.05) == pytest.approx(
+            getattr(issue_age_table, name)(0, 0.05)
+        )
+        assert getattr(select_table, name)(x, 0.05, 2) == pytest.approx(
+            getattr(issue_age_table, name)(2, 0.05)
+        )
+    for name in ("Axn", "IAxn", "axn", "axn_due"):
+        assert getattr(select_table, name)(x, 0.05, 10) == pytest.approx(
+            getattr(issue_age_table, name)(0, 0.05, 10)
+        )
+        assert getattr(select_table, name)(x, 0.05, 10, 1) == pytest.approx(
+            getattr(issue_age_table, name)(1, 0.05, 10)
+        )
+
+
+def test_select_life_table__apvs_broadcast(select_table):
+    values = select_table.Axn([30, 40, 50], [0.07, 0.06, 0.05], 20, [0, 1, 2])
+    expected = [
+        select_table.Axn(30, 0.07, 20),
+        select_table.Axn(40, 0.06, 20, 1),
+        select_table.Axn(50, 0.05, 20, 2),
+    ]
+    assert values.shape == (3,)
+    assert np.allclose(values, expected)
+    assert select_table.ax_due(np.array([[30], [40]]), [0.05, 0.06]).shape == (2, 2)
+
+
+def test_select_life_table__npx(select_table):
+    assert select_table.npx(3, 30) == pytest.approx(
+        (1 - SELECT[30, 0]) * (1 - SELECT[30, 1]) * (1 - SELECT[30, 2])
+    )
+    assert select_table.nqx(1, 30, 3) == pytest.approx(ULTIMATE[33])
+    assert select_table.dx(30) == pytest.approx(select_table.lx(30) * SELECT[30, 0])
+
+
+def test_select_life_table__commutation_columns_are_cached(select_table):
+    columns = select_table.commutation_columns(0.05)
+    assert columns is select_table.commutation_columns(0.05)
+    assert columns.Dxs.shape == (80, 4)
+    assert not columns.Mxs.flags.writeable
+
+
+def test_select_life_table__ultimate_columns_after_select_period(select_table):
+    ultimate = LifeTable(ULTIMATE)
+    selected = np.arange(3)
+    for name in ("Dx", "Nx", "Mx", "Rx"):
+        assert getattr(select_table, name)(30, 0.05, 3) == pytest.approx(
+            getattr(ultimate, name)(33, 0.05)
+        )
+        assert getattr(select_table, name)(90, 0.05, 1) == pytest.approx(
+            getattr(ultimate, name)(91, 0.05)
+        )
+    assert select_table.Nx(30, 0.05) == pytest.approx(
+        np.sum(select_table.Dx(30, 0.05, selected)) + ultimate.Nx(33, 0.05)
+    )
+    assert select_table.Mx(30, 0.05) == pytest.approx(
+        np.sum(select_table.Cx(30, 0.05, selected)) + ultimate.Mx(33, 0.05)
+    )
+
+
+def test_select_life_table__invalid_inputs(select_table):
+    with pytest.raises(InvalidAge):
+        select_table.Ax(-1, 0.05)
+    with pytest.raises(InvalidInterval):
+        select_table.Ax(30, 0.05, -1)
+    with pytest.raises(InvalidInterval):
+        select_table.Axn(30, 0.05, 0)
+
+
+def test_select_life_table__read_only(select_table):
+    with pytest.raises(AttributeError):
+        select_table.qxs = None
+    with pytest.raises(ValueError):
+        select_table.qxs[0, 0] = 1.0
+    select_table.name = "Select"
+    assert select_table.name == "Select"
+
+
+def test_select_life_table__pickle(select_table):
+    copied_table = pickle.loads(pickle.dumps(select_table))
+    assert np.array_equal(copied_table.qxs, select_table.qxs)
+    assert copied_table.Ax(30, 0.05) == select_table.Ax(30, 0.05)
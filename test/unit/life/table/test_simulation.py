@@ -0,0 +1,114 @@
+# pylint: disable=redefined-outer-name
+import numpy as np
+import pytest
+
+from elizur.life.table import (
+    EXAMPLE_TABLE,
+    SIMULATED_BENEFITS,
+    InvalidSimulation,
+    LifeTable,
+    simulate_lifetime_chunks,
+    simulate_lifetimes,
+    simulated_present_values,
+)
+from elizur.life.util import InvalidAge, InvalidAssumption
+
+
+LIVES = 200000
+
+
+@pytest.fixture(scope="module")
+def life_table():
+    return LifeTable(EXAMPLE_TABLE)
+
+
+@pytest.fixture(scope="module")
+def lifetimes(life_table):
+    return simulate_lifetimes(life_table, 40, size=LIVES, seed=1)
+
+
+def test_simulate_lifetimes__curtate_distribution(life_table, lifetimes):
+    assert lifetimes.dtype.kind == "i"
+    assert lifetimes.min() >= 0 and lifetimes.max() <= life_table.w - 40
+    counts = np.bincount(lifetimes, minlength=life_table.table_size - 40)
+    expected = life_table.dxs[40:] / life_table.lxs[40]
+    standard_error = np.sqrt(expected * (1 - expected) / LIVES)
+    assert np.all(np.abs(counts / LIVES - expected) < 5 * standard_error + 1e-12)
+    assert lifetimes.mean() == pytest.approx(life_table.ex(40), abs=0.1)
+
+
+@pytest.mark.parametrize("benefit", SIMULATED_BENEFITS)
+def test_simulated_present_values__mean_is_the_apv(life_table, lifetimes, benefit):
+    present_values = simulated_present_values(lifetimes, 0.05, benefit, n=20)
+    args = (40, 0.05, 20) if benefit.endswith(("n", "n_due")) else (40, 0.05)
+    expected = getattr(life_table, benefit)(*args)
+    standard_error = present_values.std() / np.sqrt(LIVES)
+    assert abs(present_values.mean() - expected) < 5 * standard_error
+
+
+@pytest.mark.parametrize("assumption", ["udd", "constant_force", "balducci"])
+def test_simulate_lifetimes__fractional_survival(life_table, assumption):
+    lifetimes = simulate_lifetimes(
+        life_table, 40, size=LIVES, assumption=assumption, seed=2
+    )
+    assert lifetimes.dtype.kind == "f"
+    for t in (0.5, 10.25, 30.75):
+        expected = life_table.npx(t, 40, assumption)
+        standard_error = np.sqrt(expected * (1 - expected) / LIVES)
+        assert abs(np.mean(lifetimes > t) - expected) < 5 * standard_error
+    curtate = simulate_lifetimes(life_table, 40, size=LIVES, seed=2)
+    np.testing.assert_array_equal(np.floor(lifetimes), curtate)
+
+
+def test_simulate_lifetimes__arrays_of_start_ages(life_table):
+    ages = np.array([0, 30, 60, 90])
+    lifetimes = simulate_lifetimes(life_table, ages, size=(50000, 4), seed=3)
+    assert lifetimes.shape == (50000, 4)
+    np.testing.assert_allclose(
+        lifetimes.mean(axis=0), life_table.ex(ages), rtol=0.02, atol=0.05
+    )
+    assert simulate_lifetimes(life_table, ages, seed=3).shape == (4,)
+
+
+def test_simulate_lifetimes__reproducible_streams(life_table):
+    first = simulate_lifetimes(life_table, 50, size=10000, seed=4, chunk_size=3000)
+    np.testing.assert_array_equal(
+        first,
+        simulate_lifetimes(
+            life_table, 50, size=10000, seed=4, chunk_size=3000, max_workers=3
+        ),
+    )
+    np.testing.assert_array_equal(
+        first,
+        np.concatenate(
+            list(
+                simulate_lifetime_chunks(
+                    life_table, 50, size=10000, seed=4, chunk_size=3000
+                )
+            )
+        ),
+    )
+    chunks = list(
+        simulate_lifetime_chunks(life_table, 50, size=10000, seed=4, chunk_size=3000)
+    )
+    assert [chunk.size for chunk in chunks] == [3000, 3000, 3000, 1000]
+    # every chunk draws from an independent stream
+    assert not np.array_equal(chunks[0], chunks[1])
+    assert not np.array_equal(
+        first, simulate_lifetimes(life_table, 50, size=10000, seed=5)
+    )
+
+
+def test_simulate_lifetimes__invalid_inputs(life_table):
+    with pytest.raises(InvalidAge):
+        simulate_lifetimes(life_table, -1, size=10)
+    with pytest.raises(InvalidAge):
+        simulate_lifetimes(life_table, life_table.w + 1, size=10)
+    with pytest.raises(InvalidAge):
+        simulate_lifetimes(life_table, 40.5, size=10)
+    with pytest.raises(InvalidAssumption):
+        simulate_lifetime_chunks(life_table, 40, size=10, assumption="linear")
+    with pytest.raises(InvalidSimulation):
+        simulated_present_values(np.arange(10), 0.05, "Ex")
+    with pytest.raises(InvalidSimulation):
+        simulated_present_values(np.arange(10), 0.05, "Axn")
@@ -0,0 +1,146 @@
+import numpy as np
+import pytest
+
+from elizur.life.table import (
+    EXAMPLE_TABLE,
+    InvalidStatus,
+    JointLifeStatus,
+    LastSurvivorStatus,
+    LifeTable,
+)
+from elizur.life.table.status import _Status
+from elizur.life.util import InvalidAge, InvalidInterval
+
+
+@pytest.fixture
+def first_table():
+    return LifeTable(EXAMPLE_TABLE)
+
+
+@pytest.fixture
+def second_table():
+    return LifeTable(np.array(EXAMPLE_TABLE) * 0.8)
+
+
+@pytest.fixture
+def joint(first_table, second_table):
+    return JointLifeStatus(first_table, second_table)
+
+
+@pytest.fixture
+def last_survivor(first_table, second_table):
+    return LastSurvivorStatus(first_table, second_table)
+
+
+def survival(table, x, durations):
+    lxs = np.append(table.lxs[: table.table_size], 0.0)
+    return lxs[np.minimum(x + durations, table.table_size)] / lxs[x]
+
+
+def expected_apvs(tpxys, i, n):
+    v = 1 / (1 + i)
+    durations = np.arange(n)
+    insurance = np.sum(v ** (durations + 1) * (tpxys[:n] - tpxys[1:][:n]))
+    annuity_due = np.sum(v**durations * tpxys[:n])
+    return insurance, annuity_due
+
+
+@pytest.mark.parametrize("x, y", [(65, 62), (30, 50), (90, 95)])
+def test_joint_life_status__apvs(joint, first_table, second_table, x, y):
+    durations = np.arange(150)
+    tpxys = survival(first_table, x, durations) * survival(second_table, y, durations)
+    insurance, annuity_due = expected_apvs(tpxys, 0.05, 149)
+    assert joint.Axy((x, y), 0.05) == pytest.approx(insurance)
+    assert joint.axy_due((x, y), 0.05) == pytest.approx(annuity_due)
+    assert joint.axy((x, y), 0.05) == pytest.approx(annuity_due - 1)
+    insurance, annuity_due = expected_apvs(tpxys, 0.05, 10)
+    assert joint.Axyn((x, y), 0.05, 10) == pytest.approx(insurance)
+    assert joint.axyn_due((x, y), 0.05, 10) == pytest.approx(annuity_due)
+
+
+@pytest.mark.parametrize("x, y", [(65, 62), (30, 50), (90, 95)])
+def test_last_survivor_status__apvs(last_survivor, first_table, second_table, x, y):
+    durations = np.arange(150)
+    tpx = survival(first_table, x, durations)
+    tpy = survival(second_table, y, durations)
+    tpxys = tpx + tpy - tpx * tpy
+    insurance, annuity_due = expected_apvs(tpxys, 0.05, 149)
+    assert last_survivor.Axy((x, y), 0.05) == pytest.approx(insurance)
+    assert last_survivor.axy_due((x, y), 0.05) == pytest.approx(annuity_due)
+    insurance, annuity_due = expected_apvs(tpxys, 0.05, 10)
+    assert last_survivor.Axyn((x, y), 0.05, 10) == pytest.approx(insurance)
+    assert last_survivor.axyn_due((x, y), 0.05, 10) == pytest.approx(annuity_due)
+
+
+def test_last_survivor_status__inclusion_exclusion(
+    last_survivor, joint, first_table, second_table
+):
+    assert last_survivor.IAxyn((60, 55), 0.04, 15) == pytest.approx(
+        first_table.IAxn(60, 0.04, 15)
+        + second_table.IAxn(55, 0.04, 15)
+        - joint.IAxyn((60, 55), 0.04, 15)
+    )
+
+
+def test_joint_life_status__single_life_matches_life_table(first_table):
+    status = JointLifeStatus(first_table)
+    assert status.Axy((40,), 0.05) == pytest.approx(first_table.Ax(40, 0.05))
+    assert status.IAxy((40,), 0.05) == pytest.approx(first_table.IAx(40, 0.05))
+    assert status.axyn((40,), 0.05, 10) == pytest.approx(first_table.axn(40, 0.05, 10))
+    assert status.axy((40,), 0.05) == pytest.approx(first_table.ax(40, 0.05))
+
+
+def test_joint_life_status__apvs_broadcast(joint):
+    values = joint.Axy(([65, 70], [62, 66]), [0.05, 0.04])
+    assert values.shape == (2,)
+    assert values[0] == pytest.approx(joint.Axy((65, 62), 0.05))
+    assert values[1] == pytest.approx(joint.Axy((70, 66), 0.04))
+    assert joint.axy_due(([[60], [70]], [55, 60, 65]), 0.05).shape == (2, 3)
+
+
+def test_joint_life_status__commutation_columns_are_cached(joint):
+    columns = joint.commutation_columns(0.05, (-3,))
+    assert columns is joint.commutation_columns(0.05, (-3,))
+    assert not columns.Dxs.flags.writeable
+    with pytest.raises(InvalidStatus):
+        joint.commutation_columns(0.05, (1, 2))
+
+
+def test_status__tpxy(joint, last_survivor, first_table, second_table):
+    tpx = survival(first_table, 65, 10)
+    tpy = survival(second_table, 62, 10)
+    assert joint.tpxy(10, (65, 62)) == pytest.approx(tpx * tpy)
+    assert last_survivor.tpxy(10, (65, 62)) == pytest.approx(tpx + tpy - tpx * tpy)
+    assert joint.tpxy([1, 5, 10], (65, 62)).shape == (3,)
+
+
+def test_status__tpxys(joint, last_survivor):
+    tpxys = joint.tpxys(10)
+    assert tpxys.shape == (101, 101)
+    assert tpxys[65, 62] == pytest.approx(joint.tpxy(10, (65, 62)))
+    assert last_survivor.tpxys([1, 10]).shape == (101, 101, 2)
+    assert last_survivor.tpxys([1, 10])[65, 62, 1] == pytest.approx(
+        last_survivor.tpxy(10, (65, 62))
+    )
+
+
+def test_status__invalid_inputs(joint, last_survivor):
+    with pytest.raises(InvalidStatus):
+        JointLifeStatus()
+    with pytest.raises(InvalidStatus):
+        joint.Axy((65,), 0.05)
+    with pytest.raises(InvalidAge):
+        last_survivor.Axy((65, -1), 0.05)
+    with pytest.raises(InvalidAge):
+        joint.Axy(([65, 70], [-1, 60]), 0.05)
+    with pytest.raises(InvalidAge):
+        joint.Axy((65.7, 62), 0.05)
+    with pytest.raises(InvalidAge):
+        last_survivor.tpxy(1, (65, np.array([62.5])))
+    with pytest.raises(InvalidInterval):
+        joint.Axyn((65, 62), 0.05, 0)
+
+
+def test_status__base_status_is_abstract(first_table):
+    with pytest.raises(TypeError):
+        _Status(first_table)
@@ -0,0 +1,65 @@
+import shutil
+from os.path import join
+
+import pytest
+
+from elizur.life.table import InvalidTable, LifeTable, SelectLifeTable, TableLibrary
+
+FIXTURES = join("test", "unit", "life", "util")
+
+
+@pytest.fixture
+def library_directory(tmp_path):
+    for file_name in ("mortality_table_1.csv", "select_mortality_table.csv"):
+        shutil.copy(join(FIXTURES, file_name), tmp_path / file_name)
+    return tmp_path
+
+
+@pytest.fixture
+def library(library_directory):
+    return TableLibrary(library_directory, max_workers=2)
+
+
+def test_table_library__indexes_identities(library):
+    assert len(library) == 2
+    assert sorted(library) == ["1", "900"]
+    assert "1" in library
+    assert "1941 CSO Basic Table, ANB" in library
+    assert "2" not in library
+
+
+def test_table_library__constructs_life_tables_lazily(library):
+    assert not library.is_loaded("1")
+    life_table = library["1"]
+    assert isinstance(life_table, LifeTable)
+    assert library.is_loaded("1")
+    assert library["1941 CSO Basic Table, ANB"] is life_table
+    assert life_table.name == "1941 CSO Basic Table, ANB"
+    assert life_table.qx(77) == 0.10364
+
+
+def test_table_library__tables(library):
+    select, ultimate = library.tables("900")
+    assert select["values"].shape == (5, 3)
+    assert ultimate["values"].shape == (10,)
+
+
+def test_table_library__unknown_key(library):
+    with pytest.raises(KeyError):
+        library["missing"]
+
+
+def test_table_library__constructs_select_life_tables(library):
+    select_table = library["900"]
+    assert isinstance(select_table, SelectLifeTable)
+    assert select_table.select_period == 3
+    assert select_table.qx(1, 2) == 0.0021
+    assert select_table.qx(4, 2) == 0.0067
+
+
+def test_table_library__duplicate_identities(library_directory):
+    shutil.copy(
+        library_directory / "mortality_table_1.csv", library_directory / "copy.csv"
+    )
+    with pytest.raises(InvalidTable):
+        TableLibrary(library_directory)
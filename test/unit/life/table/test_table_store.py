@@ -0,0 +1,88 @@
+import json
+import pickle
+
+import numpy as np
+import pytest
+
+from elizur.life.table import (
+    EXAMPLE_TABLE,
+    InvalidTableStore,
+    LifeTable,
+    TableStore,
+    write_table_store,
+)
+from elizur.life.table.table import STORED_COLUMNS
+
+
+@pytest.fixture
+def life_tables():
+    return {
+        "example": LifeTable(EXAMPLE_TABLE, name="Example", description="Example"),
+        "short": LifeTable((0.1, 0.2, 0.5, 1.0), initial_pop=1000),
+    }
+
+
+@pytest.fixture
+def store(life_tables, tmp_path):
+    path = tmp_path / "tables.bin"
+    write_table_store(path, life_tables)
+    return TableStore(path)
+
+
+def test_table_store__keys(store):
+    assert sorted(store) == ["example", "short"]
+    assert len(store) == 2
+    assert "missing" not in store
+
+
+def test_table_store__tables_equal_originals(store, life_tables):
+    for key, life_table in life_tables.items():
+        stored_table = store[key]
+        assert stored_table == life_table
+        assert hash(stored_table) == hash(life_table)
+        assert stored_table.w == life_table.w
+        assert stored_table.name == life_table.name
+        assert np.array_equal(stored_table.exs, life_table.exs)
+
+
+def test_table_store__calculations_match_originals(store, life_tables):
+    stored_table, life_table = store["example"], life_tables["example"]
+    assert stored_table.Ax(0, 0.07) == life_table.Ax(0, 0.07)
+    assert stored_table.axn_due(30, 0.05, 20) == life_table.axn_due(30, 0.05, 20)
+    assert stored_table.ex(40) == life_table.ex(40)
+    assert stored_table.nqx(5, 60) == life_table.nqx(5, 60)
+
+
+def test_table_store__columns_are_read_only_memory_maps(store):
+    stored_table = store["short"]
+    assert isinstance(stored_table.qxs, np.memmap)
+    assert not stored_table.lxs.flags.writeable
+    with pytest.raises(ValueError):
+        stored_table.qxs[0] = 0.5
+
+
+def test_table_store__unsupported_version(life_tables, tmp_path):
+    path = tmp_path / "tables.bin"
+    write_table_store(path, life_tables)
+    index_path = tmp_path / "tables.bin.json"
+    index = json.loads(index_path.read_text())
+    index_path.write_text(json.dumps({**index, "version": 99}))
+    with pytest.raises(InvalidTableStore):
+        TableStore(path)
+
+
+def test_table_store__tables_are_reused(store):
+    assert store["example"] is store["example"]
+
+
+def test_table_store__tables_pickle(store, life_tables):
+    assert pickle.loads(pickle.dumps(store["short"])) == life_tables["short"]
+
+
+def test_life_table__from_columns(life_tables):
+    life_table = life_tables["short"]
+    columns = {column: getattr(life_table, column) for column in STORED_COLUMNS}
+    copied_table = LifeTable.from_columns(columns, name="copy")
+    assert copied_table == life_table
+    assert copied_table.qxs is life_table.qxs
+    assert copied_table.name == "copy"
@@ -2,7 +2,12 @@
 import numpy as np
 import pytest
 
-from elizur.life import expected_present_value, InvalidEPVInputs
+from elizur.life import (
+    chunked_expected_present_value,
+    expected_present_value,
+    expected_present_value_blocks,
+    InvalidEPVInputs,
+)
 from elizur.life.table import LifeTable
 
 
@@ -205,16 +210,103 @@ def test_expected_present_value__raises_InvalidEPVInputs_when_lengths_do_not_mat
         assert True
 
 
-def test_expected_present_value__raises_InvalidEPVInputs_when_ndim_greater_than_2(
+def test_expected_present_value__raises_InvalidEPVInputs_when_shapes_do_not_broadcast(
     life_table,
 ):
     n = 100
     probabilities = life_table.get_pxs()[:n]
-    cash_flows = np.array([[tuple([1] * n), tuple([1] * n), tuple([1] * n)]])
-    interest_rates = tuple([0.07] * n)
+    cash_flows = np.ones((3, n))
+    interest_rates = np.full((2, n), 0.07)
 
-    try:
+    with pytest.raises(InvalidEPVInputs):
         expected_present_value(cash_flows, probabilities, interest_rates)
-        assert False
-    except InvalidEPVInputs:
-        assert True
+
+
+def test_expected_present_value__three_dimensions(life_table):
+    n = 100
+    rates = np.array([0.07, 0.06, 0.05])
+    probabilities = np.array(life_table.get_pxs()[:n])
+    cash_flows = np.ones((4, 1, n))
+    interest_rates = np.repeat(rates, n).reshape(1, 3, n)
+
+    epv = expected_present_value(cash_flows, probabilities, interest_rates)
+
+    assert epv.shape == (4, 3)
+    for i, rate in enumerate(rates):
+        expected = expected_present_value(np.ones(n), probabilities, np.full(n, rate))
+        assert np.allclose(epv[:, i], expected)
+
+
+def test_expected_present_value__shared_rate_curve(life_table):
+    n = 100
+    probabilities = np.array([life_table.pxs[:n], life_table.pxs[1:][:n]])
+    cash_flows = np.array([np.ones(n), np.arange(n)])
+    interest_rates = np.linspace(0.03, 0.07, n)
+
+    epv = expected_present_value(cash_flows, probabilities, interest_rates)
+
+    for row in range(2):
+        expected = expected_present_value(
+            cash_flows[row], probabilities[row], interest_rates
+        )
+        assert np.isclose(epv[row], expected)
+
+
+@pytest.fixture
+def policy_block(life_table):
+    n = 50
+    rows = 23
+    cash_flows = np.outer(np.arange(1, rows + 1), np.ones(n))
+    probabilities = np.array([life_table.pxs[x:][:n] for x in range(rows)])
+    interest_rates = np.linspace(0.03, 0.07, n)
+    return cash_flows, probabilities, interest_rates
+
+
+def test_expected_present_value_blocks(policy_block):
+    cash_flows, probabilities, interest_rates = policy_block
+    blocks = (
+        (cash_flows[start:][:5], probabilities[start:][:5], interest_rates)
+        for start in range(0, cash_flows.shape[0], 5)
+    )
+
+    epvs = np.concatenate(list(expected_present_value_blocks(blocks)))
+
+    expected = expected_present_value(cash_flows, probabilities, interest_rates)
+    assert np.allclose(epvs, expected)
+
+
+def test_chunked_expected_present_value(policy_block):
+    epvs = chunked_expected_present_value(*policy_block, chunk_size=4)
+    assert np.allclose(epvs, expected_present_value(*policy_block))
+
+
+def test_chunked_expected_present_value__memmap(policy_block, tmp_path):
+    cash_flows, probabilities, interest_rates = policy_block
+    inputs = np.memmap(
+        tmp_path / "inputs.dat", dtype=float, mode="w+", shape=(2,) + cash_flows.shape
+    )
+    inputs[0], inputs[1] = cash_flows, probabilities
+    inputs.flush()
+    inputs = np.memmap(
+        tmp_path / "inputs.dat", dtype=float, mode="r", shape=(2,) + cash_flows.shape
+    )
+    out = np.memmap(
+        tmp_path / "out.dat", dtype=float, mode="w+", shape=cash_flows.shape[:1]
+    )
+
+    epvs = chunked_expected_present_value(
+        inputs[0], inputs[1], interest_rates, chunk_size=7, out=out
+    )
+
+    assert epvs is out
+    assert np.allclose(out, expected_present_value(*policy_block))
+
+
+def test_chunked_expected_present_value__raises_InvalidEPVInputs(policy_block):
+    cash_flows, probabilities, interest_rates = policy_block
+    with pytest.raises(InvalidEPVInputs):
+        chunked_expected_present_value(cash_flows[0], probabilities[0], 0.07)
+    with pytest.raises(InvalidEPVInputs):
+        chunked_expected_present_value(cash_flows, probabilities[:3], interest_rates)
+    with pytest.raises(InvalidEPVInputs):
+        chunked_expected_present_value(*policy_block, chunk_size=0)
@@ -0,0 +1,154 @@
+# pylint: disable=redefined-outer-name
+import numpy as np
+import pytest
+
+from elizur.life import (
+    ENDOWMENT,
+    TERM,
+    WHOLE_LIFE,
+    InvalidProduct,
+    gross_premium,
+    net_premium,
+)
+from elizur.life.annuity import YieldCurve
+from elizur.life.table import EXAMPLE_TABLE, LifeTable
+from elizur.life.util import InvalidAge, InvalidInterval
+
+
+@pytest.fixture(scope="module")
+def life_table():
+    return LifeTable(EXAMPLE_TABLE)
+
+
+def benefits(life_table, x, i, n, product):
+    if product == WHOLE_LIFE:
+        return life_table.Ax(x, i)
+    value = life_table.Axn(x, i, n)
+    if product == ENDOWMENT:
+        value += life_table.Dx(x + n, i) / life_table.Dx(x, i)
+    return value
+
+
+def annuity(life_table, x, i, n):
+    return life_table.ax_due(x, i) if n is None else life_table.axn_due(x, i, n)
+
+
+@pytest.mark.parametrize(
+    "product, n", [(WHOLE_LIFE, None), (TERM, 20), (ENDOWMENT, 20)]
+)
+@pytest.mark.parametrize("premium_years", [None, 10])
+def test_net_premium__equivalence_principle(life_table, product, n, premium_years):
+    premium = net_premium(
+        life_table, 40, 0.05, n, product, 1000, premium_years=premium_years
+    )
+    years = n if premium_years is None else premium_years
+    assert premium * annuity(life_table, 40, 0.05, years) == pytest.approx(
+        1000 * benefits(life_table, 40, 0.05, n, product)
+    )
+
+
+def test_net_premium__limited_pay_longer_than_coverage(life_table):
+    assert net_premium(life_table, 40, 0.05, 10, TERM, premium_years=30) == (
+        net_premium(life_table, 40, 0.05, 10, TERM)
+    )
+
+
+@pytest.mark.parametrize(
+    "product, n", [(WHOLE_LIFE, None), (TERM, 15), (ENDOWMENT, 25)]
+)
+def test_gross_premium__equivalence_principle(life_table, product, n):
+    expenses = dict(
+        initial_expense=150.0,
+        maintenance_expense=12.0,
+        initial_commission=0.6,
+        renewal_commission=0.05,
+    )
+    premium = gross_premium(
+        life_table, 45, 0.04, n, product, 10000, premium_years=10, **expenses
+    )
+    premiums = annuity(life_table, 45, 0.04, 10)
+    coverage = annuity(life_table, 45, 0.04, n)
+    outgo = (
+        10000 * benefits(life_table, 45, 0.04, n, product)
+        + 150
+        + 12 * coverage
+        + 0.6 * premium
+        + 0.05 * premium * (premiums - 1)
+    )
+    assert premium * premiums == pytest.approx(outgo)
+
+
+@pytest.mark.parametrize("x", [40, np.array([30, 40, 50])])
+def test_net_premium__yield_curve(life_table, x):
+    curve = YieldCurve((0.01, 0.02, 0.03, 0.035, 0.04))
+    np.testing.assert_allclose(
+        net_premium(life_table, x, curve, 10, TERM),
+        life_table.Axn(x, curve, 10) / life_table.axn_due(x, curve, 10),
+    )
+    np.testing.assert_allclose(
+        net_premium(life_table, x, curve, 10, ENDOWMENT),
+        (
+            life_table.Axn(x, curve, 10)
+            + life_table.npx(10, x) * curve.discount_factor(10)
+        )
+        / life_table.axn_due(x, curve, 10),
+    )
+    assert net_premium(life_table, 40, YieldCurve((0.04,) * 3), 10, TERM) == (
+        pytest.approx(net_premium(life_table, 40, 0.04, 10, TERM))
+    )
+
+
+def test_gross_premium__without_expenses_is_the_net_premium(life_table):
+    assert gross_premium(life_table, 30, 0.05, 20, ENDOWMENT, 500) == pytest.approx(
+        net_premium(life_table, 30, 0.05, 20, ENDOWMENT, 500)
+    )
+
+
+def test_premiums__arrays_of_policies(life_table):
+    ages = np.array([25, 35, 45, 55])
+    rates = np.array([0.03, 0.04, 0.05, 0.04])
+    terms = np.array([10, 20, 30, 5])
+    amounts = np.array([1000.0, 5000.0, 250.0, 100000.0])
+    loadings = np.array([0.0, 0.1, 0.2, 0.3])
+    premiums = gross_premium(
+        life_table,
+        ages,
+        rates,
+        terms,
+        TERM,
+        amounts,
+        initial_commission=loadings,
+        renewal_commission=loadings,
+    )
+    assert premiums.shape == (4,)
+    for premium, x, i, n, amount, loading in zip(
+        premiums, ages, rates, terms, amounts, loadings
+    ):
+        assert premium == pytest.approx(
+            gross_premium(
+                life_table,
+                x,
+                i,
+                n,
+                TERM,
+                amount,
+                initial_commission=loading,
+                renewal_commission=loading,
+            )
+        )
+        assert premium * (1 - loading) == pytest.approx(
+            net_premium(life_table, x, i, n, TERM, amount)
+        )
+
+
+def test_premiums__invalid_inputs(life_table):
+    with pytest.raises(InvalidProduct):
+        net_premium(life_table, 40, 0.05, 10, "annuity")
+    with pytest.raises(InvalidProduct):
+        net_premium(life_table, 40, 0.05, product=ENDOWMENT)
+    with pytest.raises(InvalidInterval):
+        net_premium(life_table, 40, 0.05, premium_years=0)
+    with pytest.raises(InvalidProduct):
+        gross_premium(life_table, 40, 0.05, initial_commission=1.0)
+    with pytest.raises(InvalidAge):
+        gross_premium(life_table, -1, 0.05)
@@ -0,0 +1,132 @@
+# pylint: disable=redefined-outer-name
+import numpy as np
+import pytest
+
+from elizur.life import (
+    ENDOWMENT,
+    TERM,
+    WHOLE_LIFE,
+    InvalidProduct,
+    net_premium_reserve,
+    net_premium_reserves,
+)
+from elizur.life.annuity import YieldCurve
+from elizur.life.table import EXAMPLE_TABLE, LifeTable
+from elizur.life.util import InvalidAge, InvalidInterval
+
+
+@pytest.fixture(scope="module")
+def life_table():
+    return LifeTable(EXAMPLE_TABLE)
+
+
+def net_premium(life_table, x, i, n, product):
+    if product == WHOLE_LIFE:
+        return life_table.Ax(x, i) / life_table.ax_due(x, i)
+    benefits = life_table.Axn(x, i, n)
+    if product == ENDOWMENT:
+        benefits += life_table.Dx(x + n, i) / life_table.Dx(x, i)
+    return benefits / life_table.axn_due(x, i, n)
+
+
+@pytest.mark.parametrize(
+    "product, n", [(WHOLE_LIFE, None), (TERM, 20), (ENDOWMENT, 20)]
+)
+@pytest.mark.parametrize("x, i", [(0, 0.03), (40, 0.05), (70, 0.07)])
+def test_net_premium_reserves__fackler_recursion(life_table, product, n, x, i):
+    reserves = net_premium_reserves(life_table, x, i, n, product)
+    premium = net_premium(life_table, x, i, n, product)
+    durations = life_table.w - x if n is None else n
+    assert reserves[0] == pytest.approx(0, abs=1e-12)
+    for t in range(durations):
+        assert (reserves[t] + premium) * (1 + i) == pytest.approx(
+            life_table.qxs[x + t] + life_table.pxs[x + t] * reserves[t + 1]
+        )
+    assert reserves[-1] == (1.0 if product == ENDOWMENT else 0.0)
+
+
+def test_net_premium_reserves__limited_pay(life_table):
+    reserves = net_premium_reserves(life_table, 40, 0.05, premium_years=20)
+    premium = life_table.Ax(40, 0.05) / life_table.axn_due(40, 0.05, 20)
+    for t in range(life_table.w - 40):
+        paid = premium if t < 20 else 0.0
+        assert (reserves[t] + paid) * 1.05 == pytest.approx(
+            life_table.qxs[40 + t] + life_table.pxs[40 + t] * reserves[t + 1]
+        )
+    np.testing.assert_allclose(reserves[20:60], life_table.Ax(np.arange(60, 100), 0.05))
+
+
+@pytest.mark.parametrize("product", [TERM, ENDOWMENT])
+def test_net_premium_reserves__yield_curve(life_table, product):
+    curve = YieldCurve((0.01, 0.02, 0.03, 0.035, 0.04))
+    reserves = net_premium_reserves(life_table, 40, curve, 20, product)
+    benefits = life_table.Axn(40, curve, 20)
+    if product == ENDOWMENT:
+        benefits += life_table.npx(20, 40) * curve.discount_factor(20)
+    premium = benefits / life_table.axn_due(40, curve, 20)
+    forwards = curve.discount_factor(np.arange(20)) / curve.discount_factor(
+        np.arange(1, 21)
+    )
+    assert reserves[0] == pytest.approx(0, abs=1e-12)
+    for t in range(20):
+        assert (reserves[t] + premium) * forwards[t] == pytest.approx(
+            life_table.qxs[40 + t] + life_table.pxs[40 + t] * reserves[t + 1]
+        )
+    assert reserves[-1] == (1.0 if product == ENDOWMENT else 0.0)
+    assert net_premium_reserve(life_table, 40, 5, curve, 20, product) == (
+        pytest.approx(reserves[5])
+    )
+
+
+def test_net_premium_reserve__prospective_apvs(life_table):
+    premium = net_premium(life_table, 40, 0.05, None, WHOLE_LIFE)
+    assert net_premium_reserve(life_table, 40, 10, 0.05) == pytest.approx(
+        life_table.Ax(50, 0.05) - premium * life_table.ax_due(50, 0.05)
+    )
+    premium = net_premium(life_table, 40, 0.05, 20, TERM)
+    assert net_premium_reserve(life_table, 40, 5, 0.05, 20, TERM) == pytest.approx(
+        life_table.Axn(45, 0.05, 15) - premium * life_table.axn_due(45, 0.05, 15)
+    )
+
+
+def test_net_premium_reserves__arrays_of_policies(life_table):
+    ages = np.array([30, 40, 50])
+    rates = np.array([0.04, 0.05, 0.06])
+    terms = np.array([10, 20, 30])
+    amounts = np.array([1000.0, 2000.0, 500.0])
+    reserves = net_premium_reserves(life_table, ages, rates, terms, TERM, amounts)
+    assert reserves.shape == (3, 31)
+    for row, (x, i, n, amount) in enumerate(zip(ages, rates, terms, amounts)):
+        expected = net_premium_reserves(life_table, x, i, n, TERM) * amount
+        end = n + 1
+        np.testing.assert_allclose(reserves[row, :end], expected)
+        np.testing.assert_array_equal(reserves[row, end:], 0.0)
+    durations = np.array([[0, 5], [10, 20], [25, 30]])
+    np.testing.assert_allclose(
+        net_premium_reserve(
+            life_table, ages[:, None], durations, rates[:, None], terms[:, None], TERM
+        ),
+        np.take_along_axis(reserves, durations, axis=1) / amounts[:, None],
+    )
+
+
+def test_net_premium_reserves__whole_life_ends_at_the_table(life_table):
+    reserves = net_premium_reserves(life_table, [20, 60], 0.05)
+    assert reserves.shape == (2, life_table.table_size - 20 + 1)
+    assert np.all(np.isfinite(reserves))
+    end = life_table.w - 60 + 1
+    np.testing.assert_array_equal(reserves[1, end:], 0.0)
+    assert net_premium_reserves(life_table, 20, 0.05, durations=5).shape == (6,)
+
+
+def test_net_premium_reserve__invalid_inputs(life_table):
+    with pytest.raises(InvalidProduct):
+        net_premium_reserve(life_table, 40, 1, 0.05, 10, "annuity")
+    with pytest.raises(InvalidProduct):
+        net_premium_reserve(life_table, 40, 1, 0.05, product=TERM)
+    with pytest.raises(InvalidInterval):
+        net_premium_reserve(life_table, 40, 1, 0.05, 0, ENDOWMENT)
+    with pytest.raises(InvalidInterval):
+        net_premium_reserve(life_table, 40, -1, 0.05)
+    with pytest.raises(InvalidAge):
+        net_premium_reserves(life_table, -1, 0.05)
@@ -0,0 +1,140 @@
+import numpy as np
+import pytest
+
+from elizur.life import (
+    InvalidScenarioInputs,
+    cir,
+    effective_rates,
+    expected_present_value,
+    hull_white,
+    lognormal,
+    vasicek,
+)
+from elizur.life.annuity import annuity_pv
+
+
+SCENARIOS = 20000
+PERIODS = 25
+DT = 0.5
+
+
+def ornstein_uhlenbeck_moments(r0, a, b, sigma, t):
+    mean = b + (r0 - b) * np.exp(-a * t)
+    variance = sigma**2 * (1 - np.exp(-2 * a * t)) / (2 * a)
+    return mean, variance
+
+
+@pytest.mark.parametrize("generator", [vasicek, cir])
+def test_mean_reverting_generators__moments(generator):
+    rates = generator(0.03, 0.3, 0.05, 0.02, SCENARIOS, PERIODS, dt=DT, seed=7)
+    t = np.arange(PERIODS) * DT
+    mean, _ = ornstein_uhlenbeck_moments(0.03, 0.3, 0.05, 0.02, t)
+    assert rates.shape == (SCENARIOS, PERIODS)
+    np.testing.assert_allclose(rates[:, 0], 0.03)
+    np.testing.assert_allclose(rates.mean(axis=0), mean, atol=5e-4)
+
+
+def test_vasicek__variance():
+    rates = vasicek(0.03, 0.3, 0.05, 0.02, SCENARIOS, PERIODS, dt=DT, seed=7)
+    _, variance = ornstein_uhlenbeck_moments(
+        0.03, 0.3, 0.05, 0.02, np.arange(PERIODS) * DT
+    )
+    np.testing.assert_allclose(rates.var(axis=0)[1:], variance[1:], rtol=0.05)
+
+
+def test_cir__variance_and_non_negative_rates():
+    a, b, sigma, r0 = 0.3, 0.05, 0.2, 0.03
+    rates = cir(r0, a, b, sigma, SCENARIOS, PERIODS, dt=DT, seed=7)
+    t = np.arange(PERIODS) * DT
+    decay = np.exp(-a * t)
+    variance = (
+        r0 * sigma**2 / a * (decay - decay**2)
+        + b * sigma**2 / (2 * a) * (1 - decay) ** 2
+    )
+    assert np.all(rates >= 0)
+    np.testing.assert_allclose(rates.var(axis=0)[1:], variance[1:], rtol=0.05)
+
+
+def test_cir__zero_long_term_mean():
+    rates = cir(0.03, 0.3, 0.0, 0.2, 100, PERIODS, dt=DT, seed=7)
+    assert np.all(rates >= 0) and np.all(np.isfinite(rates))
+
+
+def test_hull_white__fits_the_initial_curve():
+    forwards = np.linspace(0.01, 0.04, PERIODS)
+    a, sigma = 0.2, 0.01
+    rates = hull_white(forwards, a, sigma, SCENARIOS, PERIODS, dt=DT, seed=7)
+    t = np.arange(PERIODS) * DT
+    alpha = forwards + sigma**2 / (2 * a**2) * (1 - np.exp(-a * t)) ** 2
+    _, variance = ornstein_uhlenbeck_moments(0, a, 0, sigma, t)
+    np.testing.assert_allclose(rates[:, 0], 0.01)
+    np.testing.assert_allclose(rates.mean(axis=0), alpha, atol=3e-4)
+    np.testing.assert_allclose(rates.var(axis=0)[1:], variance[1:], rtol=0.05)
+
+
+def test_lognormal__moments():
+    rates = lognormal(0.03, 0.02, 0.2, SCENARIOS, PERIODS, dt=DT, seed=7)
+    t = np.arange(PERIODS) * DT
+    assert np.all(rates > 0)
+    np.testing.assert_allclose(rates.mean(axis=0), 0.03 * np.exp(0.02 * t), rtol=0.02)
+    np.testing.assert_allclose(np.log(rates).var(axis=0)[1:], 0.04 * t[1:], rtol=0.05)
+
+
+@pytest.mark.parametrize(
+    "generator, args",
+    [
+        (vasicek, (0.03, 0.3, 0.05, 0.02)),
+        (cir, (0.03, 0.3, 0.05, 0.02)),
+        (hull_white, (0.03, 0.3, 0.02)),
+        (lognormal, (0.03, 0.0, 0.2)),
+    ],
+)
+def test_generators__reproducible_streams(generator, args):
+    first = generator(*args, 50, 12, seed=11)
+    assert first.shape == (50, 12)
+    assert first.flags.c_contiguous
+    np.testing.assert_array_equal(first, generator(*args, 50, 12, seed=11))
+    np.testing.assert_array_equal(
+        first, generator(*args, 50, 12, seed=np.random.SeedSequence(11))
+    )
+    assert not np.array_equal(first, generator(*args, 50, 12, seed=12))
+
+
+def test_effective_rates__deterministic_scenarios_match_annuity():
+    rates = vasicek(0.05, 0.1, 0.05, 0.0, 3, 10, dt=1.0, seed=0)
+    assert effective_rates(rates, dt=1.0, out=rates) is rates
+    np.testing.assert_allclose(rates, np.expm1(0.05))
+    epvs = expected_present_value(np.ones(10), np.ones(10), rates)
+    np.testing.assert_allclose(epvs, annuity_pv(10, np.expm1(0.05)))
+
+
+def test_effective_rates__discount_at_the_short_rate():
+    rates = cir(0.03, 0.3, 0.05, 0.1, 100, 24, seed=3)
+    cash_flows = np.zeros(24)
+    cash_flows[-1] = 1
+    epvs = expected_present_value(cash_flows, 1, effective_rates(rates))
+    np.testing.assert_allclose(epvs, np.exp(-rates.sum(axis=1) / 12))
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"scenarios": 0},
+        {"periods": 0},
+        {"dt": 0},
+        {"sigma": -0.01},
+        {"a": 0},
+    ],
+)
+def test_vasicek__invalid_inputs(kwargs):
+    inputs = dict(r0=0.03, a=0.3, b=0.05, sigma=0.02, scenarios=10, periods=10)
+    inputs.update(kwargs)
+    with pytest.raises(InvalidScenarioInputs):
+        vasicek(**inputs)
+
+
+def test_positive_rate_generators__invalid_inputs():
+    with pytest.raises(InvalidScenarioInputs):
+        cir(-0.01, 0.3, 0.05, 0.02, 10, 10)
+    with pytest.raises(InvalidScenarioInputs):
+        lognormal(0.0, 0.0, 0.2, 10, 10)
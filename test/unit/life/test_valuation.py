@@ -0,0 +1,122 @@
+# pylint: disable=redefined-outer-name
+import numpy as np
+import pytest
+
+from elizur.life import BENEFITS, InvalidPortfolio, value_portfolio
+from elizur.life.table import LifeTable, EXAMPLE_TABLE
+from elizur.life.valuation import (
+    _WORKER_STATE,
+    _initialize_worker,
+    _share,
+    _table_columns,
+)
+
+
+@pytest.fixture
+def tables():
+    return [
+        LifeTable(EXAMPLE_TABLE),
+        LifeTable(np.minimum(np.array(EXAMPLE_TABLE) * 1.2, 1), initial_pop=1000),
+    ]
+
+
+@pytest.fixture
+def portfolio():
+    rng = np.random.default_rng(7)
+    size = 1000
+    return {
+        "ages": rng.integers(0, 90, size),
+        "terms": rng.integers(1, 30, size),
+        "rates": rng.choice([0.03, 0.05, 0.07], size),
+        "benefits": rng.choice(BENEFITS, size),
+        "table_ids": rng.integers(0, 2, size),
+        "amounts": rng.uniform(1000, 100000, size),
+    }
+
+
+def expected_values(tables, portfolio):
+    values = []
+    for age, term, rate, benefit, table_id, amount in zip(*portfolio.values()):
+        method = getattr(tables[table_id], str(benefit))
+        if benefit in ("Axn", "IAxn", "axn", "axn_due"):
+            values.append(amount * method(int(age), rate, int(term)))
+        else:
+            values.append(amount * method(int(age), rate))
+    return np.array(values)
+
+
+def test_value_portfolio__single_process(tables, portfolio):
+    result = value_portfolio(tables, **portfolio, processes=1)
+    expected = expected_values(tables, portfolio)
+    assert np.allclose(result.seriatim, expected)
+    assert np.isclose(result.total, expected.sum())
+
+
+def test_value_portfolio__process_pool(tables, portfolio):
+    result = value_portfolio(tables, **portfolio, processes=2, chunk_size=300)
+    expected = value_portfolio(tables, **portfolio, processes=1)
+    assert np.array_equal(result.seriatim, expected.seriatim)
+    assert result.total == expected.total
+
+
+def test_value_portfolio__workers_share_the_table_columns(tables):
+    policies = np.zeros((6, 1))
+    columns, layouts = _table_columns(tables)
+    memories = [_share(policies), _share(columns)]
+    try:
+        _initialize_worker(
+            memories[0].name,
+            policies.shape,
+            memories[1].name,
+            columns.shape,
+            layouts,
+            [("first", ""), ("second", "")],
+        )
+        for table, shared in zip(tables, _WORKER_STATE["tables"]):
+            assert shared == table
+            assert np.array_equal(shared.txs, table.txs)
+            assert not shared.lxs.flags.owndata
+            assert shared.Ax(40, 0.05) == table.Ax(40, 0.05)
+        assert _WORKER_STATE["tables"][1].name == "second"
+    finally:
+        for memory in (*_WORKER_STATE.pop("memory"), *memories):
+            memory.close()
+        for memory in memories:
+            memory.unlink()
+        _WORKER_STATE.clear()
+
+
+def test_value_portfolio__single_table_and_benefit_codes(tables):
+    result = value_portfolio(
+        tables[0],
+        ages=[30, 40, 50],
+        terms=[20, 20, 0],
+        rates=0.05,
+        benefits=[BENEFITS.index("Axn"), BENEFITS.index("axn_due"), 0],
+        amounts=[100000, 1200, 50000],
+    )
+    expected = [
+        100000 * tables[0].Axn(30, 0.05, 20),
+        1200 * tables[0].axn_due(40, 0.05, 20),
+        50000 * tables[0].Ax(50, 0.05),
+    ]
+    assert np.allclose(result.seriatim, expected)
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"benefits": "Bx"},
+        {"benefits": 42},
+        {"ages": -1},
+        {"table_ids": 2},
+        {"benefits": "Axn", "terms": 0},
+        {"ages": 30.5},
+        {"benefits": "Axn", "terms": 10.5},
+        {"processes": 0},
+    ],
+)
+def test_value_portfolio__raises_InvalidPortfolio(tables, overrides):
+    policy = {"ages": 30, "terms": 10, "rates": 0.05, "benefits": "Ax"}
+    with pytest.raises(InvalidPortfolio):
+        value_portfolio(tables, **{**policy, **overrides})
@@ -1,12 +1,23 @@
 # pylint: disable=redefined-outer-name,missing-docstring
 
+import os
 from os.path import join
+from unittest import mock
 
+import numpy as np
 import pytest
 
 from elizur.life.table import LifeTable
-from elizur.life.util import read_soa_csv_mort_table
-from elizur.life.util.soa import _open_soa_csv_mort_table, _process_soa_csv_mort_table
+from elizur.life.util import (
+    InvalidSoaTable,
+    read_soa_csv_mort_table,
+    read_soa_csv_mort_tables,
+)
+from elizur.life.util.soa import (
+    _open_soa_csv_mort_table,
+    _parse_soa_csv_mort_tables,
+    _process_soa_csv_mort_table,
+)
 
 
 EXPECTED_QXS = (
@@ -127,7 +138,7 @@ def test__process_soa_csv_mort_table(soa_csv_path):
     csv_table = _open_soa_csv_mort_table(file_path=soa_csv_path)
     csv_table = _process_soa_csv_mort_table(csv_table)
     assert csv_table["metadata"]["name"] == "1941 CSO Basic Table, ANB"
-    assert csv_table["values"] == EXPECTED_QXS
+    assert np.array_equal(csv_table["values"], EXPECTED_QXS)
 
 
 def test__process_soa_csv_mort_table__can_pass_values_to_life_table(soa_csv_path):
@@ -141,3 +152,219 @@ def test_read_soa_csv_mort_table(soa_csv_path):
     csv_table = read_soa_csv_mort_table(soa_csv_path)
     life_table = LifeTable(csv_table["values"])
     assert life_table.get_qxs() == EXPECTED_QXS
+
+
+def test__process_soa_csv_mort_table__metadata(soa_csv_path):
+    csv_table = _process_soa_csv_mort_table(_open_soa_csv_mort_table(soa_csv_path))
+    metadata = csv_table["metadata"]
+    assert metadata["soa_table_identity"] == "1"
+    assert metadata["min_age"] == 1
+    assert metadata["max_age"] == 100
+    assert metadata["study_nation"] == "United States of America"
+
+
+def test_read_soa_csv_mort_table__values_are_an_array(soa_csv_path):
+    csv_table = read_soa_csv_mort_table(soa_csv_path)
+    assert isinstance(csv_table["values"], np.ndarray)
+    assert np.array_equal(csv_table["values"], EXPECTED_QXS)
+
+
+@pytest.fixture
+def cached_soa_csv_path(soa_csv_path, tmp_path):
+    path = tmp_path / "mortality_table_1.csv"
+    with open(soa_csv_path, "rb") as source:
+        path.write_bytes(source.read())
+    return path
+
+
+def test_read_soa_csv_mort_table__writes_cache(cached_soa_csv_path):
+    csv_table = read_soa_csv_mort_table(cached_soa_csv_path, cache=True)
+    assert os.path.exists(f"{cached_soa_csv_path}.npz")
+    cached_table = read_soa_csv_mort_table(cached_soa_csv_path, cache=True)
+    assert cached_table["metadata"] == csv_table["metadata"]
+    assert np.array_equal(cached_table["values"], EXPECTED_QXS)
+
+
+def test_read_soa_csv_mort_table__uses_cache(cached_soa_csv_path):
+    read_soa_csv_mort_table(cached_soa_csv_path, cache=True)
+    with mock.patch(
+        "elizur.life.util.soa._parse_soa_csv_mort_table"
+    ) as parse_soa_csv_mort_table:
+        read_soa_csv_mort_table(cached_soa_csv_path, cache=True)
+        read_soa_csv_mort_table(cached_soa_csv_path)
+    assert parse_soa_csv_mort_table.call_count == 1
+
+
+def test_read_soa_csv_mort_table__cache_survives_touch(cached_soa_csv_path):
+    read_soa_csv_mort_table(cached_soa_csv_path, cache=True)
+    stat = os.stat(cached_soa_csv_path)
+    os.utime(cached_soa_csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    with mock.patch(
+        "elizur.life.util.soa._parse_soa_csv_mort_table"
+    ) as parse_soa_csv_mort_table:
+        read_soa_csv_mort_table(cached_soa_csv_path, cache=True)
+    parse_soa_csv_mort_table.assert_not_called()
+
+
+def test_read_soa_csv_mort_table__touch_rewrites_cache_stamp(cached_soa_csv_path):
+    read_soa_csv_mort_table(cached_soa_csv_path, cache=True)
+    stat = os.stat(cached_soa_csv_path)
+    os.utime(cached_soa_csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    read_soa_csv_mort_table(cached_soa_csv_path, cache=True)
+    with mock.patch("elizur.life.util.soa._file_sha256") as file_sha256:
+        cached_table = read_soa_csv_mort_table(cached_soa_csv_path, cache=True)
+    file_sha256.assert_not_called()
+    assert np.array_equal(cached_table["values"], EXPECTED_QXS)
+
+
+def test_read_soa_csv_mort_table__unwritable_cache(cached_soa_csv_path):
+    with mock.patch(
+        "elizur.life.util.soa.tempfile.mkstemp", side_effect=PermissionError
+    ):
+        csv_table = read_soa_csv_mort_table(cached_soa_csv_path, cache=True)
+    assert np.array_equal(csv_table["values"], EXPECTED_QXS)
+    assert os.listdir(cached_soa_csv_path.parent) == [cached_soa_csv_path.name]
+
+
+def test_read_soa_csv_mort_table__truncated_cache(cached_soa_csv_path):
+    read_soa_csv_mort_table(cached_soa_csv_path, cache=True)
+    cache_path = cached_soa_csv_path.parent / f"{cached_soa_csv_path.name}.npz"
+    cache_path.write_bytes(cache_path.read_bytes()[:100])
+    csv_table = read_soa_csv_mort_table(cached_soa_csv_path, cache=True)
+    assert np.array_equal(csv_table["values"], EXPECTED_QXS)
+    with mock.patch(
+        "elizur.life.util.soa._parse_soa_csv_mort_tables"
+    ) as parse_soa_csv_mort_tables:
+        read_soa_csv_mort_table(cached_soa_csv_path, cache=True)
+    parse_soa_csv_mort_tables.assert_not_called()
+
+
+def test_read_soa_csv_mort_table__cache_keyed_by_dialect(cached_soa_csv_path):
+    read_soa_csv_mort_table(cached_soa_csv_path, cache=True)
+    tables = read_soa_csv_mort_tables(cached_soa_csv_path, delimiter=";", cache=True)
+    assert tables == []
+    with mock.patch(
+        "elizur.life.util.soa._parse_soa_csv_mort_tables",
+        wraps=_parse_soa_csv_mort_tables,
+    ) as parse_soa_csv_mort_tables:
+        read_soa_csv_mort_table(cached_soa_csv_path, encoding="latin-1", cache=True)
+        read_soa_csv_mort_table(cached_soa_csv_path, encoding="latin-1", cache=True)
+    assert parse_soa_csv_mort_tables.call_count == 1
+
+
+def test_read_soa_csv_mort_table__cache_invalidated_by_changes(cached_soa_csv_path):
+    read_soa_csv_mort_table(cached_soa_csv_path, cache=True)
+    contents = cached_soa_csv_path.read_bytes()
+    cached_soa_csv_path.write_bytes(contents.replace(b"100,1.00000", b"100,0.90000"))
+    csv_table = read_soa_csv_mort_table(cached_soa_csv_path, cache=True)
+    assert csv_table["values"][-1] == 0.9
+    assert read_soa_csv_mort_table(cached_soa_csv_path, cache=True)["values"][-1] == 0.9
+
+
+@pytest.fixture
+def select_csv_path():
+    return join("test", "unit", "life", "util", "select_mortality_table.csv")
+
+
+def test_read_soa_csv_mort_table__select_values_are_a_matrix(select_csv_path):
+    csv_table = read_soa_csv_mort_table(select_csv_path)
+    values = csv_table["values"]
+    assert values.shape == (5, 3)
+    assert values[0].tolist() == [0.001, 0.0015, 0.002]
+    assert values[4, 1] == 0.0019
+    assert np.isnan(values[4, 2])
+    assert csv_table["metadata"]["columns"] == ["1", "2", "3"]
+    assert csv_table["metadata"]["min_duration"] == 1
+    assert csv_table["metadata"]["max_duration"] == 3
+
+
+def test_read_soa_csv_mort_tables__select_and_ultimate(select_csv_path):
+    select, ultimate = read_soa_csv_mort_tables(select_csv_path)
+    assert select["metadata"]["table_number"] == "1"
+    assert ultimate["metadata"]["table_number"] == "2"
+    assert ultimate["metadata"]["soa_table_identity"] == "900"
+    assert "max_duration" not in ultimate["metadata"]
+    assert ultimate["values"].shape == (10,)
+    assert ultimate["values"][-1] == 1.0
+
+
+def test_read_soa_csv_mort_tables__file_and_table_metadata(select_csv_path):
+    select, ultimate = read_soa_csv_mort_tables(select_csv_path)
+    description = "Example select and ultimate table with a three year select period"
+    assert select["metadata"]["description"] == description
+    assert ultimate["metadata"]["description"] == description
+    assert select["metadata"]["table_description"] == "Select rates"
+    assert ultimate["metadata"]["table_description"] == "Ultimate rates"
+    assert ultimate["metadata"]["columns"] == ["1"]
+    assert ultimate["metadata"]["table_line_start"] == 43
+
+
+def test_read_soa_csv_mort_tables__table_metadata_does_not_carry_over(tmp_path):
+    path = tmp_path / "tables.csv"
+    path.write_text(
+        "Table Name:,Two tables\n"
+        "Table # ,1\n"
+        "Comments:,First table only\n"
+        '"Row, Column (if applicable)->MinScaleValue:",0\n'
+        '"Row, Column (if applicable)->MaxScaleValue:",1\n'
+        "Row\\Column,1\n0,0.1\n1,1.0\n"
+        "Table # ,2\n"
+        '"Row, Column (if applicable)->MinScaleValue:",5\n'
+        '"Row, Column (if applicable)->MaxScaleValue:",5\n'
+        "Row\\Column,1\n5,1.0\n"
+    )
+    first, second = read_soa_csv_mort_tables(path)
+    assert first["metadata"]["comments"] == "First table only"
+    assert "comments" not in second["metadata"]
+    assert second["metadata"]["name"] == "Two tables"
+    assert second["metadata"]["min_age"] == 5
+    assert second["values"].tolist() == [1.0]
+
+
+def test_read_soa_csv_mort_table__truncated_values(tmp_path):
+    path = tmp_path / "truncated.csv"
+    path.write_text(
+        '"Row, Column (if applicable)->MinScaleValue:",0\n'
+        '"Row, Column (if applicable)->MaxScaleValue:",4\n'
+        "Row\\Column,1\n0,0.1\n1,0.2\n"
+    )
+    with pytest.raises(InvalidSoaTable):
+        read_soa_csv_mort_table(path)
+
+
+def test_read_soa_csv_mort_table__short_cells_and_blanks(tmp_path):
+    path = tmp_path / "short.csv"
+    path.write_text(
+        '"Row, Column (if applicable)->MinScaleValue:",0\n'
+        '"Row, Column (if applicable)->MaxScaleValue:",1\n'
+        "Row\\Column,1,2\n0,0,1\n1,1,\n"
+    )
+    values = read_soa_csv_mort_table(path)["values"]
+    np.testing.assert_array_equal(values, [[0.0, 1.0], [1.0, np.nan]])
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_read_soa_csv_mort_table__without_a_table(tmp_path, cache):
+    path = tmp_path / "empty.csv"
+    path.write_text("Table Name:,No values\n")
+    csv_table = read_soa_csv_mort_table(path, cache=cache)
+    assert csv_table["metadata"] == {}
+    assert csv_table["values"].size == 0
+
+
+def test_read_soa_csv_mort_tables__cache(select_csv_path, tmp_path):
+    path = tmp_path / "select_mortality_table.csv"
+    with open(select_csv_path, "rb") as source:
+        path.write_bytes(source.read())
+    tables = read_soa_csv_mort_tables(path, cache=True)
+    cached_tables = read_soa_csv_mort_tables(path, cache=True)
+    assert len(cached_tables) == 2
+    for table, cached_table in zip(tables, cached_tables):
+        assert table["metadata"] == cached_table["metadata"]
+        assert np.array_equal(table["values"], cached_table["values"], equal_nan=True)
+
+
+def test_read_soa_csv_mort_table__single_column_values_are_one_dimensional(
+    soa_csv_path,
+):
+    assert read_soa_csv_mort_table(soa_csv_path)["values"].ndim == 1
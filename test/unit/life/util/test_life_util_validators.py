@@ -0,0 +1,103 @@
+# pylint: disable=missing-docstring
+import inspect
+
+import numpy as np
+import pytest
+
+from elizur.life.util import (
+    InvalidAge,
+    InvalidInterval,
+    set_trusted_inputs,
+    trusted_inputs,
+    validate_age,
+    validate_interval,
+    validate_t_interval,
+)
+
+
+@validate_age
+@validate_interval
+@validate_t_interval
+def tqxn(t, n, x=0):
+    """tqxn docstring"""
+    return t + n + x
+
+
+@validate_age
+def lx(x):
+    return x
+
+
+@validate_interval
+def nx(n):
+    return n
+
+
+def test_validators__preserve_signature_and_docstring():
+    assert list(inspect.signature(tqxn).parameters) == ["t", "n", "x"]
+    assert tqxn.__doc__ == "tqxn docstring"
+
+
+def test_validators__stacked_decorators_are_merged():
+    assert len(tqxn.__validations__) == 3
+    assert tqxn.__validated__.__name__ == "tqxn"
+
+
+def test_validators__positional_and_keyword_arguments():
+    assert tqxn(1, 2, 3) == 6
+    assert tqxn(1, n=2, x=3) == 6
+    assert tqxn(t=1, n=2) == 3
+    with pytest.raises(InvalidAge):
+        tqxn(1, 2, x=-3)
+    with pytest.raises(InvalidInterval):
+        tqxn(t=-1, n=2, x=3)
+
+
+def test_validators__missing_required_arguments():
+    with pytest.raises(TypeError, match="missing 1 required positional argument: 'x'"):
+        lx()
+    with pytest.raises(TypeError, match="required positional argument: 'n'"):
+        tqxn(1)
+    with pytest.raises(InvalidInterval):
+        tqxn(-1)
+
+
+def test_validators__outermost_decorator_is_checked_first():
+    with pytest.raises(InvalidAge):
+        tqxn(-1, -1, -1)
+    with pytest.raises(InvalidInterval):
+        tqxn(-1, -1, 1)
+
+
+def test_validators__arrays():
+    assert np.array_equal(lx(np.array([0, 5, 10])), np.array([0, 5, 10]))
+    with pytest.raises(InvalidAge):
+        lx(np.array([0, -5, 10]))
+    with pytest.raises(InvalidInterval):
+        tqxn([1, 1], [2, 0], [3, 3])
+
+
+def test_validators__ragged_sequences():
+    terms = [np.array([1, 2]), np.array([3])]
+    assert nx(terms) is terms
+    with pytest.raises(InvalidInterval):
+        nx([np.array([1, 2]), np.array([0])])
+    with pytest.raises(InvalidAge):
+        lx([np.array([0, 1]), np.array([-1])])
+
+
+def test_validators__set_trusted_inputs():
+    set_trusted_inputs(True)
+    try:
+        assert lx(-1) == -1
+    finally:
+        set_trusted_inputs(False)
+    with pytest.raises(InvalidAge):
+        lx(-1)
+
+
+def test_validators__trusted_inputs_context_manager():
+    with trusted_inputs():
+        assert tqxn(-1, -1, -1) == -3
+    with pytest.raises(InvalidAge):
+        tqxn(-1, -1, -1)